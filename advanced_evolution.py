@@ -6,10 +6,32 @@ basés sur les principes scientifiques de l'évolution
 
 import random
 import math
+import sys
+import copy
+import itertools
 import numpy as np
-from enum import Enum, auto
-from typing import List, Dict, Tuple, Optional, Set, Any, Callable
-import uuid
+from enum import Enum, IntEnum, auto
+from typing import List, Dict, Tuple, Optional, Set, Any, Callable, Mapping, NamedTuple
+from types import MappingProxyType
+from functools import lru_cache
+
+# Compilation JIT optionnelle des noyaux numériques
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_ENABLED = True
+except ImportError:
+    NUMBA_ENABLED = False
+    prange = range
+    
+    def get_num_threads() -> int:
+        """Nombre de threads disponibles pour les noyaux parallèles (un seul sans numba)."""
+        return 1
+    
+    def njit(*args, **kwargs):
+        """Remplace numba.njit par un décorateur neutre lorsque numba n'est pas installé."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 class EvolutionaryTransition(Enum):
     """Transitions majeures dans l'histoire de l'évolution."""
@@ -24,7 +46,7 @@ class EvolutionaryTransition(Enum):
     NONSOCIAL_TO_EUSOCIAL = auto()  # Des organismes non sociaux aux organismes eusociaux
     PRIMATE_TO_HUMAN = auto()  # Des primates aux humains (langage, culture)
 
-class MulticellularityType(Enum):
+class MulticellularityType(IntEnum):
     """Types de multicellularité selon leur origine évolutive."""
     NONE = 0  # Unicellulaire
     AGGREGATIVE = 1  # Agrégation de cellules (ex: Dictyostelium)
@@ -33,7 +55,7 @@ class MulticellularityType(Enum):
     COLONIAL = 4  # Colonies de cellules (ex: Volvox)
     COMPLEX = 5  # Organismes multicellulaires complexes avec différenciation cellulaire
 
-class CellType(Enum):
+class CellType(IntEnum):
     """Types de cellules dans un organisme multicellulaire."""
     STEM = 0  # Cellules souches
     EPITHELIAL = 1  # Cellules épithéliales (peau, muqueuses)
@@ -46,7 +68,7 @@ class CellType(Enum):
     SENSORY = 8  # Cellules sensorielles
     SECRETORY = 9  # Cellules sécrétoires
 
-class NeuralComplexity(Enum):
+class NeuralComplexity(IntEnum):
     """Niveaux de complexité des systèmes nerveux."""
     NONE = 0  # Pas de système nerveux
     NERVE_NET = 1  # Réseau nerveux diffus (ex: cnidaires)
@@ -58,6 +80,553 @@ class NeuralComplexity(Enum):
     NEOCORTEX = 7  # Néocortex développé (ex: primates)
     PREFRONTAL_CORTEX = 8  # Cortex préfrontal développé (ex: humains)
 
+def _cell_types_mask(cell_types: List[CellType]) -> int:
+    """
+    Convertit une liste de types cellulaires en masque de bits (un bit par CellType).
+    
+    Args:
+        cell_types: Types cellulaires
+        
+    Returns:
+        int: Masque des types présents
+    """
+    mask = 0
+    for cell_type in cell_types:
+        mask |= 1 << cell_type
+    return mask
+
+def _cell_types_from_mask(mask: int) -> List[CellType]:
+    """
+    Convertit un masque de bits en liste de types cellulaires (dans l'ordre de CellType).
+    
+    Args:
+        mask: Masque des types présents
+        
+    Returns:
+        List[CellType]: Types cellulaires
+    """
+    return [cell_type for cell_type in CellType if mask & (1 << cell_type)]
+
+# Types cellulaires acquis lors de la transition vers chaque type de multicellularité
+# (indexé par MulticellularityType, 0 si la transition ne modifie pas les types cellulaires)
+_MC_TYPE_CELL_MASKS = np.array([
+    0,                                                         # NONE
+    0,                                                         # AGGREGATIVE
+    0,                                                         # CLONAL
+    0,                                                         # SYNCYTIAL
+    1 << CellType.STEM,                                        # COLONIAL
+    (1 << CellType.STEM) | (1 << CellType.EPITHELIAL)          # COMPLEX
+], dtype=np.int32)
+
+# Valeurs entières des niveaux, calculées une fois pour les boucles de générations et les noyaux compilés
+_NC_NONE = int(NeuralComplexity.NONE)
+_NC_COMPLEX_BRAIN = int(NeuralComplexity.COMPLEX_BRAIN)
+_NC_NEOCORTEX = int(NeuralComplexity.NEOCORTEX)
+_NC_PREFRONTAL = int(NeuralComplexity.PREFRONTAL_CORTEX)  # Niveau neural maximal
+_MC_NONE = int(MulticellularityType.NONE)
+_MC_COLONIAL = int(MulticellularityType.COLONIAL)
+_MC_COMPLEX = int(MulticellularityType.COMPLEX)
+
+# Progression naturelle de la complexité neurale, indexée par le niveau actuel
+_NEURAL_NEXT = tuple(
+    NeuralComplexity(min(i + 1, _NC_PREFRONTAL))
+    for i in range(len(NeuralComplexity))
+)
+
+def _no_prerequisite(organism_data: Dict[str, Any]) -> bool:
+    """Niveau accessible sans condition particulière."""
+    return True
+
+def _is_multicellular(organism_data: Dict[str, Any]) -> bool:
+    """Vérifie la multicellularité (réseau nerveux)."""
+    return organism_data.get("multicellularity_type", MulticellularityType.NONE) != MulticellularityType.NONE
+
+def _has_nerve_cells(organism_data: Dict[str, Any]) -> bool:
+    """Vérifie la présence de cellules nerveuses spécialisées (système nerveux central)."""
+    cell_types = organism_data.get("cell_types")
+    return cell_types is None or CellType.NERVE in cell_types
+
+def _behavior_threshold(trait: str, threshold: float) -> Callable[[Dict[str, Any]], bool]:
+    """Crée la vérification d'un trait comportemental minimal."""
+    def check(organism_data: Dict[str, Any]) -> bool:
+        behavior = organism_data.get("behavior")
+        return behavior is None or behavior.get(trait, 0.0) >= threshold
+    return check
+
+# Prérequis de chaque niveau neural, indexés par le niveau visé :
+# complexité locomotrice (cerveau complexe), sociale (néocortex) et capacité d'apprentissage (cortex préfrontal)
+_NEURAL_PREREQUISITES = (
+    _no_prerequisite,                                      # NONE
+    _is_multicellular,                                     # NERVE_NET
+    _no_prerequisite,                                      # GANGLIA
+    _no_prerequisite,                                      # LADDER
+    _has_nerve_cells,                                      # CENTRAL_NERVOUS_SYSTEM
+    _no_prerequisite,                                      # BRAIN_SPINAL_CORD
+    _behavior_threshold("locomotion_complexity", 0.5),     # COMPLEX_BRAIN
+    _behavior_threshold("social_complexity", 0.6),         # NEOCORTEX
+    _behavior_threshold("learning_capacity", 0.8)          # PREFRONTAL_CORTEX
+)
+
+# Caractéristiques du potentiel de multicellularité, dans l'ordre du vecteur extrait :
+# 0-2 gènes d'adhésion, de signalisation et de régulation (nombre / 10), 3 taille du génome (plafonnée),
+# 4-7 prédation, stabilité, ressources et structure spatiale de l'environnement,
+# 8-10 densité (plafonnée), taux de reproduction et compétition de la population
+# Chaque poids combine le poids du facteur et celui de son groupe (génome 0.4, environnement 0.4, démographie 0.2)
+_POTENTIAL_WEIGHTS = np.array([
+    0.4 * 0.3, 0.4 * 0.3, 0.4 * 0.2, 0.4 * 0.2,
+    0.4 * 0.3, 0.4 * 0.2, 0.4 * 0.2, 0.4 * 0.3,
+    0.2 * 0.5, 0.2 * 0.3, 0.2 * 0.2
+])
+
+def _extract_potential_features(organism_data: Dict[str, Any], out: np.ndarray) -> np.ndarray:
+    """
+    Extrait les caractéristiques du potentiel de multicellularité dans un vecteur préalloué.
+    
+    Args:
+        organism_data: Données sur l'organisme
+        out: Vecteur de sortie (réutilisé d'un appel à l'autre)
+        
+    Returns:
+        np.ndarray: Le vecteur `out` rempli (0.0 pour les données absentes)
+    """
+    genome = organism_data.get("genome", {})
+    out[0] = len(genome.get("adhesion_genes", ())) / 10.0
+    out[1] = len(genome.get("signaling_genes", ())) / 10.0
+    out[2] = len(genome.get("regulatory_genes", ())) / 10.0
+    out[3] = min(1.0, genome.get("size", 0) / 1000.0)
+    
+    env = organism_data.get("environment", {})
+    out[4] = env.get("predation_pressure", 0.0)
+    out[5] = env.get("stability", 0.0)
+    out[6] = env.get("resource_abundance", 0.0)
+    out[7] = env.get("spatial_structure", 0.0)
+    
+    pop = organism_data.get("population", {})
+    out[8] = min(1.0, pop.get("density", 0.0) / 100.0)
+    out[9] = pop.get("reproduction_rate", 0.0)
+    out[10] = pop.get("competition", 0.0)
+    
+    return out
+
+# Types de multicellularité indexés par leur valeur (0 : NONE, puis une ligne de _MC_TYPE_W par type)
+_MC_TYPES = tuple(MulticellularityType)
+
+# Poids des types de multicellularité (lignes : AGGREGATIVE, CLONAL, SYNCYTIAL, COLONIAL, COMPLEX)
+# sur les caractéristiques remplies par _pack_type_features (colonnes : adhésion, division, fusion,
+# différenciation, instabilité, stabilité, aquatique, prédation, photosynthèse, aérobie)
+_MC_TYPE_W = np.array([
+    [0.3, 0.0, 0.0, 0.0, 0.3, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.0, 0.4, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.2, 0.0],
+    [0.0, 0.0, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [0.2, 0.0, 0.0, 0.0, 0.0, 0.0, 0.3, 0.0, 0.3, 0.0],
+    [0.0, 0.0, 0.0, 0.6, 0.0, 0.3, 0.0, 0.4, 0.0, 0.3]
+])
+
+# Familles de gènes qui évoluent pendant evolve_multicellularity : (clé du génome, préfixe des noms)
+_MC_GENE_FAMILIES = (
+    ("adhesion_genes", "adh"),
+    ("signaling_genes", "sig"),
+    ("regulatory_genes", "reg"),
+    ("differentiation_genes", "diff")
+)
+
+# Pondérations des facteurs environnementaux et comportementaux du potentiel neural
+_NEURAL_ENV_WEIGHTS = (
+    ("complexity", 0.3),
+    ("predation_pressure", 0.3),
+    ("variability", 0.2),
+    ("resource_abundance", 0.2)
+)
+_NEURAL_BEHAVIOR_WEIGHTS = (
+    ("locomotion_complexity", 0.3),
+    ("social_complexity", 0.3),
+    ("feeding_complexity", 0.2),
+    ("learning_capacity", 0.2)
+)
+
+# Valeurs initiales des traits comportementaux qui évoluent pendant evolve_neural_complexity
+_NEURAL_BEHAVIOR_DEFAULTS = (
+    ("locomotion_complexity", 0.1),
+    ("social_complexity", 0.05),
+    ("learning_capacity", 0.0)
+)
+
+# Familles de gènes qui évoluent pendant evolve_neural_complexity
+_NEURAL_GENE_FAMILIES = (
+    ("neural_genes", "neur"),
+    ("development_genes", "dev"),
+    ("neurotransmitter_genes", "nt")
+)
+
+# Noms de gènes partagés par tous les génomes : _GENE_NAME_TABLES[prefix][i] == "prefix_i", formaté
+# et internalisé une seule fois ; chaque table grandit par doublement, comme une arène
+_GENE_NAME_TABLES: Dict[str, List[str]] = {}
+
+def _gene_name_range(prefix: str, start: int, stop: int) -> List[str]:
+    """
+    Noms des gènes prefix_start ... prefix_{stop-1}, lus dans la table partagée du préfixe.
+    
+    Les noms de gènes servent d'identifiants opaques : les génomes ne stockent que des références
+    vers les chaînes de la table, et un ajout de gènes se réduit à une copie de tranche.
+    
+    Args:
+        prefix: Préfixe des noms (famille de gènes)
+        start: Premier rang
+        stop: Rang de fin (exclu)
+        
+    Returns:
+        List[str]: Noms des gènes (nouvelle liste)
+    """
+    table = _GENE_NAME_TABLES.get(prefix)
+    if table is None:
+        table = _GENE_NAME_TABLES[prefix] = []
+    if stop > len(table):
+        table.extend(sys.intern(f"{prefix}_{i}") for i in range(len(table), max(stop, 2 * len(table))))
+    return table[start:stop]
+
+def _append_gene_names(genome: Dict[str, Any], key: str, prefix: str, count: int) -> None:
+    """
+    Complète une liste de gènes jusqu'à count entrées nommées prefix_1, prefix_2, ...
+    
+    Pendant les boucles de générations, seuls des compteurs entiers sont incrémentés ;
+    les noms sont formatés une seule fois ici. La liste d'origine n'est jamais modifiée :
+    une nouvelle liste est placée dans le génome (copie sur écriture).
+    
+    Args:
+        genome: Génome (déjà copié) de l'organisme évolué
+        key: Famille de gènes à compléter
+        prefix: Préfixe des noms de gènes
+        count: Nombre de gènes souhaité
+    """
+    genes = genome.get(key)
+    if genes is None:
+        genes = genome[key] = []
+    start = len(genes)
+    if count > start:
+        genome[key] = genes + _gene_name_range(prefix, start + 1, count + 1)
+
+def _owned_list(evolved_data: Dict[str, Any], key: str, owned: Set[str]) -> List[Any]:
+    """
+    Retourne une liste de evolved_data modifiable sans affecter les données d'origine.
+    
+    La liste est copiée lors de la première écriture, puis réutilisée.
+    
+    Args:
+        evolved_data: Copie superficielle des données de l'organisme
+        key: Clé de la liste
+        owned: Clés déjà copiées (mis à jour)
+        
+    Returns:
+        List[Any]: Liste propre à evolved_data
+    """
+    if key not in owned:
+        evolved_data[key] = list(evolved_data.get(key, ()))
+        owned.add(key)
+    return evolved_data[key]
+
+def _pack_type_features(organism_data: Dict[str, Any], out: np.ndarray) -> np.ndarray:
+    """
+    Remplit le vecteur de caractéristiques utilisé par _MC_TYPE_W.
+    
+    Args:
+        organism_data: Données sur l'organisme
+        out: Tableau de taille 10 à remplir
+        
+    Returns:
+        np.ndarray: Le tableau out rempli
+    """
+    genome = organism_data.get("genome", {})
+    out[0] = len(genome.get("adhesion_genes", ())) / 10.0
+    out[1] = len(genome.get("division_genes", ())) / 10.0
+    out[2] = len(genome.get("fusion_genes", ())) / 5.0
+    out[3] = len(genome.get("differentiation_genes", ())) / 15.0
+    
+    env = organism_data.get("environment", {})
+    stability = env.get("stability")
+    if stability is not None:
+        out[4] = 1.0 - stability
+        out[5] = stability
+    else:
+        out[4] = 0.0
+        out[5] = 0.0
+    out[6] = 1.0 if env.get("aquatic") else 0.0
+    out[7] = env.get("predation_pressure", 0.0)
+    
+    metabolism = organism_data.get("metabolism", {})
+    out[8] = 1.0 if metabolism.get("photosynthetic") else 0.0
+    out[9] = 1.0 if metabolism.get("aerobic") else 0.0
+    
+    return out
+
+# Signature explicite : le noyau est compilé à l'import (et mis en cache sur disque)
+# plutôt qu'au premier appel
+@njit("UniTuple(int64, 2)(float64[:], float64[:], float64[:], float64[:, :], int64[:], float64[:, :], boolean, boolean)",
+      cache=True)
+def _multicellularity_kernel(features, weights, type_features, type_weights, gene_counts, rolls,
+                             genome_present, already_multicellular):
+    """
+    Boucle de générations d'evolve_multicellularity sur des tableaux numériques.
+    
+    Args:
+        features: Caractéristiques du potentiel (voir _extract_potential_features), mises à jour en place
+        weights: Poids du potentiel
+        type_features: Caractéristiques du type (voir _pack_type_features), mises à jour en place
+        type_weights: Poids des types de multicellularité (_MC_TYPE_W)
+        gene_counts: Nombres de gènes par famille de _MC_GENE_FAMILIES, mis à jour en place
+        rolls: Tirages uniformes (générations, 5)
+        genome_present: True si l'organisme possède un génome
+        already_multicellular: True si l'organisme est déjà multicellulaire (potentiel nul)
+        
+    Returns:
+        Tuple[int, int]: (génération de la transition ou -1, valeur du MulticellularityType atteint)
+    """
+    scores = np.zeros(5)
+    
+    # Potentiel mémorisé, recalculé seulement après l'ajout d'un gène d'adhésion, de signalisation ou de régulation
+    potential = 0.0
+    stale = True
+    
+    for gen in range(rolls.shape[0]):
+        if not already_multicellular:
+            # Potentiel de multicellularité
+            if stale:
+                features[0] = gene_counts[0] / 10.0
+                features[1] = gene_counts[1] / 10.0
+                features[2] = gene_counts[2] / 10.0
+                potential = 0.0
+                for i in range(features.shape[0]):
+                    potential += features[i] * weights[i]
+                if potential > 1.0:
+                    potential = 1.0
+                stale = False
+            
+            if rolls[gen, 0] < potential * 0.1:
+                # Scores des types AGGREGATIVE, CLONAL, SYNCYTIAL, COLONIAL et COMPLEX
+                type_features[0] = gene_counts[0] / 10.0
+                type_features[3] = gene_counts[3] / 15.0
+                for t in range(5):
+                    score = 0.0
+                    for i in range(type_features.shape[0]):
+                        score += type_weights[t, i] * type_features[i]
+                    scores[t] = score
+                
+                best = 0
+                for i in range(1, 5):
+                    if scores[i] > scores[best]:
+                        best = i
+                if scores[best] >= 0.3:
+                    return gen, best + 1
+        
+        # Évolution des gènes liés à la multicellularité
+        if genome_present:
+            if rolls[gen, 1] < 0.05:
+                gene_counts[0] += 1
+                stale = True
+            if rolls[gen, 2] < 0.05:
+                gene_counts[1] += 1
+                stale = True
+            if rolls[gen, 3] < 0.03:
+                gene_counts[2] += 1
+                stale = True
+            if rolls[gen, 4] < 0.02:
+                gene_counts[3] += 1
+    
+    return -1, 0
+
+@njit(parallel=True, cache=True)
+def _evolve_population_kernel(potential_features, weights, type_features, type_weights, gene_counts,
+                              genome_present, multicellularity_type, transition_generation, rolls):
+    """
+    Fait évoluer chaque organisme d'une population avec _multicellularity_kernel, en parallèle.
+    
+    Les organismes sont indépendants : chaque itération de prange traite une colonne de la population
+    avec ses tirages, tirés avant l'appel pour que le résultat ne dépende pas du nombre de threads.
+    
+    Args:
+        potential_features: Caractéristiques du potentiel (caractéristique, organisme)
+        weights: Poids du potentiel
+        type_features: Caractéristiques du type (caractéristique, organisme)
+        type_weights: Poids des types de multicellularité (_MC_TYPE_W)
+        gene_counts: Nombres de gènes (famille, organisme), mis à jour en place
+        genome_present: Présence d'un génome par organisme
+        multicellularity_type: Valeur du MulticellularityType par organisme, mise à jour en place
+        transition_generation: Génération de la transition par organisme (-1 si aucune), remplie en place
+        rolls: Tirages uniformes (génération, 5, organisme)
+    """
+    for i in prange(gene_counts.shape[1]):
+        features = potential_features[:, i].copy()
+        types = type_features[:, i].copy()
+        counts = np.empty(gene_counts.shape[0], dtype=np.int64)
+        for k in range(gene_counts.shape[0]):
+            counts[k] = gene_counts[k, i]
+        
+        transition_gen, type_value = _multicellularity_kernel(
+            features, weights, types, type_weights, counts, rolls[:, :, i],
+            genome_present[i], multicellularity_type[i] != 0
+        )
+        
+        for k in range(gene_counts.shape[0]):
+            gene_counts[k, i] = counts[k]
+        transition_generation[i] = transition_gen
+        if transition_gen >= 0:
+            multicellularity_type[i] = type_value
+
+def _apply_multicellularity_result(evolved_data: Dict[str, Any], gene_counts: np.ndarray,
+                                   transition_gen: int, type_value: int, generations: int) -> None:
+    """
+    Reporte le résultat d'une simulation de multicellularité dans les données d'un organisme.
+    
+    Args:
+        evolved_data: Données de l'organisme à mettre à jour
+        gene_counts: Nombres de gènes par famille de _MC_GENE_FAMILIES
+        transition_gen: Génération de la transition (-1 si aucune)
+        type_value: Valeur du MulticellularityType atteint lors de la transition
+        generations: Nombre de générations simulées
+    """
+    # Historique d'évolution, repris des étapes précédentes de la simulation
+    evolved_data.setdefault("evolution_history", [])
+    
+    # Reporter les nouveaux gènes dans une copie du génome (les listes sont créées dès la première génération évoluée)
+    evolved_generations = transition_gen if transition_gen >= 0 else generations
+    genome = evolved_data.get("genome")
+    if genome is not None and evolved_generations > 0:
+        genome = evolved_data["genome"] = dict(genome)
+        for (key, prefix), count in zip(_MC_GENE_FAMILIES, gene_counts):
+            _append_gene_names(genome, key, prefix, int(count))
+    
+    if transition_gen >= 0:
+        # Transition vers la multicellularité
+        new_type = _MC_TYPES[type_value]
+        evolved_data["multicellularity_type"] = new_type
+        
+        # Ajouter des cellules différenciées selon le type
+        cell_mask = int(_MC_TYPE_CELL_MASKS[new_type])
+        if cell_mask:
+            evolved_data["cell_types"] = _cell_types_from_mask(cell_mask)
+        
+        # Enregistrer l'événement évolutif
+        _owned_list(evolved_data, "evolution_history", set()).append({
+            "generation": int(transition_gen),
+            "event": "multicellularity_transition",
+            "type": new_type.name
+        })
+
+class PopulationSoA:
+    """
+    Population d'organismes stockée par colonnes pour l'évolution de la multicellularité.
+    
+    Chaque caractéristique occupe une ligne contiguë de tableaux NumPy (une colonne par organisme),
+    ce qui permet de faire évoluer toute la population avec des opérations vectorisées.
+    """
+    
+    def __init__(self, size: int):
+        """
+        Initialise une population vide.
+        
+        Args:
+            size: Nombre d'organismes
+        """
+        self.size = size
+        
+        # Nombres de gènes par famille de _MC_GENE_FAMILIES
+        self.gene_counts = np.zeros((len(_MC_GENE_FAMILIES), size), dtype=np.int32)
+        self.adhesion_count = self.gene_counts[0]
+        self.signaling_count = self.gene_counts[1]
+        self.regulatory_count = self.gene_counts[2]
+        self.differentiation_count = self.gene_counts[3]
+        
+        # Caractéristiques du potentiel (voir _extract_potential_features)
+        self.potential_features = np.zeros((len(_POTENTIAL_WEIGHTS), size))
+        self.env_predation_pressure = self.potential_features[4]
+        self.env_stability = self.potential_features[5]
+        self.env_resource_abundance = self.potential_features[6]
+        self.env_spatial_structure = self.potential_features[7]
+        
+        # Caractéristiques du type de multicellularité (voir _pack_type_features)
+        self.type_features = np.zeros((_MC_TYPE_W.shape[1], size))
+        
+        # État de chaque organisme
+        self.genome_present = np.zeros(size, dtype=bool)
+        self.multicellularity_type = np.zeros(size, dtype=np.int8)
+        self.cell_types_mask = np.zeros(size, dtype=np.int32)  # Un bit par CellType
+        self.transition_generation = np.full(size, -1, dtype=np.int32)
+        self.generations = 0  # Générations simulées lors de la dernière évolution
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    @classmethod
+    def from_organisms(cls, organisms: List[Dict[str, Any]]) -> 'PopulationSoA':
+        """
+        Construit une population à partir de données d'organismes.
+        
+        Args:
+            organisms: Liste des données des organismes
+            
+        Returns:
+            PopulationSoA: Population correspondante
+        """
+        population = cls(len(organisms))
+        
+        for i, organism_data in enumerate(organisms):
+            genome = organism_data.get("genome")
+            if genome is not None:
+                population.genome_present[i] = True
+                for k, (key, _) in enumerate(_MC_GENE_FAMILIES):
+                    population.gene_counts[k, i] = len(genome.get(key, ()))
+            
+            _extract_potential_features(organism_data, population.potential_features[:, i])
+            _pack_type_features(organism_data, population.type_features[:, i])
+            population.multicellularity_type[i] = organism_data.get(
+                "multicellularity_type", MulticellularityType.NONE)
+            population.cell_types_mask[i] = _cell_types_mask(organism_data.get("cell_types", ()))
+        
+        return population
+    
+    def to_organisms(self, organisms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Reporte le résultat de la dernière évolution dans les données des organismes.
+        
+        Args:
+            organisms: Liste des données des organismes ayant servi à construire la population
+            
+        Returns:
+            List[Dict[str, Any]]: Données des organismes après évolution
+        """
+        evolved = []
+        
+        for i, organism_data in enumerate(organisms):
+            evolved_data = dict(organism_data)
+            _apply_multicellularity_result(
+                evolved_data, self.gene_counts[:, i], int(self.transition_generation[i]),
+                int(self.multicellularity_type[i]), self.generations
+            )
+            evolved.append(evolved_data)
+        
+        return evolved
+
+def _determine_type_batch(population: 'PopulationSoA', fired: np.ndarray) -> np.ndarray:
+    """
+    Détermine le type de multicellularité atteint par les organismes d'une population.
+    
+    Args:
+        population: Population évaluée
+        fired: Masque des organismes tentant une transition
+        
+    Returns:
+        np.ndarray: Valeur du MulticellularityType par organisme (0 si pas de transition)
+    """
+    type_features = population.type_features
+    np.divide(population.adhesion_count, 10.0, out=type_features[0])
+    np.divide(population.differentiation_count, 15.0, out=type_features[3])
+    
+    # Scores des cinq types pour tous les organismes, puis type le plus probable
+    scores = _MC_TYPE_W @ type_features
+    best = scores.argmax(axis=0)
+    best_scores = np.take_along_axis(scores, best[None, :], axis=0)[0]
+    
+    return np.where(fired & (best_scores >= 0.3), best + 1, 0).astype(np.int8)
+
 class MulticellularityMechanism:
     """Mécanismes permettant l'évolution de la multicellularité."""
     
@@ -79,6 +648,11 @@ class MulticellularityMechanism:
         self.division_of_labor = 0.0  # Division du travail entre cellules
         self.increased_efficiency = 0.0  # Efficacité métabolique accrue
         self.environmental_buffering = 0.0  # Protection contre les fluctuations environnementales
+        
+        # Vecteur de caractéristiques réutilisé par calculate_multicellularity_potential
+        self._potential_features = np.zeros(len(_POTENTIAL_WEIGHTS))
+        # Vecteur de caractéristiques réutilisé par determine_multicellularity_type
+        self._type_features = np.zeros(_MC_TYPE_W.shape[1])
     
     def calculate_multicellularity_potential(self, organism_data: Dict[str, Any]) -> float:
         """
@@ -94,71 +668,9 @@ class MulticellularityMechanism:
         if organism_data.get("multicellularity_type", MulticellularityType.NONE) != MulticellularityType.NONE:
             return 0.0  # Déjà multicellulaire
             
-        # Facteurs génomiques
-        genome_factors = 0.0
-        if "genome" in organism_data:
-            genome = organism_data["genome"]
-            
-            # Présence de gènes d'adhésion cellulaire
-            if "adhesion_genes" in genome:
-                genome_factors += 0.3 * len(genome["adhesion_genes"]) / 10.0
-                
-            # Présence de gènes de signalisation
-            if "signaling_genes" in genome:
-                genome_factors += 0.3 * len(genome["signaling_genes"]) / 10.0
-                
-            # Présence de gènes de régulation
-            if "regulatory_genes" in genome:
-                genome_factors += 0.2 * len(genome["regulatory_genes"]) / 10.0
-                
-            # Taille du génome
-            if "size" in genome:
-                genome_factors += 0.2 * min(1.0, genome["size"] / 1000.0)
-                
-        # Facteurs environnementaux
-        env_factors = 0.0
-        if "environment" in organism_data:
-            env = organism_data["environment"]
-            
-            # Pression de prédation
-            if "predation_pressure" in env:
-                env_factors += 0.3 * env["predation_pressure"]
-                
-            # Stabilité environnementale
-            if "stability" in env:
-                env_factors += 0.2 * env["stability"]
-                
-            # Richesse en ressources
-            if "resource_abundance" in env:
-                env_factors += 0.2 * env["resource_abundance"]
-                
-            # Structure spatiale
-            if "spatial_structure" in env:
-                env_factors += 0.3 * env["spatial_structure"]
-                
-        # Facteurs démographiques
-        demo_factors = 0.0
-        if "population" in organism_data:
-            pop = organism_data["population"]
-            
-            # Densité de population
-            if "density" in pop:
-                demo_factors += 0.5 * min(1.0, pop["density"] / 100.0)
-                
-            # Taux de reproduction
-            if "reproduction_rate" in pop:
-                demo_factors += 0.3 * pop["reproduction_rate"]
-                
-            # Compétition intraspécifique
-            if "competition" in pop:
-                demo_factors += 0.2 * pop["competition"]
-                
-        # Combiner tous les facteurs
-        potential = (
-            0.4 * genome_factors +
-            0.4 * env_factors +
-            0.2 * demo_factors
-        )
+        # Facteurs génomiques, environnementaux et démographiques combinés en un seul produit scalaire
+        features = _extract_potential_features(organism_data, self._potential_features)
+        potential = float(np.dot(features, _POTENTIAL_WEIGHTS))
         
         return min(1.0, potential)
     
@@ -172,80 +684,18 @@ class MulticellularityMechanism:
         Returns:
             MulticellularityType: Type de multicellularité
         """
-        # Facteurs favorisant chaque type de multicellularité
-        type_scores = {
-            MulticellularityType.AGGREGATIVE: 0.0,
-            MulticellularityType.CLONAL: 0.0,
-            MulticellularityType.SYNCYTIAL: 0.0,
-            MulticellularityType.COLONIAL: 0.0,
-            MulticellularityType.COMPLEX: 0.0
-        }
+        # Scores de chaque type de multicellularité (produit matrice-vecteur)
+        features = _pack_type_features(organism_data, self._type_features)
+        type_scores = _MC_TYPE_W @ features
         
-        # Facteurs génomiques
-        if "genome" in organism_data:
-            genome = organism_data["genome"]
-            
-            # Gènes d'adhésion favorisent l'agrégation et les colonies
-            if "adhesion_genes" in genome:
-                adhesion_score = len(genome["adhesion_genes"]) / 10.0
-                type_scores[MulticellularityType.AGGREGATIVE] += 0.3 * adhesion_score
-                type_scores[MulticellularityType.COLONIAL] += 0.2 * adhesion_score
-                
-            # Gènes de division cellulaire favorisent le type clonal
-            if "division_genes" in genome:
-                division_score = len(genome["division_genes"]) / 10.0
-                type_scores[MulticellularityType.CLONAL] += 0.4 * division_score
-                
-            # Gènes de fusion cellulaire favorisent le type syncytial
-            if "fusion_genes" in genome:
-                fusion_score = len(genome["fusion_genes"]) / 5.0
-                type_scores[MulticellularityType.SYNCYTIAL] += 0.5 * fusion_score
-                
-            # Gènes de différenciation favorisent le type complexe
-            if "differentiation_genes" in genome:
-                diff_score = len(genome["differentiation_genes"]) / 15.0
-                type_scores[MulticellularityType.COMPLEX] += 0.6 * diff_score
-                
-        # Facteurs environnementaux
-        if "environment" in organism_data:
-            env = organism_data["environment"]
-            
-            # Environnements instables favorisent l'agrégation (réversible)
-            if "stability" in env:
-                stability = env["stability"]
-                type_scores[MulticellularityType.AGGREGATIVE] += 0.3 * (1.0 - stability)
-                type_scores[MulticellularityType.COMPLEX] += 0.3 * stability
-                
-            # Environnements aquatiques favorisent les colonies
-            if "aquatic" in env and env["aquatic"]:
-                type_scores[MulticellularityType.COLONIAL] += 0.3
-                
-            # Environnements avec forte pression de prédation favorisent les types complexes
-            if "predation_pressure" in env:
-                predation = env["predation_pressure"]
-                type_scores[MulticellularityType.COMPLEX] += 0.4 * predation
-                
-        # Facteurs métaboliques
-        if "metabolism" in organism_data:
-            metabolism = organism_data["metabolism"]
-            
-            # Photosynthèse favorise les colonies et le type clonal
-            if "photosynthetic" in metabolism and metabolism["photosynthetic"]:
-                type_scores[MulticellularityType.COLONIAL] += 0.3
-                type_scores[MulticellularityType.CLONAL] += 0.2
-                
-            # Métabolisme aérobie favorise les types complexes
-            if "aerobic" in metabolism and metabolism["aerobic"]:
-                type_scores[MulticellularityType.COMPLEX] += 0.3
-                
-        # Déterminer le type le plus probable
-        most_likely_type = max(type_scores.items(), key=lambda x: x[1])[0]
+        # Déterminer le type le plus probable (réduction argmax, premier maximum en cas d'égalité)
+        best = int(type_scores.argmax())
         
         # Si le score est trop faible, rester unicellulaire
-        if type_scores[most_likely_type] < 0.3:
+        if type_scores[best] < 0.3:
             return MulticellularityType.NONE
             
-        return most_likely_type
+        return _MC_TYPES[best + 1]
     
     def evolve_multicellularity(self, organism_data: Dict[str, Any], generations: int = 100) -> Dict[str, Any]:
         """
@@ -258,74 +708,114 @@ class MulticellularityMechanism:
         Returns:
             Dict[str, Any]: Données sur l'organisme après évolution
         """
-        # Copier les données initiales
-        evolved_data = organism_data.copy()
+        # Copier les données initiales (le génome et l'historique sont copiés lors de leur mise à jour)
+        evolved_data = dict(organism_data)
         
-        # Historique d'évolution
-        evolution_history = []
+        # Tirages aléatoires de toutes les générations en un seul appel
+        # (0: transition, 1: adhésion, 2: signalisation, 3: régulation, 4: différenciation)
+        rolls = np.random.random((generations, 5))
+        
+        # Données numériques de l'organisme pour le noyau de simulation
+        genome = evolved_data.get("genome")
+        gene_counts = np.array([len(genome.get(key, ())) if genome is not None else 0
+                                for key, _ in _MC_GENE_FAMILIES], dtype=np.int64)
+        features = _extract_potential_features(evolved_data, np.zeros(len(_POTENTIAL_WEIGHTS)))
+        already_multicellular = evolved_data.get("multicellularity_type", MulticellularityType.NONE) != MulticellularityType.NONE
         
         # Simuler l'évolution sur plusieurs générations
-        for gen in range(generations):
-            # Calculer le potentiel de multicellularité
-            potential = self.calculate_multicellularity_potential(evolved_data)
+        transition_gen, type_value = _multicellularity_kernel(
+            features, _POTENTIAL_WEIGHTS, _pack_type_features(evolved_data, np.zeros(_MC_TYPE_W.shape[1])),
+            _MC_TYPE_W, gene_counts, rolls,
+            genome is not None, already_multicellular
+        )
+        
+        # Reporter le résultat dans les données de l'organisme
+        _apply_multicellularity_result(evolved_data, gene_counts, transition_gen, type_value, generations)
+        
+        return evolved_data
+    
+    def evolve_multicellularity_batch(self, population: PopulationSoA, generations: int = 100) -> PopulationSoA:
+        """
+        Simule l'évolution de la multicellularité pour toute une population à la fois.
+        
+        Même modèle que evolve_multicellularity. Avec numba et plusieurs threads, les organismes sont
+        répartis entre les cœurs (_evolve_population_kernel) ; sinon chaque génération calcule les
+        potentiels de tous les organismes en un produit matrice-vecteur. Les deux voies consomment les
+        mêmes tirages : le résultat ne dépend pas du nombre de threads.
+        
+        Args:
+            population: Population à faire évoluer (modifiée en place)
+            generations: Nombre de générations à simuler
             
-            # Probabilité d'évolution vers la multicellularité
-            if random.random() < potential * 0.1:  # Transition rare
-                # Déterminer le type de multicellularité
-                new_type = self.determine_multicellularity_type(evolved_data)
-                
-                if new_type != MulticellularityType.NONE:
-                    # Transition vers la multicellularité
-                    evolved_data["multicellularity_type"] = new_type
-                    
-                    # Ajouter des cellules différenciées selon le type
-                    if new_type == MulticellularityType.COMPLEX:
-                        evolved_data["cell_types"] = [CellType.STEM, CellType.EPITHELIAL]
-                    elif new_type == MulticellularityType.COLONIAL:
-                        evolved_data["cell_types"] = [CellType.STEM]
-                    
-                    # Enregistrer l'événement évolutif
-                    evolution_history.append({
-                        "generation": gen,
-                        "event": "multicellularity_transition",
-                        "type": new_type.name
-                    })
-                    
-                    # Arrêter la simulation après la transition
-                    break
+        Returns:
+            PopulationSoA: La population après évolution
+        """
+        n = len(population)
+        gene_counts = population.gene_counts
+        potential_features = population.potential_features
+        
+        if NUMBA_ENABLED and get_num_threads() > 1:
+            # Mêmes tirages, dans le même ordre, que la boucle par génération ci-dessous
+            _evolve_population_kernel(
+                potential_features, _POTENTIAL_WEIGHTS, population.type_features, _MC_TYPE_W, gene_counts,
+                population.genome_present, population.multicellularity_type,
+                population.transition_generation, np.random.random((generations, 5, n))
+            )
+            
+            # Caractéristiques dépendant des gènes et types cellulaires acquis lors des transitions
+            np.divide(gene_counts[0:3], 10.0, out=potential_features[0:3])
+            accepted = population.transition_generation >= 0
+            new_cell_masks = _MC_TYPE_CELL_MASKS[population.multicellularity_type]
+            np.copyto(population.cell_types_mask, new_cell_masks, where=accepted & (new_cell_masks != 0))
+            
+            population.generations = generations
+            return population
+        
+        # Organismes pouvant encore devenir multicellulaires / dont les gènes évoluent encore
+        can_transition = population.multicellularity_type == MulticellularityType.NONE
+        evolving = population.genome_present.copy()
+        population.transition_generation[:] = -1
+        
+        # Seuils d'apparition des gènes d'adhésion, de signalisation, de régulation et de différenciation
+        gene_thresholds = np.array([0.05, 0.05, 0.03, 0.02])[:, None]
+        
+        # Tampons réutilisés à chaque génération
+        potential = np.empty(n)
+        fired = np.empty(n, dtype=bool)
+        accepted = np.empty(n, dtype=bool)
+        gene_gains = np.empty((len(_MC_GENE_FAMILIES), n), dtype=bool)
+        
+        for gen in range(generations):
+            rolls = np.random.random((5, n))
+            
+            # Seuil de transition de toute la population (potentiel * 0.1)
+            np.divide(gene_counts[0:3], 10.0, out=potential_features[0:3])
+            np.matmul(_POTENTIAL_WEIGHTS, potential_features, out=potential)
+            np.minimum(potential, 1.0, out=potential)
+            np.multiply(potential, 0.1, out=potential)
+            
+            # Organismes tentant une transition
+            np.less(rolls[0], potential, out=fired)
+            np.logical_and(fired, can_transition, out=fired)
+            if fired.any():
+                type_codes = _determine_type_batch(population, fired)
+                np.greater(type_codes, 0, out=accepted)
+                np.copyto(population.multicellularity_type, type_codes, where=accepted)
+                np.copyto(population.transition_generation, gen, where=accepted)
+                new_cell_masks = _MC_TYPE_CELL_MASKS[type_codes]
+                np.copyto(population.cell_types_mask, new_cell_masks, where=accepted & (new_cell_masks != 0))
+                np.logical_not(accepted, out=accepted)
+                np.logical_and(can_transition, accepted, out=can_transition)
+                np.logical_and(evolving, accepted, out=evolving)
             
             # Évolution des gènes liés à la multicellularité
-            if "genome" in evolved_data:
-                genome = evolved_data["genome"]
-                
-                # Évolution des gènes d'adhésion
-                if "adhesion_genes" not in genome:
-                    genome["adhesion_genes"] = []
-                if random.random() < 0.05:
-                    genome["adhesion_genes"].append(f"adh_{len(genome['adhesion_genes']) + 1}")
-                
-                # Évolution des gènes de signalisation
-                if "signaling_genes" not in genome:
-                    genome["signaling_genes"] = []
-                if random.random() < 0.05:
-                    genome["signaling_genes"].append(f"sig_{len(genome['signaling_genes']) + 1}")
-                
-                # Évolution des gènes de régulation
-                if "regulatory_genes" not in genome:
-                    genome["regulatory_genes"] = []
-                if random.random() < 0.03:
-                    genome["regulatory_genes"].append(f"reg_{len(genome['regulatory_genes']) + 1}")
-                
-                # Évolution des gènes de différenciation
-                if "differentiation_genes" not in genome:
-                    genome["differentiation_genes"] = []
-                if random.random() < 0.02:
-                    genome["differentiation_genes"].append(f"diff_{len(genome['differentiation_genes']) + 1}")
+            np.less(rolls[1:], gene_thresholds, out=gene_gains)
+            np.logical_and(gene_gains, evolving, out=gene_gains)
+            gene_counts += gene_gains
         
-        # Ajouter l'historique d'évolution
-        evolved_data["evolution_history"] = evolution_history
+        population.generations = generations
         
-        return evolved_data
+        return population
 
 class NeuralEvolution:
     """Mécanismes d'évolution des systèmes nerveux et du cerveau."""
@@ -355,6 +845,28 @@ class NeuralEvolution:
         Args:
             organism_data: Données sur l'organisme
             
+        Returns:
+            float: Potentiel d'évolution neurale (0.0 à 1.0)
+        """
+        genome = organism_data.get("genome", {})
+        return self._neural_complexity_potential(
+            organism_data,
+            len(genome.get("neural_genes", ())),
+            len(genome.get("signaling_genes", ())),
+            len(genome.get("development_genes", ()))
+        )
+    
+    def _neural_complexity_potential(self, organism_data: Dict[str, Any], neural_count: int,
+                                     signaling_count: int, development_count: int) -> float:
+        """
+        Calcule le potentiel d'évolution neurale à partir des nombres de gènes déjà comptés.
+        
+        Args:
+            organism_data: Données sur l'organisme
+            neural_count: Nombre de gènes neuronaux
+            signaling_count: Nombre de gènes de signalisation
+            development_count: Nombre de gènes de développement
+            
         Returns:
             float: Potentiel d'évolution neurale (0.0 à 1.0)
         """
@@ -369,64 +881,30 @@ class NeuralEvolution:
         if current_complexity == NeuralComplexity.PREFRONTAL_CORTEX:
             return 0.0  # Déjà au niveau maximal
             
-        # Facteurs génomiques
-        genome_factors = 0.0
-        if "genome" in organism_data:
-            genome = organism_data["genome"]
-            
-            # Présence de gènes neuronaux
-            if "neural_genes" in genome:
-                genome_factors += 0.4 * min(1.0, len(genome["neural_genes"]) / 20.0)
-                
-            # Présence de gènes de signalisation
-            if "signaling_genes" in genome:
-                genome_factors += 0.3 * min(1.0, len(genome["signaling_genes"]) / 15.0)
-                
-            # Présence de gènes de développement
-            if "development_genes" in genome:
-                genome_factors += 0.3 * min(1.0, len(genome["development_genes"]) / 15.0)
+        # Facteurs génomiques (gènes neuronaux, de signalisation et de développement)
+        genome_factors = (
+            0.4 * min(1.0, neural_count / 20.0) +
+            0.3 * min(1.0, signaling_count / 15.0) +
+            0.3 * min(1.0, development_count / 15.0)
+        )
                 
-        # Facteurs environnementaux
+        # Facteurs environnementaux : complexité, pression de prédation, variabilité et richesse en ressources
         env_factors = 0.0
-        if "environment" in organism_data:
-            env = organism_data["environment"]
-            
-            # Complexité environnementale
-            if "complexity" in env:
-                env_factors += 0.3 * env["complexity"]
-                
-            # Pression de prédation
-            if "predation_pressure" in env:
-                env_factors += 0.3 * env["predation_pressure"]
+        env = organism_data.get("environment")
+        if env is not None:
+            for key, weight in _NEURAL_ENV_WEIGHTS:
+                value = env.get(key)
+                if value is not None:
+                    env_factors += weight * value
                 
-            # Variabilité environnementale
-            if "variability" in env:
-                env_factors += 0.2 * env["variability"]
-                
-            # Richesse en ressources
-            if "resource_abundance" in env:
-                env_factors += 0.2 * env["resource_abundance"]
-                
-        # Facteurs comportementaux
+        # Facteurs comportementaux : complexité locomotrice, sociale, alimentaire et capacité d'apprentissage
         behavior_factors = 0.0
-        if "behavior" in organism_data:
-            behavior = organism_data["behavior"]
-            
-            # Complexité locomotrice
-            if "locomotion_complexity" in behavior:
-                behavior_factors += 0.3 * behavior["locomotion_complexity"]
-                
-            # Complexité sociale
-            if "social_complexity" in behavior:
-                behavior_factors += 0.3 * behavior["social_complexity"]
-                
-            # Complexité alimentaire
-            if "feeding_complexity" in behavior:
-                behavior_factors += 0.2 * behavior["feeding_complexity"]
-                
-            # Capacité d'apprentissage
-            if "learning_capacity" in behavior:
-                behavior_factors += 0.2 * behavior["learning_capacity"]
+        behavior = organism_data.get("behavior")
+        if behavior is not None:
+            for key, weight in _NEURAL_BEHAVIOR_WEIGHTS:
+                value = behavior.get(key)
+                if value is not None:
+                    behavior_factors += weight * value
                 
         # Combiner tous les facteurs
         potential = (
@@ -436,7 +914,7 @@ class NeuralEvolution:
         )
         
         # Ajuster en fonction du niveau actuel (plus difficile d'évoluer à des niveaux supérieurs)
-        level_adjustment = 1.0 - (current_complexity.value / NeuralComplexity.PREFRONTAL_CORTEX.value * 0.7)
+        level_adjustment = 1.0 - (current_complexity / _NC_PREFRONTAL * 0.7)
         
         return min(1.0, potential * level_adjustment)
     
@@ -453,52 +931,12 @@ class NeuralEvolution:
         # Niveau actuel
         current_level = organism_data.get("neural_complexity", NeuralComplexity.NONE)
         
-        # Progression naturelle
-        progression = {
-            NeuralComplexity.NONE: NeuralComplexity.NERVE_NET,
-            NeuralComplexity.NERVE_NET: NeuralComplexity.GANGLIA,
-            NeuralComplexity.GANGLIA: NeuralComplexity.LADDER,
-            NeuralComplexity.LADDER: NeuralComplexity.CENTRAL_NERVOUS_SYSTEM,
-            NeuralComplexity.CENTRAL_NERVOUS_SYSTEM: NeuralComplexity.BRAIN_SPINAL_CORD,
-            NeuralComplexity.BRAIN_SPINAL_CORD: NeuralComplexity.COMPLEX_BRAIN,
-            NeuralComplexity.COMPLEX_BRAIN: NeuralComplexity.NEOCORTEX,
-            NeuralComplexity.NEOCORTEX: NeuralComplexity.PREFRONTAL_CORTEX
-        }
-        
-        # Prochain niveau dans la progression
-        next_level = progression.get(current_level, current_level)
+        # Prochain niveau dans la progression naturelle
+        next_level = _NEURAL_NEXT[current_level]
         
         # Vérifier si l'organisme a les prérequis pour ce niveau
-        if next_level == NeuralComplexity.NERVE_NET:
-            # Vérifier la multicellularité
-            if organism_data.get("multicellularity_type", MulticellularityType.NONE) == MulticellularityType.NONE:
-                return current_level
-                
-        elif next_level == NeuralComplexity.CENTRAL_NERVOUS_SYSTEM:
-            # Vérifier la présence de cellules nerveuses spécialisées
-            if "cell_types" in organism_data and CellType.NERVE not in organism_data["cell_types"]:
-                return current_level
-                
-        elif next_level == NeuralComplexity.COMPLEX_BRAIN:
-            # Vérifier la complexité comportementale
-            if "behavior" in organism_data:
-                behavior = organism_data["behavior"]
-                if behavior.get("locomotion_complexity", 0.0) < 0.5:
-                    return current_level
-                    
-        elif next_level == NeuralComplexity.NEOCORTEX:
-            # Vérifier la complexité sociale
-            if "behavior" in organism_data:
-                behavior = organism_data["behavior"]
-                if behavior.get("social_complexity", 0.0) < 0.6:
-                    return current_level
-                    
-        elif next_level == NeuralComplexity.PREFRONTAL_CORTEX:
-            # Vérifier la capacité d'apprentissage
-            if "behavior" in organism_data:
-                behavior = organism_data["behavior"]
-                if behavior.get("learning_capacity", 0.0) < 0.8:
-                    return current_level
+        if not _NEURAL_PREREQUISITES[next_level](organism_data):
+            return current_level
         
         return next_level
     
@@ -513,98 +951,224 @@ class NeuralEvolution:
         Returns:
             Dict[str, Any]: Données sur l'organisme après évolution
         """
-        # Copier les données initiales
-        evolved_data = organism_data.copy()
+        # Copier les données initiales ; les listes et dictionnaires imbriqués ne sont copiés
+        # qu'au moment de leur première modification (voir _owned_list)
+        evolved_data = dict(organism_data)
+        owned = set()
+        
+        # Tirages aléatoires de toutes les générations en un seul appel
+        # (0: transition, 1-3: gènes neuronaux, de développement et de neurotransmetteurs,
+        #  4-6: évolution de la locomotion, de la socialité et de l'apprentissage)
+        rolls = np.random.random((generations, 7))
+        # Incréments comportementaux (locomotion, socialité, apprentissage)
+        increments = np.random.random((generations, 3)) * 0.1
         
-        # Historique d'évolution
-        evolution_history = []
+        # Compteurs de gènes (neuronaux, de développement, de neurotransmetteurs) ;
+        # les noms ne sont générés qu'une fois après la boucle
+        genome = evolved_data.get("genome")
+        if genome is not None:
+            signaling_count = len(genome.get("signaling_genes", ()))
+            gene_counts = [len(genome.get(key, ())) for key, _ in _NEURAL_GENE_FAMILIES]
+        else:
+            signaling_count = 0
+            gene_counts = [0, 0, 0]
+        
+        # Potentiel mémorisé d'une génération à l'autre : il n'est recalculé que lorsque
+        # le niveau, les gènes neuronaux ou de développement ou le comportement changent
+        potential = None
         
         # Simuler l'évolution sur plusieurs générations
         for gen in range(generations):
             # Calculer le potentiel d'évolution neurale
-            potential = self.calculate_neural_complexity_potential(evolved_data)
+            if potential is None:
+                potential = self._neural_complexity_potential(evolved_data, gene_counts[0], signaling_count, gene_counts[1])
             
             # Probabilité d'évolution vers une complexité neurale supérieure
-            if random.random() < potential * 0.05:  # Transition rare
+            if rolls[gen, 0] < potential * 0.05:  # Transition rare
                 # Déterminer le prochain niveau de complexité
                 next_level = self.determine_next_neural_complexity(evolved_data)
                 
                 if next_level != evolved_data.get("neural_complexity", NeuralComplexity.NONE):
                     # Transition vers une complexité neurale supérieure
                     evolved_data["neural_complexity"] = next_level
+                    potential = None
                     
                     # Ajouter des cellules nerveuses si nécessaire
                     if "cell_types" in evolved_data and CellType.NERVE not in evolved_data["cell_types"]:
-                        evolved_data["cell_types"].append(CellType.NERVE)
+                        _owned_list(evolved_data, "cell_types", owned).append(CellType.NERVE)
                     
                     # Ajouter des cellules sensorielles pour les niveaux supérieurs
-                    if next_level.value >= NeuralComplexity.CENTRAL_NERVOUS_SYSTEM.value:
+                    if next_level >= NeuralComplexity.CENTRAL_NERVOUS_SYSTEM:
                         if "cell_types" in evolved_data and CellType.SENSORY not in evolved_data["cell_types"]:
-                            evolved_data["cell_types"].append(CellType.SENSORY)
+                            _owned_list(evolved_data, "cell_types", owned).append(CellType.SENSORY)
                     
                     # Enregistrer l'événement évolutif
-                    evolution_history.append({
+                    _owned_list(evolved_data, "evolution_history", owned).append({
                         "generation": gen,
                         "event": "neural_complexity_transition",
                         "level": next_level.name
                     })
             
             # Évolution des gènes liés au système nerveux
-            if "genome" in evolved_data:
-                genome = evolved_data["genome"]
-                
+            if genome is not None:
                 # Évolution des gènes neuronaux
-                if "neural_genes" not in genome:
-                    genome["neural_genes"] = []
-                if random.random() < 0.05:
-                    genome["neural_genes"].append(f"neur_{len(genome['neural_genes']) + 1}")
+                if rolls[gen, 1] < 0.05:
+                    gene_counts[0] += 1
+                    potential = None
                 
                 # Évolution des gènes de développement
-                if "development_genes" not in genome:
-                    genome["development_genes"] = []
-                if random.random() < 0.03:
-                    genome["development_genes"].append(f"dev_{len(genome['development_genes']) + 1}")
+                if rolls[gen, 2] < 0.03:
+                    gene_counts[1] += 1
+                    potential = None
                 
                 # Évolution des gènes de neurotransmetteurs
-                if "neurotransmitter_genes" not in genome:
-                    genome["neurotransmitter_genes"] = []
-                if random.random() < 0.02:
-                    genome["neurotransmitter_genes"].append(f"nt_{len(genome['neurotransmitter_genes']) + 1}")
+                if rolls[gen, 3] < 0.02:
+                    gene_counts[2] += 1
             
-            # Évolution du comportement
-            if "behavior" not in evolved_data:
-                evolved_data["behavior"] = {}
-            
-            behavior = evolved_data["behavior"]
+            # Évolution du comportement (les traits absents sont initialisés à la première génération)
+            if gen == 0:
+                behavior = evolved_data["behavior"] = dict(evolved_data.get("behavior", {}))
+                for trait, default in _NEURAL_BEHAVIOR_DEFAULTS:
+                    behavior.setdefault(trait, default)
+                potential = None
             
             # Évolution de la complexité locomotrice
-            if "locomotion_complexity" not in behavior:
-                behavior["locomotion_complexity"] = 0.1
-            if random.random() < 0.1:
-                behavior["locomotion_complexity"] = min(1.0, behavior["locomotion_complexity"] + random.uniform(0.0, 0.1))
+            if rolls[gen, 4] < 0.1:
+                behavior["locomotion_complexity"] = min(1.0, behavior["locomotion_complexity"] + float(increments[gen, 0]))
+                potential = None
             
             # Évolution de la complexité sociale
-            if "social_complexity" not in behavior:
-                behavior["social_complexity"] = 0.05
-            if random.random() < 0.1:
-                behavior["social_complexity"] = min(1.0, behavior["social_complexity"] + random.uniform(0.0, 0.1))
+            if rolls[gen, 5] < 0.1:
+                behavior["social_complexity"] = min(1.0, behavior["social_complexity"] + float(increments[gen, 1]))
+                potential = None
             
             # Évolution de la capacité d'apprentissage
-            if "learning_capacity" not in behavior:
-                behavior["learning_capacity"] = 0.0
-            if random.random() < 0.05:
-                behavior["learning_capacity"] = min(1.0, behavior["learning_capacity"] + random.uniform(0.0, 0.1))
+            if rolls[gen, 6] < 0.05:
+                behavior["learning_capacity"] = min(1.0, behavior["learning_capacity"] + float(increments[gen, 2]))
+                potential = None
         
-        # Ajouter l'historique d'évolution
-        if "evolution_history" not in evolved_data:
-            evolved_data["evolution_history"] = []
-        evolved_data["evolution_history"].extend(evolution_history)
+        # Reporter les nouveaux gènes dans une copie du génome
+        if genome is not None and generations > 0:
+            genome = evolved_data["genome"] = dict(genome)
+            for (key, prefix), count in zip(_NEURAL_GENE_FAMILIES, gene_counts):
+                _append_gene_names(genome, key, prefix, count)
+        
+        # Historique d'évolution, repris des étapes précédentes de la simulation
+        evolved_data.setdefault("evolution_history", [])
         
         return evolved_data
 
-class BrainRegion:
+# Capacités cognitives, dans l'ordre du dictionnaire Brain.cognitive_abilities
+_COGNITIVE_ABILITIES = ("perception", "motor_control", "learning", "memory", "decision_making",
+                        "social_cognition", "language", "tool_use", "consciousness")
+
+class CognitiveAbility(IntEnum):
+    """Indices des capacités cognitives dans les vecteurs de capacités (ordre de _COGNITIVE_ABILITIES)."""
+    PERCEPTION = 0
+    MOTOR_CONTROL = 1
+    LEARNING = 2
+    MEMORY = 3
+    DECISION_MAKING = 4
+    SOCIAL_COGNITION = 5
+    LANGUAGE = 6
+    TOOL_USE = 7
+    CONSCIOUSNESS = 8
+
+def cognitive_ability_vector(abilities: Mapping[str, float]) -> np.ndarray:
+    """
+    Convertit des capacités cognitives {capacité: niveau} en vecteur indexé par CognitiveAbility.
+    
+    Args:
+        abilities: Capacités cognitives (par exemple organism["brain"]["cognitive_abilities"])
+        
+    Returns:
+        np.ndarray: Niveaux des capacités (0.0 pour les capacités absentes)
+    """
+    return np.array([abilities.get(name, 0.0) for name in _COGNITIVE_ABILITIES])
+
+def cognitive_ability_dict(levels: np.ndarray) -> Dict[str, float]:
+    """
+    Convertit un vecteur de capacités cognitives en dictionnaire {capacité: niveau}.
+    
+    Args:
+        levels: Niveaux des capacités, indexés par CognitiveAbility
+        
+    Returns:
+        Dict[str, float]: Capacités cognitives
+    """
+    return dict(zip(_COGNITIVE_ABILITIES, levels.tolist()))
+
+# Un bit par capacité cognitive (bit i = _COGNITIVE_ABILITIES[i])
+_ABILITY_BIT_PERCEPTION = 1 << 0
+_ABILITY_BIT_MOTOR_CONTROL = 1 << 1
+_ABILITY_BIT_LEARNING = 1 << 2
+_ABILITY_BIT_MEMORY = 1 << 3
+_ABILITY_BIT_DECISION_MAKING = 1 << 4
+_ABILITY_BIT_SOCIAL_COGNITION = 1 << 5
+_ABILITY_BIT_LANGUAGE = 1 << 6
+_ABILITY_BIT_TOOL_USE = 1 << 7
+_ABILITY_BIT_CONSCIOUSNESS = 1 << 8
+
+# Capacités auxquelles contribue chaque fonction de région
+_FUNC_TO_ABILITY_BITS: Dict[str, int] = {
+    "sensation": _ABILITY_BIT_PERCEPTION,
+    "sensory_integration": _ABILITY_BIT_PERCEPTION,
+    "visual_processing": _ABILITY_BIT_PERCEPTION,
+    "auditory_processing": _ABILITY_BIT_PERCEPTION,
+    "movement": _ABILITY_BIT_MOTOR_CONTROL,
+    "motor_coordination": _ABILITY_BIT_MOTOR_CONTROL,
+    "motor_control": _ABILITY_BIT_MOTOR_CONTROL,
+    "learning": _ABILITY_BIT_LEARNING,
+    "procedural_learning": _ABILITY_BIT_LEARNING,
+    "memory": _ABILITY_BIT_MEMORY,
+    "decision_making": _ABILITY_BIT_DECISION_MAKING,
+    "executive_function": _ABILITY_BIT_DECISION_MAKING | _ABILITY_BIT_CONSCIOUSNESS,
+    "planning": _ABILITY_BIT_DECISION_MAKING | _ABILITY_BIT_TOOL_USE,
+    "social_behavior": _ABILITY_BIT_SOCIAL_COGNITION,
+    "emotion": _ABILITY_BIT_SOCIAL_COGNITION,
+    "language": _ABILITY_BIT_LANGUAGE,
+    "tool_use": _ABILITY_BIT_TOOL_USE,
+    "spatial_awareness": _ABILITY_BIT_TOOL_USE,
+    "consciousness": _ABILITY_BIT_CONSCIOUSNESS,
+    "working_memory": _ABILITY_BIT_CONSCIOUSNESS,
+}
+
+
+def _ability_mask(functions: frozenset) -> int:
+    """
+    Calcule le masque des capacités cognitives auxquelles contribuent des fonctions.
+    
+    Args:
+        functions: Fonctions d'une région cérébrale
+        
+    Returns:
+        Masque de bits (un bit par capacité de _COGNITIVE_ABILITIES)
+    """
+    mask = 0
+    for function in functions:
+        mask |= _FUNC_TO_ABILITY_BITS.get(function, 0)
+    return mask
+
+
+# Entrées sensorielles reçues sous forme de tableau par Brain.process_inputs_array, dans cet ordre
+_SENSORY_INPUTS = ("visual", "auditory", "tactile", "olfactory")
+
+# Fonctions des régions dont l'activité pilote chaque sortie comportementale de Brain.process_inputs
+_OUTPUT_REGION_FUNCTIONS: Dict[str, frozenset] = {
+    "movement": frozenset({"movement", "motor_control", "motor_coordination"}),
+    "emotional_response": frozenset({"emotion"}),
+    "decision": frozenset({"decision_making", "executive_function"}),
+    "tool_use": frozenset({"planning", "spatial_awareness", "tool_use"}),
+    "communication": frozenset({"language"}),
+}
+
+
+class BrainRegion:
     """Représente une région cérébrale avec ses fonctions et connexions."""
     
+    __slots__ = ("id", "name", "functions", "ability_mask", "connections", "neurotransmitters",
+                 "development_stage", "_function_set", "_graph", "_index", "_size", "_activity", "_plasticity")
+    
     def __init__(self, 
                  region_id: str,
                  name: str,
@@ -626,12 +1190,60 @@ class BrainRegion:
         self.id = region_id
         self.name = name
         self.functions = functions
-        self.size = size
+        self._function_set = frozenset(functions)  # Tests d'appartenance en temps constant
+        self.ability_mask = _ability_mask(self._function_set)  # Capacités cognitives servies par la région
         self.connections = connections or {}
         self.neurotransmitters = neurotransmitters or []
-        self.activity = 0.0
-        self.plasticity = 0.5  # Capacité à se modifier (0.0 à 1.0)
         self.development_stage = 0.0  # Stade de développement (0.0 à 1.0)
+        
+        # Graphe du cerveau qui stocke l'état de la région une fois rattachée (voir BrainGraph)
+        self._graph = None
+        self._index = -1
+        self._size = size
+        self._activity = 0.0
+        self._plasticity = 0.5  # Capacité à se modifier (0.0 à 1.0)
+    
+    @property
+    def size(self) -> float:
+        """Taille relative de la région."""
+        if self._graph is not None:
+            return float(self._graph.size[self._index])
+        return self._size
+    
+    @size.setter
+    def size(self, value: float) -> None:
+        if self._graph is not None:
+            self._graph.size[self._index] = value
+        else:
+            self._size = value
+    
+    @property
+    def activity(self) -> float:
+        """Niveau d'activité de la région (0.0 à 1.0)."""
+        if self._graph is not None:
+            return float(self._graph.activity[self._index])
+        return self._activity
+    
+    @activity.setter
+    def activity(self, value: float) -> None:
+        if self._graph is not None:
+            self._graph.activity[self._index] = value
+        else:
+            self._activity = value
+    
+    @property
+    def plasticity(self) -> float:
+        """Capacité de la région à se modifier (0.0 à 1.0)."""
+        if self._graph is not None:
+            return float(self._graph.plasticity[self._index])
+        return self._plasticity
+    
+    @plasticity.setter
+    def plasticity(self, value: float) -> None:
+        if self._graph is not None:
+            self._graph.plasticity[self._index] = value
+        else:
+            self._plasticity = value
     
     def calculate_activity(self, inputs: Dict[str, float], other_regions: Dict[str, 'BrainRegion']) -> float:
         """
@@ -644,13 +1256,17 @@ class BrainRegion:
         Returns:
             float: Niveau d'activité (0.0 à 1.0)
         """
+        # Région rattachée à un graphe : calcul sur la ligne correspondante de la matrice de connexions
+        if self._graph is not None:
+            return self._graph.update_region(self._index, inputs)
+        
         # Activité de base
         base_activity = 0.1
         
         # Contribution des entrées directes
         input_contribution = 0.0
         for input_name, input_value in inputs.items():
-            if input_name in self.functions:
+            if input_name in self._function_set:
                 input_contribution += input_value * 0.5
         
         # Contribution des connexions avec d'autres régions
@@ -670,754 +1286,856 @@ class BrainRegion:
         Args:
             learning_rate: Taux d'apprentissage
         """
-        # Ajuster la taille en fonction de l'activité
-        if self.activity > 0.7:  # Forte activité
-            self.size = min(2.0, self.size + learning_rate * self.plasticity * 0.1)
-        elif self.activity < 0.3:  # Faible activité
-            self.size = max(0.5, self.size - learning_rate * self.plasticity * 0.05)
+        activity = self.activity
+        plasticity = self.plasticity
+        
+        # Ajuster la taille en fonction de l'activité (bornes par comparaison directe)
+        if activity > 0.7:  # Forte activité
+            grown = self.size + learning_rate * plasticity * 0.1
+            self.size = 2.0 if grown > 2.0 else grown
+        elif activity < 0.3:  # Faible activité
+            shrunk = self.size - learning_rate * plasticity * 0.05
+            self.size = 0.5 if shrunk < 0.5 else shrunk
         
         # Ajuster la plasticité (diminue avec le temps)
-        self.plasticity = max(0.1, self.plasticity - 0.001)
+        reduced = plasticity - 0.001
+        self.plasticity = 0.1 if reduced < 0.1 else reduced
 
-class Brain:
-    """Représente un cerveau avec ses régions et fonctions."""
+@njit("float64(float64[:, :], float64[:], float64[:], float64[:], float64[:], float64[:], float64[:], float64, boolean)",
+      cache=True, fastmath=True)
+def _brain_step_kernel(weights, base, activity, inputs, out, size, plasticity, learning_rate, adapt):
+    """
+    Calcule out = min(1, base + inputs + weights @ activity) en une seule passe, en adaptant
+    au passage chaque région à sa nouvelle activité si demandé (voir _brain_adapt_kernel).
     
-    def __init__(self, complexity: NeuralComplexity = NeuralComplexity.NONE):
-        """
-        Initialise un cerveau.
+    Args:
+        weights: Matrice des connexions (R, R)
+        base: Activité de base par région
+        activity: Activités du pas précédent
+        inputs: Contribution des entrées par région
+        out: Activités du nouveau pas (remplies en place)
+        size: Tailles des régions (mises à jour en place si adapt)
+        plasticity: Plasticités des régions (mises à jour en place si adapt)
+        learning_rate: Taux d'apprentissage
+        adapt: Adapter les régions après le calcul de leur activité
         
-        Args:
-            complexity: Niveau de complexité neurale
-        """
-        self.complexity = complexity
-        self.regions = {}  # {region_id: BrainRegion}
-        self.total_size = 0.0
-        self.energy_consumption = 0.0
-        self.cognitive_abilities = {}  # {ability_name: level}
+    Returns:
+        float: Taille totale des régions après adaptation (0.0 sans adaptation)
+    """
+    total_size = 0.0
+    for i in range(weights.shape[0]):
+        drive = base[i] + inputs[i]
+        for j in range(weights.shape[1]):
+            drive += weights[i, j] * activity[j]
+        level = 1.0 if drive > 1.0 else drive
+        out[i] = level
         
-        # Initialiser les régions selon la complexité
-        self._initialize_regions()
+        if adapt:
+            if level > 0.7:  # Forte activité
+                grown = size[i] + learning_rate * plasticity[i] * 0.1
+                size[i] = 2.0 if grown > 2.0 else grown
+            elif level < 0.3:  # Faible activité
+                shrunk = size[i] - learning_rate * plasticity[i] * 0.05
+                size[i] = 0.5 if shrunk < 0.5 else shrunk
+            
+            reduced = plasticity[i] - 0.001
+            plasticity[i] = 0.1 if reduced < 0.1 else reduced
+            total_size += size[i]
     
-    def _initialize_regions(self) -> None:
-        """Initialise les régions cérébrales selon le niveau de complexité."""
-        if self.complexity == NeuralComplexity.NONE:
-            return
-            
-        elif self.complexity == NeuralComplexity.NERVE_NET:
-            # Réseau nerveux simple
-            self.regions["sensory"] = BrainRegion(
-                "sensory",
-                "Réseau sensoriel",
-                ["sensation"],
-                1.0,
-                {"motor": 0.8},
-                ["acetylcholine"]
-            )
-            
-            self.regions["motor"] = BrainRegion(
-                "motor",
-                "Réseau moteur",
-                ["movement"],
-                1.0,
-                {},
-                ["acetylcholine"]
-            )
-            
-        elif self.complexity == NeuralComplexity.GANGLIA:
-            # Ganglions cérébraux
-            self.regions["cephalic_ganglion"] = BrainRegion(
-                "cephalic_ganglion",
-                "Ganglion céphalique",
-                ["sensation", "integration"],
-                1.2,
-                {"motor_ganglion": 0.7},
-                ["acetylcholine", "dopamine"]
-            )
-            
-            self.regions["motor_ganglion"] = BrainRegion(
-                "motor_ganglion",
-                "Ganglion moteur",
-                ["movement", "coordination"],
-                1.0,
-                {},
-                ["acetylcholine"]
-            )
-            
-        elif self.complexity == NeuralComplexity.CENTRAL_NERVOUS_SYSTEM:
-            # Système nerveux central simple
-            self.regions["brain"] = BrainRegion(
-                "brain",
-                "Cerveau primitif",
-                ["sensation", "integration", "decision"],
-                1.5,
-                {"spinal_cord": 0.9},
-                ["acetylcholine", "dopamine", "serotonin"]
-            )
-            
-            self.regions["spinal_cord"] = BrainRegion(
-                "spinal_cord",
-                "Moelle épinière",
-                ["reflexes", "movement"],
-                1.0,
-                {},
-                ["acetylcholine", "GABA"]
-            )
-            
-        elif self.complexity == NeuralComplexity.BRAIN_SPINAL_CORD:
-            # Cerveau et moelle épinière
-            self.regions["forebrain"] = BrainRegion(
-                "forebrain",
-                "Prosencéphale",
-                ["sensation", "integration", "memory"],
-                1.8,
-                {"midbrain": 0.8, "hindbrain": 0.6},
-                ["acetylcholine", "dopamine", "serotonin", "GABA"]
-            )
-            
-            self.regions["midbrain"] = BrainRegion(
-                "midbrain",
-                "Mésencéphale",
-                ["vision", "hearing", "motor_coordination"],
-                1.2,
-                {"hindbrain": 0.7, "spinal_cord": 0.8},
-                ["acetylcholine", "dopamine"]
-            )
-            
-            self.regions["hindbrain"] = BrainRegion(
-                "hindbrain",
-                "Rhombencéphale",
-                ["balance", "basic_functions"],
-                1.0,
-                {"spinal_cord": 0.9},
-                ["acetylcholine", "GABA"]
-            )
-            
-            self.regions["spinal_cord"] = BrainRegion(
-                "spinal_cord",
-                "Moelle épinière",
-                ["reflexes", "movement"],
-                1.0,
-                {},
-                ["acetylcholine", "GABA"]
-            )
-            
-        elif self.complexity == NeuralComplexity.COMPLEX_BRAIN:
-            # Cerveau complexe
-            self.regions["cerebrum"] = BrainRegion(
-                "cerebrum",
-                "Cerveau",
-                ["cognition", "sensation", "movement", "memory"],
-                2.5,
-                {"thalamus": 0.9, "cerebellum": 0.7, "brainstem": 0.6},
-                ["glutamate", "GABA", "dopamine", "serotonin"]
-            )
-            
-            self.regions["thalamus"] = BrainRegion(
-                "thalamus",
-                "Thalamus",
-                ["sensory_relay", "motor_relay"],
-                1.0,
-                {"cerebrum": 0.9, "brainstem": 0.8},
-                ["glutamate", "GABA"]
-            )
-            
-            self.regions["cerebellum"] = BrainRegion(
-                "cerebellum",
-                "Cervelet",
-                ["motor_coordination", "balance", "timing"],
-                1.5,
-                {"brainstem": 0.8},
-                ["GABA", "glutamate"]
-            )
-            
-            self.regions["brainstem"] = BrainRegion(
-                "brainstem",
-                "Tronc cérébral",
-                ["basic_functions", "reflexes"],
-                1.0,
-                {"spinal_cord": 0.9},
-                ["acetylcholine", "norepinephrine"]
-            )
-            
-            self.regions["spinal_cord"] = BrainRegion(
-                "spinal_cord",
-                "Moelle épinière",
-                ["reflexes", "movement"],
-                1.0,
-                {},
-                ["acetylcholine", "GABA"]
-            )
-            
-        elif self.complexity == NeuralComplexity.NEOCORTEX:
-            # Cerveau avec néocortex
-            self.regions["frontal_lobe"] = BrainRegion(
-                "frontal_lobe",
-                "Lobe frontal",
-                ["executive_function", "planning", "personality"],
-                2.0,
-                {"parietal_lobe": 0.8, "temporal_lobe": 0.7, "limbic_system": 0.9},
-                ["glutamate", "GABA", "dopamine"]
-            )
-            
-            self.regions["parietal_lobe"] = BrainRegion(
-                "parietal_lobe",
-                "Lobe pariétal",
-                ["sensory_integration", "spatial_awareness"],
-                1.5,
-                {"occipital_lobe": 0.8, "temporal_lobe": 0.7},
-                ["glutamate", "GABA"]
-            )
-            
-            self.regions["temporal_lobe"] = BrainRegion(
-                "temporal_lobe",
-                "Lobe temporal",
-                ["auditory_processing", "memory", "language"],
-                1.5,
-                {"occipital_lobe": 0.6, "limbic_system": 0.8},
-                ["glutamate", "GABA"]
-            )
-            
-            self.regions["occipital_lobe"] = BrainRegion(
-                "occipital_lobe",
-                "Lobe occipital",
-                ["visual_processing"],
-                1.2,
-                {},
-                ["glutamate", "GABA"]
-            )
-            
-            self.regions["limbic_system"] = BrainRegion(
-                "limbic_system",
-                "Système limbique",
-                ["emotion", "memory", "motivation"],
-                1.0,
-                {"brainstem": 0.7},
-                ["dopamine", "serotonin", "norepinephrine"]
-            )
-            
-            self.regions["cerebellum"] = BrainRegion(
-                "cerebellum",
-                "Cervelet",
-                ["motor_coordination", "balance", "timing"],
-                1.5,
-                {"brainstem": 0.8},
-                ["GABA", "glutamate"]
-            )
-            
-            self.regions["brainstem"] = BrainRegion(
-                "brainstem",
-                "Tronc cérébral",
-                ["basic_functions", "reflexes"],
-                1.0,
-                {"spinal_cord": 0.9},
-                ["acetylcholine", "norepinephrine"]
-            )
-            
-        elif self.complexity == NeuralComplexity.PREFRONTAL_CORTEX:
-            # Cerveau avec cortex préfrontal développé
-            self.regions["prefrontal_cortex"] = BrainRegion(
-                "prefrontal_cortex",
-                "Cortex préfrontal",
-                ["executive_function", "decision_making", "social_behavior", "working_memory"],
-                2.5,
-                {"frontal_lobe": 0.9, "limbic_system": 0.8},
-                ["glutamate", "GABA", "dopamine"]
-            )
-            
-            self.regions["frontal_lobe"] = BrainRegion(
-                "frontal_lobe",
-                "Lobe frontal",
-                ["motor_control", "planning", "personality"],
-                2.0,
-                {"parietal_lobe": 0.8, "temporal_lobe": 0.7},
-                ["glutamate", "GABA", "dopamine"]
-            )
-            
-            self.regions["parietal_lobe"] = BrainRegion(
-                "parietal_lobe",
-                "Lobe pariétal",
-                ["sensory_integration", "spatial_awareness"],
-                1.5,
-                {"occipital_lobe": 0.8, "temporal_lobe": 0.7},
-                ["glutamate", "GABA"]
-            )
-            
-            self.regions["temporal_lobe"] = BrainRegion(
-                "temporal_lobe",
-                "Lobe temporal",
-                ["auditory_processing", "memory", "language"],
-                1.5,
-                {"occipital_lobe": 0.6, "limbic_system": 0.8},
-                ["glutamate", "GABA"]
-            )
-            
-            self.regions["occipital_lobe"] = BrainRegion(
-                "occipital_lobe",
-                "Lobe occipital",
-                ["visual_processing"],
-                1.2,
-                {},
-                ["glutamate", "GABA"]
-            )
-            
-            self.regions["limbic_system"] = BrainRegion(
-                "limbic_system",
-                "Système limbique",
-                ["emotion", "memory", "motivation"],
-                1.0,
-                {"brainstem": 0.7},
-                ["dopamine", "serotonin", "norepinephrine"]
-            )
-            
-            self.regions["basal_ganglia"] = BrainRegion(
-                "basal_ganglia",
-                "Ganglions de la base",
-                ["motor_control", "procedural_learning"],
-                1.2,
-                {"thalamus": 0.8, "brainstem": 0.6},
-                ["dopamine", "GABA", "glutamate"]
-            )
-            
-            self.regions["cerebellum"] = BrainRegion(
-                "cerebellum",
-                "Cervelet",
-                ["motor_coordination", "balance", "cognitive_functions"],
-                1.5,
-                {"brainstem": 0.8},
-                ["GABA", "glutamate"]
-            )
-            
-            self.regions["brainstem"] = BrainRegion(
-                "brainstem",
-                "Tronc cérébral",
-                ["basic_functions", "reflexes"],
-                1.0,
-                {"spinal_cord": 0.9},
-                ["acetylcholine", "norepinephrine"]
-            )
-        
-        # Calculer la taille totale et la consommation d'énergie
-        self._update_metrics()
+    return total_size
+
+@njit("float64(float64[:], float64[:], float64[:], float64)", cache=True, fastmath=True)
+def _brain_adapt_kernel(activity, size, plasticity, learning_rate):
+    """
+    Applique BrainRegion.adapt à toutes les régions en une seule passe.
     
-    def _update_metrics(self) -> None:
-        """Met à jour les métriques du cerveau."""
-        self.total_size = sum(region.size for region in self.regions.values())
+    Args:
+        activity: Activités des régions
+        size: Tailles des régions (mises à jour en place)
+        plasticity: Plasticités des régions (mises à jour en place)
+        learning_rate: Taux d'apprentissage
         
-        # La consommation d'énergie augmente avec la complexité
-        base_consumption = {
-            NeuralComplexity.NONE: 0.0,
-            NeuralComplexity.NERVE_NET: 0.1,
-            NeuralComplexity.GANGLIA: 0.2,
-            NeuralComplexity.LADDER: 0.3,
-            NeuralComplexity.CENTRAL_NERVOUS_SYSTEM: 0.5,
-            NeuralComplexity.BRAIN_SPINAL_CORD: 0.8,
-            NeuralComplexity.COMPLEX_BRAIN: 1.2,
-            NeuralComplexity.NEOCORTEX: 1.8,
-            NeuralComplexity.PREFRONTAL_CORTEX: 2.5
-        }
+    Returns:
+        float: Taille totale des régions après adaptation
+    """
+    total_size = 0.0
+    for i in range(activity.shape[0]):
+        if activity[i] > 0.7:  # Forte activité
+            grown = size[i] + learning_rate * plasticity[i] * 0.1
+            size[i] = 2.0 if grown > 2.0 else grown
+        elif activity[i] < 0.3:  # Faible activité
+            shrunk = size[i] - learning_rate * plasticity[i] * 0.05
+            size[i] = 0.5 if shrunk < 0.5 else shrunk
         
-        self.energy_consumption = base_consumption.get(self.complexity, 0.0) * self.total_size / 10.0
+        # La plasticité diminue avec le temps
+        reduced = plasticity[i] - 0.001
+        plasticity[i] = 0.1 if reduced < 0.1 else reduced
         
-        # Mettre à jour les capacités cognitives
-        self._update_cognitive_abilities()
+        total_size += size[i]
     
-    def _update_cognitive_abilities(self) -> None:
-        """Met à jour les capacités cognitives en fonction des régions cérébrales."""
-        # Réinitialiser les capacités
-        self.cognitive_abilities = {
-            "perception": 0.0,
-            "motor_control": 0.0,
-            "learning": 0.0,
-            "memory": 0.0,
-            "decision_making": 0.0,
-            "social_cognition": 0.0,
-            "language": 0.0,
-            "tool_use": 0.0,
-            "consciousness": 0.0
-        }
+    return total_size
+
+class BrainGraph:
+    """
+    État des régions d'un cerveau stocké par colonnes, avec une matrice de connexions.
+    
+    Les régions sont indexées de 0 à R-1 ; les objets BrainRegion rattachés au graphe lisent
+    et écrivent leur taille, leur activité et leur plasticité dans les tableaux du graphe.
+    """
+    
+    def __init__(self, regions: Dict[str, BrainRegion], base_activity: float = 0.1):
+        """
+        Construit le graphe à partir des régions d'un cerveau et y rattache les régions.
         
-        # Capacités de base selon la complexité
-        base_abilities = {
-            NeuralComplexity.NONE: {},
-            NeuralComplexity.NERVE_NET: {
-                "perception": 0.2,
-                "motor_control": 0.1
-            },
-            NeuralComplexity.GANGLIA: {
-                "perception": 0.3,
-                "motor_control": 0.2,
-                "learning": 0.1
-            },
-            NeuralComplexity.LADDER: {
-                "perception": 0.4,
-                "motor_control": 0.3,
-                "learning": 0.2,
-                "memory": 0.1
-            },
-            NeuralComplexity.CENTRAL_NERVOUS_SYSTEM: {
-                "perception": 0.5,
-                "motor_control": 0.4,
-                "learning": 0.3,
-                "memory": 0.2,
-                "decision_making": 0.1
-            },
-            NeuralComplexity.BRAIN_SPINAL_CORD: {
-                "perception": 0.6,
-                "motor_control": 0.5,
-                "learning": 0.4,
-                "memory": 0.3,
-                "decision_making": 0.2,
-                "social_cognition": 0.1
-            },
-            NeuralComplexity.COMPLEX_BRAIN: {
-                "perception": 0.7,
-                "motor_control": 0.6,
-                "learning": 0.5,
-                "memory": 0.5,
-                "decision_making": 0.4,
-                "social_cognition": 0.3,
-                "tool_use": 0.1,
-                "consciousness": 0.1
-            },
-            NeuralComplexity.NEOCORTEX: {
-                "perception": 0.8,
-                "motor_control": 0.7,
-                "learning": 0.7,
-                "memory": 0.7,
-                "decision_making": 0.6,
-                "social_cognition": 0.5,
-                "language": 0.3,
-                "tool_use": 0.4,
-                "consciousness": 0.3
-            },
-            NeuralComplexity.PREFRONTAL_CORTEX: {
-                "perception": 0.9,
-                "motor_control": 0.8,
-                "learning": 0.9,
-                "memory": 0.8,
-                "decision_making": 0.9,
-                "social_cognition": 0.8,
-                "language": 0.7,
-                "tool_use": 0.8,
-                "consciousness": 0.7
-            }
-        }
+        Args:
+            regions: Régions cérébrales {region_id: BrainRegion}
+            base_activity: Activité de base de chaque région
+        """
+        self.names = list(regions)
+        self.index = {region_id: i for i, region_id in enumerate(self.names)}
+        n = len(self.names)
         
-        # Appliquer les capacités de base
-        for ability, level in base_abilities.get(self.complexity, {}).items():
-            self.cognitive_abilities[ability] = level
+        # Matrice des connexions : weights[i, j] = force de la connexion de la région i vers la région j
+        self.weights = np.zeros((n, n))
+        self.edges = np.zeros((n, n), dtype=bool)  # Connexions existantes (même de force nulle)
+        self.base = np.full(n, base_activity)
+        self.size = np.empty(n)
+        self.activity = np.empty(n)
+        self.plasticity = np.empty(n)
+        self._next_activity = np.empty(n)  # Tampon échangé avec activity à chaque pas
         
-        # Ajuster en fonction des régions spécifiques
-        for region in self.regions.values():
-            # Perception
-            if any(f in ["sensation", "sensory_integration", "visual_processing", "auditory_processing"] 
-                  for f in region.functions):
-                self.cognitive_abilities["perception"] += 0.1 * region.size
-                
-            # Contrôle moteur
-            if any(f in ["movement", "motor_coordination", "motor_control"] 
-                  for f in region.functions):
-                self.cognitive_abilities["motor_control"] += 0.1 * region.size
-                
-            # Apprentissage
-            if any(f in ["learning", "procedural_learning"] 
-                  for f in region.functions):
-                self.cognitive_abilities["learning"] += 0.1 * region.size
-                
-            # Mémoire
-            if "memory" in region.functions:
-                self.cognitive_abilities["memory"] += 0.1 * region.size
-                
-            # Prise de décision
-            if any(f in ["decision_making", "executive_function", "planning"] 
-                  for f in region.functions):
-                self.cognitive_abilities["decision_making"] += 0.1 * region.size
-                
-            # Cognition sociale
-            if any(f in ["social_behavior", "emotion"] 
-                  for f in region.functions):
-                self.cognitive_abilities["social_cognition"] += 0.1 * region.size
-                
-            # Langage
-            if "language" in region.functions:
-                self.cognitive_abilities["language"] += 0.1 * region.size
-                
-            # Utilisation d'outils
-            if any(f in ["tool_use", "planning", "spatial_awareness"] 
-                  for f in region.functions):
-                self.cognitive_abilities["tool_use"] += 0.1 * region.size
-                
-            # Conscience
-            if any(f in ["consciousness", "executive_function", "working_memory"] 
-                  for f in region.functions):
-                self.cognitive_abilities["consciousness"] += 0.1 * region.size
+        # ability_matrix[i, a] = 1 si la région i contribue à la capacité _COGNITIVE_ABILITIES[a]
+        self.ability_matrix = np.zeros((n, len(_COGNITIVE_ABILITIES)))
         
-        # Limiter les valeurs entre 0 et 1
-        for ability in self.cognitive_abilities:
-            self.cognitive_abilities[ability] = min(1.0, self.cognitive_abilities[ability])
+        # Contribution d'une entrée de chaque fonction : 0.5 pour les régions qui la remplissent
+        input_map = {}
+        
+        for i, region in enumerate(regions.values()):
+            self.size[i] = region.size
+            self.activity[i] = region.activity
+            self.plasticity[i] = region.plasticity
+            
+            mask = region.ability_mask
+            for a in range(len(_COGNITIVE_ABILITIES)):
+                if mask & (1 << a):
+                    self.ability_matrix[i, a] = 1.0
+            
+            for target_id, strength in region.connections.items():
+                j = self.index.get(target_id)
+                if j is not None:
+                    self.weights[i, j] = strength
+                    self.edges[i, j] = True
+            
+            for function in region._function_set:
+                if function not in input_map:
+                    input_map[function] = np.zeros(n)
+                input_map[function][i] = 0.5
+        
+        self.input_map = input_map
+        
+        # sensory_matrix[k] = contribution de l'entrée _SENSORY_INPUTS[k] pour chaque région
+        self.sensory_matrix = np.array([input_map.get(name, np.zeros(n)) for name in _SENSORY_INPUTS])
+        
+        # Indices des régions qui pilotent chaque sortie comportementale (voir Brain.process_inputs)
+        self.output_groups = {
+            output: np.array([i for i, region in enumerate(regions.values())
+                              if not region._function_set.isdisjoint(functions)], dtype=np.intp)
+            for output, functions in _OUTPUT_REGION_FUNCTIONS.items()
+        }
+        
+        # Rattacher les régions au graphe
+        for i, region in enumerate(regions.values()):
+            region._graph = self
+            region._index = i
     
-    def process_inputs(self, sensory_inputs: Dict[str, float]) -> Dict[str, float]:
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def clone(self, regions: Dict[str, BrainRegion]) -> 'BrainGraph':
         """
-        Traite les entrées sensorielles et génère des sorties comportementales.
+        Copie le graphe pour des régions identiques à celles qui l'ont construit, et les y rattache.
+        
+        Les tableaux modifiés par la simulation sont copiés ; les structures dérivées des fonctions
+        des régions (entrées, capacités, groupes de sorties) sont partagées.
         
         Args:
-            sensory_inputs: Entrées sensorielles {type: intensité}
+            regions: Régions de même identifiants, dans le même ordre, que celles du graphe
             
         Returns:
-            Dict[str, float]: Sorties comportementales {comportement: intensité}
+            BrainGraph: Nouveau graphe
         """
-        # Si pas de cerveau, réponses réflexes simples
-        if self.complexity == NeuralComplexity.NONE:
-            return {
-                "reflex_response": max(0.0, min(1.0, sum(sensory_inputs.values()) / len(sensory_inputs)))
-            }
+        graph = copy.copy(self)
+        graph.weights = self.weights.copy()
+        graph.size = self.size.copy()
+        graph.activity = self.activity.copy()
+        graph.plasticity = self.plasticity.copy()
+        graph._next_activity = np.empty_like(self._next_activity)
         
-        # Propager l'activité à travers les régions
-        for region_id, region in self.regions.items():
-            region.calculate_activity(sensory_inputs, self.regions)
+        for i, region in enumerate(regions.values()):
+            region._graph = graph
+            region._index = i
         
-        # Générer des sorties comportementales en fonction des capacités cognitives
-        behavioral_outputs = {}
+        return graph
+    
+    def input_vector(self, inputs: Dict[str, float]) -> np.ndarray:
+        """
+        Convertit des entrées nommées en contributions directes par région.
         
-        # Réponses motrices de base
-        if "motor_control" in self.cognitive_abilities:
-            motor_regions = [r for r in self.regions.values() 
-                           if any(f in ["movement", "motor_control", "motor_coordination"] 
-                                for f in r.functions)]
+        Args:
+            inputs: Entrées sensorielles ou cognitives {fonction: intensité}
             
-            if motor_regions:
-                motor_activity = sum(r.activity for r in motor_regions) / len(motor_regions)
-                behavioral_outputs["movement"] = motor_activity * self.cognitive_abilities["motor_control"]
+        Returns:
+            np.ndarray: Contribution des entrées pour chaque région
+        """
+        contributions = np.zeros(len(self.names))
         
-        # Réponses émotionnelles
-        if "social_cognition" in self.cognitive_abilities and self.cognitive_abilities["social_cognition"] > 0.2:
-            emotional_regions = [r for r in self.regions.values() 
-                               if "emotion" in r.functions]
-            
-            if emotional_regions:
-                emotional_activity = sum(r.activity for r in emotional_regions) / len(emotional_regions)
-                behavioral_outputs["emotional_response"] = emotional_activity * self.cognitive_abilities["social_cognition"]
+        for input_name, input_value in inputs.items():
+            indicator = self.input_map.get(input_name)
+            if indicator is not None:
+                contributions += input_value * indicator
         
-        # Prise de décision
-        if "decision_making" in self.cognitive_abilities and self.cognitive_abilities["decision_making"] > 0.3:
-            decision_regions = [r for r in self.regions.values() 
-                              if any(f in ["decision_making", "executive_function"] 
-                                   for f in r.functions)]
-            
-            if decision_regions:
-                decision_activity = sum(r.activity for r in decision_regions) / len(decision_regions)
-                behavioral_outputs["decision"] = decision_activity * self.cognitive_abilities["decision_making"]
+        return contributions
+    
+    def update_region(self, i: int, inputs: Dict[str, float]) -> float:
+        """
+        Met à jour l'activité d'une seule région à partir des activités actuelles des autres.
         
-        # Apprentissage
-        if "learning" in self.cognitive_abilities and self.cognitive_abilities["learning"] > 0.4:
-            # Adapter les régions en fonction de leur activité
-            learning_rate = 0.05 * self.cognitive_abilities["learning"]
-            for region in self.regions.values():
-                region.adapt(learning_rate)
+        Args:
+            i: Indice de la région
+            inputs: Entrées sensorielles ou cognitives {fonction: intensité}
             
-            behavioral_outputs["learning"] = self.cognitive_abilities["learning"] * 0.5
+        Returns:
+            float: Niveau d'activité de la région (0.0 à 1.0)
+        """
+        drive = self.base[i] + float(self.weights[i] @ self.activity)
+        for input_name, input_value in inputs.items():
+            indicator = self.input_map.get(input_name)
+            if indicator is not None:
+                drive += input_value * indicator[i]
         
-        # Utilisation d'outils (pour les niveaux supérieurs)
-        if "tool_use" in self.cognitive_abilities and self.cognitive_abilities["tool_use"] > 0.3:
-            tool_regions = [r for r in self.regions.values() 
-                          if any(f in ["planning", "spatial_awareness", "tool_use"] 
-                               for f in r.functions)]
-            
-            if tool_regions:
-                tool_activity = sum(r.activity for r in tool_regions) / len(tool_regions)
-                behavioral_outputs["tool_use"] = tool_activity * self.cognitive_abilities["tool_use"]
+        self.activity[i] = min(1.0, drive)
+        return float(self.activity[i])
+    
+    def reinforce_connections(self) -> None:
+        """
+        Renforce les connexions entre régions actives ensemble et affaiblit celles entre régions peu actives.
         
-        # Communication (pour les niveaux supérieurs)
-        if "language" in self.cognitive_abilities and self.cognitive_abilities["language"] > 0.2:
-            language_regions = [r for r in self.regions.values() 
-                              if "language" in r.functions]
-            
-            if language_regions:
-                language_activity = sum(r.activity for r in language_regions) / len(language_regions)
-                behavioral_outputs["communication"] = language_activity * self.cognitive_abilities["language"]
+        Seule la matrice des connexions est modifiée ; store_connections reporte le résultat dans les régions.
+        """
+        active = self.activity > 0.5
+        quiet = self.activity < 0.2
         
-        # Mettre à jour les métriques
-        self._update_metrics()
+        # Si les deux régions sont actives ensemble, renforcer la connexion
+        strengthened = np.outer(active, active) & self.edges
+        self.weights[strengthened] = np.minimum(1.0, self.weights[strengthened] + 0.1)
         
-        return behavioral_outputs
+        # Si elles sont rarement actives ensemble, affaiblir la connexion
+        weakened = np.outer(quiet, quiet) & self.edges
+        self.weights[weakened] = np.maximum(0.1, self.weights[weakened] - 0.05)
     
-    def evolve(self, generations: int = 10, learning_experiences: int = 5) -> None:
+    def store_connections(self, regions: Dict[str, BrainRegion]) -> None:
         """
-        Fait évoluer le cerveau sur plusieurs générations avec apprentissage.
+        Reporte les forces de la matrice des connexions dans les dictionnaires des régions.
         
         Args:
-            generations: Nombre de générations
-            learning_experiences: Nombre d'expériences d'apprentissage par génération
+            regions: Régions ayant servi à construire le graphe
         """
-        for gen in range(generations):
-            # Simuler des expériences d'apprentissage
-            for _ in range(learning_experiences):
-                # Générer des entrées sensorielles aléatoires
-                sensory_inputs = {
-                    "visual": random.uniform(0.0, 1.0),
-                    "auditory": random.uniform(0.0, 1.0),
-                    "tactile": random.uniform(0.0, 1.0),
-                    "olfactory": random.uniform(0.0, 1.0)
-                }
-                
-                # Traiter les entrées
-                self.process_inputs(sensory_inputs)
+        for i, region in enumerate(regions.values()):
+            connections = region.connections
+            for target_id in connections:
+                j = self.index.get(target_id)
+                if j is not None:
+                    connections[target_id] = float(self.weights[i, j])
+    
+    def step(self, inputs_vec: np.ndarray) -> np.ndarray:
+        """
+        Met à jour l'activité de toutes les régions en une passe.
+        
+        Toutes les régions sont mises à jour simultanément à partir des activités du pas précédent.
+        
+        Args:
+            inputs_vec: Contribution des entrées pour chaque région (voir input_vector)
             
-            # Évolution structurelle (rare)
-            if random.random() < 0.2:
-                # Possibilité d'ajouter une nouvelle région
-                if self.complexity.value >= NeuralComplexity.CENTRAL_NERVOUS_SYSTEM.value:
-                    if random.random() < 0.1:
-                        # Créer une nouvelle région spécialisée
-                        region_id = f"specialized_region_{len(self.regions) + 1}"
-                        functions = random.sample(
-                            ["sensory_processing", "motor_control", "memory", "emotion", 
-                             "decision_making", "attention", "spatial_awareness"],
-                            k=random.randint(1, 3)
-                        )
-                        
-                        # Connexions avec les régions existantes
-                        connections = {}
-                        for existing_id in self.regions:
-                            if random.random() < 0.3:
-                                connections[existing_id] = random.uniform(0.1, 0.9)
-                        
-                        # Créer la région
-                        new_region = BrainRegion(
-                            region_id,
-                            f"Région spécialisée {len(self.regions) + 1}",
-                            functions,
-                            0.5,  # Taille initiale réduite
-                            connections,
-                            random.sample(["glutamate", "GABA", "dopamine", "serotonin"], k=2)
-                        )
-                        
-                        # Ajouter la région
-                        self.regions[region_id] = new_region
-                
-                # Renforcer les connexions les plus utilisées
-                for region in self.regions.values():
-                    for target_id in list(region.connections.keys()):
-                        if target_id in self.regions:
-                            target = self.regions[target_id]
-                            
-                            # Si les deux régions sont actives ensemble, renforcer la connexion
-                            if region.activity > 0.5 and target.activity > 0.5:
-                                region.connections[target_id] = min(1.0, region.connections[target_id] + 0.1)
-                            # Si elles sont rarement actives ensemble, affaiblir la connexion
-                            elif region.activity < 0.2 and target.activity < 0.2:
-                                region.connections[target_id] = max(0.1, region.connections[target_id] - 0.05)
+        Returns:
+            np.ndarray: Activités des régions (0.0 à 1.0)
+        """
+        if NUMBA_ENABLED:
+            _brain_step_kernel(self.weights, self.base, self.activity, inputs_vec, self._next_activity,
+                               self.size, self.plasticity, 0.0, False)
+        else:
+            self._propagate(inputs_vec)
+        
+        self.activity, self._next_activity = self._next_activity, self.activity
+        return self.activity
+    
+    def step_adapt(self, inputs_vec: np.ndarray, learning_rate: float) -> float:
+        """
+        Met à jour l'activité de toutes les régions puis les adapte à cette activité (step suivi d'adapt).
+        
+        Args:
+            inputs_vec: Contribution des entrées pour chaque région (voir input_vector)
+            learning_rate: Taux d'apprentissage
             
-            # Mettre à jour les métriques
-            self._update_metrics()
+        Returns:
+            float: Taille totale des régions après adaptation
+        """
+        if not NUMBA_ENABLED:
+            self.step(inputs_vec)
+            return self.adapt(learning_rate)
+        
+        total_size = _brain_step_kernel(self.weights, self.base, self.activity, inputs_vec, self._next_activity,
+                                        self.size, self.plasticity, learning_rate, True)
+        self.activity, self._next_activity = self._next_activity, self.activity
+        return total_size
+    
+    def _propagate(self, inputs_vec: np.ndarray) -> None:
+        """Calcule les activités du pas suivant dans le tampon (version NumPy de _brain_step_kernel)."""
+        np.matmul(self.weights, self.activity, out=self._next_activity)
+        self._next_activity += self.base
+        self._next_activity += inputs_vec
+        np.minimum(self._next_activity, 1.0, out=self._next_activity)
+    
+    def adapt(self, learning_rate: float = 0.1) -> float:
+        """
+        Adapte toutes les régions en fonction de leur activité (voir BrainRegion.adapt).
+        
+        Args:
+            learning_rate: Taux d'apprentissage
+            
+        Returns:
+            float: Taille totale des régions après adaptation
+        """
+        if NUMBA_ENABLED:
+            return _brain_adapt_kernel(self.activity, self.size, self.plasticity, learning_rate)
+        
+        # Seules les régions très ou peu actives changent de taille (et sont alors bornées)
+        high = self.activity > 0.7
+        low = self.activity < 0.3
+        self.size[high] = np.minimum(self.size[high] + learning_rate * self.plasticity[high] * 0.1, 2.0)
+        self.size[low] = np.maximum(self.size[low] - learning_rate * self.plasticity[low] * 0.05, 0.5)
+        
+        np.subtract(self.plasticity, 0.001, out=self.plasticity)
+        np.maximum(self.plasticity, 0.1, out=self.plasticity)
+        return float(self.size.sum())
 
-# Fonctions utilitaires pour créer des organismes avec différents niveaux d'évolution
-def create_unicellular_organism() -> Dict[str, Any]:
+class _RegionSpec(NamedTuple):
+    """Modèle immuable d'une région cérébrale, partagé par tous les cerveaux d'un même niveau."""
+    id: str
+    name: str
+    functions: Tuple[str, ...]
+    size: float
+    connections: Mapping[str, float]
+    neurotransmitters: Tuple[str, ...]
+
+
+def _region_spec(region_id: str, name: str, functions: List[str], size: float,
+                 connections: Dict[str, float], neurotransmitters: List[str]) -> _RegionSpec:
     """
-    Crée un organisme unicellulaire de base.
+    Construit le modèle figé d'une région cérébrale.
     
+    Args:
+        region_id: Identifiant unique de la région
+        name: Nom de la région
+        functions: Fonctions de la région
+        size: Taille relative de la région
+        connections: Connexions avec d'autres régions {region_id: force}
+        neurotransmitters: Neurotransmetteurs utilisés par cette région
+        
     Returns:
-        Dict[str, Any]: Données de l'organisme
+        _RegionSpec: Modèle de la région (fonctions et neurotransmetteurs en tuples, connexions en lecture seule)
     """
-    return {
-        "id": str(uuid.uuid4()),
-        "type": "unicellular",
-        "multicellularity_type": MulticellularityType.NONE,
-        "neural_complexity": NeuralComplexity.NONE,
-        "genome": {
-            "size": 100,
-            "genes": [f"gene_{i}" for i in range(10)],
-            "regulatory_genes": [f"reg_{i}" for i in range(2)]
-        },
-        "metabolism": {
-            "efficiency": 0.5,
-            "photosynthetic": random.choice([True, False]),
-            "aerobic": True
-        },
-        "environment": {
-            "temperature": 25.0,
-            "stability": 0.7,
-            "predation_pressure": 0.3,
-            "resource_abundance": 0.6,
-            "spatial_structure": 0.4,
-            "aquatic": True
-        },
-        "population": {
-            "size": 1000,
-            "density": 50.0,
-            "reproduction_rate": 0.8,
-            "competition": 0.4
-        },
-        "behavior": {
-            "locomotion_complexity": 0.1,
-            "social_complexity": 0.0,
-            "feeding_complexity": 0.1,
-            "learning_capacity": 0.0
-        }
-    }
+    # Les noms sont internés : les tests d'appartenance comparent d'abord les identités
+    return _RegionSpec(sys.intern(region_id), name, tuple(sys.intern(f) for f in functions), size,
+                       MappingProxyType({sys.intern(k): v for k, v in connections.items()}),
+                       tuple(sys.intern(nt) for nt in neurotransmitters))
 
-def create_simple_multicellular_organism() -> Dict[str, Any]:
-    """
-    Crée un organisme multicellulaire simple.
+
+# Régions créées pour chaque niveau de complexité neurale (les niveaux absents n'ont pas de régions)
+_REGION_TEMPLATES: Dict[NeuralComplexity, Tuple[_RegionSpec, ...]] = {
+    # Réseau nerveux simple
+    NeuralComplexity.NERVE_NET: (
+        _region_spec("sensory", "Réseau sensoriel", ["sensation"], 1.0, {"motor": 0.8}, ["acetylcholine"]),
+        _region_spec("motor", "Réseau moteur", ["movement"], 1.0, {}, ["acetylcholine"]),
+    ),
+    # Ganglions cérébraux
+    NeuralComplexity.GANGLIA: (
+        _region_spec("cephalic_ganglion", "Ganglion céphalique", ["sensation", "integration"], 1.2,
+                     {"motor_ganglion": 0.7}, ["acetylcholine", "dopamine"]),
+        _region_spec("motor_ganglion", "Ganglion moteur", ["movement", "coordination"], 1.0,
+                     {}, ["acetylcholine"]),
+    ),
+    # Système nerveux central simple
+    NeuralComplexity.CENTRAL_NERVOUS_SYSTEM: (
+        _region_spec("brain", "Cerveau primitif", ["sensation", "integration", "decision"], 1.5,
+                     {"spinal_cord": 0.9}, ["acetylcholine", "dopamine", "serotonin"]),
+        _region_spec("spinal_cord", "Moelle épinière", ["reflexes", "movement"], 1.0,
+                     {}, ["acetylcholine", "GABA"]),
+    ),
+    # Cerveau et moelle épinière
+    NeuralComplexity.BRAIN_SPINAL_CORD: (
+        _region_spec("forebrain", "Prosencéphale", ["sensation", "integration", "memory"], 1.8,
+                     {"midbrain": 0.8, "hindbrain": 0.6}, ["acetylcholine", "dopamine", "serotonin", "GABA"]),
+        _region_spec("midbrain", "Mésencéphale", ["vision", "hearing", "motor_coordination"], 1.2,
+                     {"hindbrain": 0.7, "spinal_cord": 0.8}, ["acetylcholine", "dopamine"]),
+        _region_spec("hindbrain", "Rhombencéphale", ["balance", "basic_functions"], 1.0,
+                     {"spinal_cord": 0.9}, ["acetylcholine", "GABA"]),
+        _region_spec("spinal_cord", "Moelle épinière", ["reflexes", "movement"], 1.0,
+                     {}, ["acetylcholine", "GABA"]),
+    ),
+    # Cerveau complexe
+    NeuralComplexity.COMPLEX_BRAIN: (
+        _region_spec("cerebrum", "Cerveau", ["cognition", "sensation", "movement", "memory"], 2.5,
+                     {"thalamus": 0.9, "cerebellum": 0.7, "brainstem": 0.6}, ["glutamate", "GABA", "dopamine", "serotonin"]),
+        _region_spec("thalamus", "Thalamus", ["sensory_relay", "motor_relay"], 1.0,
+                     {"cerebrum": 0.9, "brainstem": 0.8}, ["glutamate", "GABA"]),
+        _region_spec("cerebellum", "Cervelet", ["motor_coordination", "balance", "timing"], 1.5,
+                     {"brainstem": 0.8}, ["GABA", "glutamate"]),
+        _region_spec("brainstem", "Tronc cérébral", ["basic_functions", "reflexes"], 1.0,
+                     {"spinal_cord": 0.9}, ["acetylcholine", "norepinephrine"]),
+        _region_spec("spinal_cord", "Moelle épinière", ["reflexes", "movement"], 1.0,
+                     {}, ["acetylcholine", "GABA"]),
+    ),
+    # Cerveau avec néocortex
+    NeuralComplexity.NEOCORTEX: (
+        _region_spec("frontal_lobe", "Lobe frontal", ["executive_function", "planning", "personality"], 2.0,
+                     {"parietal_lobe": 0.8, "temporal_lobe": 0.7, "limbic_system": 0.9}, ["glutamate", "GABA", "dopamine"]),
+        _region_spec("parietal_lobe", "Lobe pariétal", ["sensory_integration", "spatial_awareness"], 1.5,
+                     {"occipital_lobe": 0.8, "temporal_lobe": 0.7}, ["glutamate", "GABA"]),
+        _region_spec("temporal_lobe", "Lobe temporal", ["auditory_processing", "memory", "language"], 1.5,
+                     {"occipital_lobe": 0.6, "limbic_system": 0.8}, ["glutamate", "GABA"]),
+        _region_spec("occipital_lobe", "Lobe occipital", ["visual_processing"], 1.2,
+                     {}, ["glutamate", "GABA"]),
+        _region_spec("limbic_system", "Système limbique", ["emotion", "memory", "motivation"], 1.0,
+                     {"brainstem": 0.7}, ["dopamine", "serotonin", "norepinephrine"]),
+        _region_spec("cerebellum", "Cervelet", ["motor_coordination", "balance", "timing"], 1.5,
+                     {"brainstem": 0.8}, ["GABA", "glutamate"]),
+        _region_spec("brainstem", "Tronc cérébral", ["basic_functions", "reflexes"], 1.0,
+                     {"spinal_cord": 0.9}, ["acetylcholine", "norepinephrine"]),
+    ),
+    # Cerveau avec cortex préfrontal développé
+    NeuralComplexity.PREFRONTAL_CORTEX: (
+        _region_spec("prefrontal_cortex", "Cortex préfrontal", ["executive_function", "decision_making", "social_behavior", "working_memory"], 2.5,
+                     {"frontal_lobe": 0.9, "limbic_system": 0.8}, ["glutamate", "GABA", "dopamine"]),
+        _region_spec("frontal_lobe", "Lobe frontal", ["motor_control", "planning", "personality"], 2.0,
+                     {"parietal_lobe": 0.8, "temporal_lobe": 0.7}, ["glutamate", "GABA", "dopamine"]),
+        _region_spec("parietal_lobe", "Lobe pariétal", ["sensory_integration", "spatial_awareness"], 1.5,
+                     {"occipital_lobe": 0.8, "temporal_lobe": 0.7}, ["glutamate", "GABA"]),
+        _region_spec("temporal_lobe", "Lobe temporal", ["auditory_processing", "memory", "language"], 1.5,
+                     {"occipital_lobe": 0.6, "limbic_system": 0.8}, ["glutamate", "GABA"]),
+        _region_spec("occipital_lobe", "Lobe occipital", ["visual_processing"], 1.2,
+                     {}, ["glutamate", "GABA"]),
+        _region_spec("limbic_system", "Système limbique", ["emotion", "memory", "motivation"], 1.0,
+                     {"brainstem": 0.7}, ["dopamine", "serotonin", "norepinephrine"]),
+        _region_spec("basal_ganglia", "Ganglions de la base", ["motor_control", "procedural_learning"], 1.2,
+                     {"thalamus": 0.8, "brainstem": 0.6}, ["dopamine", "GABA", "glutamate"]),
+        _region_spec("cerebellum", "Cervelet", ["motor_coordination", "balance", "cognitive_functions"], 1.5,
+                     {"brainstem": 0.8}, ["GABA", "glutamate"]),
+        _region_spec("brainstem", "Tronc cérébral", ["basic_functions", "reflexes"], 1.0,
+                     {"spinal_cord": 0.9}, ["acetylcholine", "norepinephrine"]),
+    ),
+}
+
+# Consommation d'énergie de base par unité de taille, indexée par NeuralComplexity
+_BASE_CONSUMPTION = np.array([0.0, 0.1, 0.2, 0.3, 0.5, 0.8, 1.2, 1.8, 2.5])
+
+# Capacités cognitives de base, indexées par NeuralComplexity (colonnes dans l'ordre de _COGNITIVE_ABILITIES)
+_BASE_ABILITIES = np.array([
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # NONE
+    [0.2, 0.1, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # NERVE_NET
+    [0.3, 0.2, 0.1, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0],  # GANGLIA
+    [0.4, 0.3, 0.2, 0.1, 0.0, 0.0, 0.0, 0.0, 0.0],  # LADDER
+    [0.5, 0.4, 0.3, 0.2, 0.1, 0.0, 0.0, 0.0, 0.0],  # CENTRAL_NERVOUS_SYSTEM
+    [0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.0, 0.0, 0.0],  # BRAIN_SPINAL_CORD
+    [0.7, 0.6, 0.5, 0.5, 0.4, 0.3, 0.0, 0.1, 0.1],  # COMPLEX_BRAIN
+    [0.8, 0.7, 0.7, 0.7, 0.6, 0.5, 0.3, 0.4, 0.3],  # NEOCORTEX
+    [0.9, 0.8, 0.9, 0.8, 0.9, 0.8, 0.7, 0.8, 0.7],  # PREFRONTAL_CORTEX
+])
+
+
+def _instantiate_regions(complexity: NeuralComplexity) -> Dict[str, BrainRegion]:
+    """
+    Crée les régions cérébrales d'un niveau de complexité à partir de _REGION_TEMPLATES.
     
+    Args:
+        complexity: Niveau de complexité neurale
+        
     Returns:
-        Dict[str, Any]: Données de l'organisme
+        Dict[str, BrainRegion]: Nouvelles régions {region_id: BrainRegion}
     """
-    organism = create_unicellular_organism()
+    # Les fonctions et neurotransmetteurs du modèle sont partagés ; les connexions, modifiées
+    # par l'évolution, sont copiées
+    return {spec.id: BrainRegion(spec.id, spec.name, spec.functions, spec.size,
+                                 dict(spec.connections), spec.neurotransmitters)
+            for spec in _REGION_TEMPLATES.get(complexity, ())}
+
+@lru_cache(maxsize=None)
+def _graph_prototype(complexity: NeuralComplexity) -> BrainGraph:
+    """
+    Graphe d'un niveau de complexité, construit une seule fois puis copié par chaque nouveau cerveau.
     
-    # Modifier pour en faire un organisme multicellulaire simple
-    organism["type"] = "simple_multicellular"
-    organism["multicellularity_type"] = MulticellularityType.COLONIAL
-    organism["cell_types"] = [CellType.STEM]
+    Args:
+        complexity: Niveau de complexité neurale
+        
+    Returns:
+        BrainGraph: Graphe des régions de _REGION_TEMPLATES pour ce niveau (à ne pas modifier)
+    """
+    return BrainGraph(_instantiate_regions(complexity))
+
+
+class Brain:
+    """Représente un cerveau avec ses régions et fonctions."""
     
-    # Génome plus complexe
-    organism["genome"]["size"] = 500
-    organism["genome"]["genes"] = [f"gene_{i}" for i in range(50)]
-    organism["genome"]["regulatory_genes"] = [f"reg_{i}" for i in range(10)]
-    organism["genome"]["adhesion_genes"] = [f"adh_{i}" for i in range(5)]
-    organism["genome"]["signaling_genes"] = [f"sig_{i}" for i in range(3)]
+    __slots__ = ("complexity", "regions", "total_size", "energy_consumption", "ability_levels", "graph")
     
-    # Comportement légèrement plus complexe
-    organism["behavior"]["locomotion_complexity"] = 0.2
-    organism["behavior"]["social_complexity"] = 0.1
-    organism["behavior"]["feeding_complexity"] = 0.2
+    def __init__(self, complexity: NeuralComplexity = NeuralComplexity.NONE):
+        """
+        Initialise un cerveau.
+        
+        Args:
+            complexity: Niveau de complexité neurale
+        """
+        self.complexity = complexity
+        self.regions = {}  # {region_id: BrainRegion}
+        self.total_size = 0.0
+        self.energy_consumption = 0.0
+        self.ability_levels = None  # Niveaux des capacités cognitives, indexés par CognitiveAbility
+        
+        # Initialiser les régions (et le graphe qui les relie) selon la complexité
+        self._initialize_regions()
     
-    return organism
+    def _initialize_regions(self) -> None:
+        """Initialise les régions cérébrales selon le niveau de complexité."""
+        self.regions.update(_instantiate_regions(self.complexity))
+        
+        # Rattacher les régions à une copie du graphe du niveau, puis calculer la taille totale
+        # et la consommation d'énergie
+        self.graph = _graph_prototype(self.complexity).clone(self.regions)
+        if self.complexity != NeuralComplexity.NONE:
+            self._update_metrics()
+    
+    def _update_metrics(self) -> None:
+        """Met à jour les métriques du cerveau."""
+        self.total_size = float(self.graph.size.sum())
+        self._update_energy()
+        
+        # Mettre à jour les capacités cognitives
+        self._update_cognitive_abilities()
+    
+    def _update_energy(self) -> None:
+        """Met à jour la consommation d'énergie à partir de la taille totale (self.total_size)."""
+        # La consommation d'énergie augmente avec la complexité
+        self.energy_consumption = float(_BASE_CONSUMPTION[self.complexity]) * self.total_size / 10.0
+    
+    @property
+    def cognitive_abilities(self) -> Dict[str, float]:
+        """Capacités cognitives {capacité: niveau} (vide sans système nerveux)."""
+        if self.ability_levels is None:
+            return {}
+        return cognitive_ability_dict(self.ability_levels)
+    
+    def _update_cognitive_abilities(self) -> None:
+        """Met à jour les capacités cognitives en fonction des régions cérébrales."""
+        # Sans région (pas de système nerveux ou niveau sans régions), seules les capacités de base comptent
+        if not self.regions:
+            self.ability_levels = _BASE_ABILITIES[self.complexity].copy()
+            return
+        
+        # Capacités de base selon la complexité, puis +0.1 * taille pour chaque région contributrice
+        abilities = _BASE_ABILITIES[self.complexity] + 0.1 * (self.graph.size @ self.graph.ability_matrix)
+        
+        # Limiter les valeurs entre 0 et 1
+        np.minimum(abilities, 1.0, out=abilities)
+        self.ability_levels = abilities
+    
+    def process_inputs(self, sensory_inputs: Dict[str, float]) -> Dict[str, float]:
+        """
+        Traite les entrées sensorielles et génère des sorties comportementales.
+        
+        Args:
+            sensory_inputs: Entrées sensorielles {type: intensité}
+            
+        Returns:
+            Dict[str, float]: Sorties comportementales {comportement: intensité}
+        """
+        # Si pas de cerveau, réponses réflexes simples
+        if self.complexity == NeuralComplexity.NONE:
+            return {
+                "reflex_response": max(0.0, min(1.0, sum(sensory_inputs.values()) / len(sensory_inputs)))
+            }
+        
+        return self._respond(self.graph.input_vector(sensory_inputs))
+    
+    def process_inputs_array(self, sensory_array: np.ndarray) -> Dict[str, float]:
+        """
+        Variante de process_inputs pour des entrées sensorielles déjà rangées dans un tableau.
+        
+        Args:
+            sensory_array: Intensités des entrées, dans l'ordre de _SENSORY_INPUTS
+            
+        Returns:
+            Dict[str, float]: Sorties comportementales {comportement: intensité}
+        """
+        # Si pas de cerveau, réponses réflexes simples
+        if self.complexity == NeuralComplexity.NONE:
+            return {
+                "reflex_response": max(0.0, min(1.0, float(sensory_array.mean())))
+            }
+        
+        return self._respond(sensory_array @ self.graph.sensory_matrix)
+    
+    def _respond(self, inputs_vec: np.ndarray) -> Dict[str, float]:
+        """
+        Propage des entrées dans le cerveau et génère les sorties comportementales.
+        
+        Args:
+            inputs_vec: Contribution des entrées pour chaque région (voir BrainGraph.input_vector)
+            
+        Returns:
+            Dict[str, float]: Sorties comportementales {comportement: intensité}
+        """
+        abilities = self.ability_levels.tolist()
+        learning = abilities[CognitiveAbility.LEARNING]
+        
+        # Propager l'activité à travers les régions ; avec une capacité d'apprentissage suffisante,
+        # les régions s'adaptent à leur nouvelle activité dans la même passe
+        resized = learning > 0.4  # Seule l'adaptation des régions modifie les métriques du cerveau
+        if resized:
+            self.total_size = self.graph.step_adapt(inputs_vec, 0.05 * learning)
+        else:
+            self.graph.step(inputs_vec)
+        
+        # Générer des sorties comportementales en fonction des capacités cognitives
+        behavioral_outputs = {}
+        activity = self.graph.activity
+        groups = self.graph.output_groups
+        
+        # Réponses motrices de base
+        motor_regions = groups["movement"]
+        if len(motor_regions):
+            motor_activity = float(activity[motor_regions].mean())
+            behavioral_outputs["movement"] = motor_activity * abilities[CognitiveAbility.MOTOR_CONTROL]
+        
+        # Réponses émotionnelles
+        social_cognition = abilities[CognitiveAbility.SOCIAL_COGNITION]
+        if social_cognition > 0.2:
+            emotional_regions = groups["emotional_response"]
+            
+            if len(emotional_regions):
+                emotional_activity = float(activity[emotional_regions].mean())
+                behavioral_outputs["emotional_response"] = emotional_activity * social_cognition
+        
+        # Prise de décision
+        decision_making = abilities[CognitiveAbility.DECISION_MAKING]
+        if decision_making > 0.3:
+            decision_regions = groups["decision"]
+            
+            if len(decision_regions):
+                decision_activity = float(activity[decision_regions].mean())
+                behavioral_outputs["decision"] = decision_activity * decision_making
+        
+        # Apprentissage
+        if resized:
+            behavioral_outputs["learning"] = learning * 0.5
+        
+        # Utilisation d'outils (pour les niveaux supérieurs)
+        tool_use = abilities[CognitiveAbility.TOOL_USE]
+        if tool_use > 0.3:
+            tool_regions = groups["tool_use"]
+            
+            if len(tool_regions):
+                tool_activity = float(activity[tool_regions].mean())
+                behavioral_outputs["tool_use"] = tool_activity * tool_use
+        
+        # Communication (pour les niveaux supérieurs)
+        language = abilities[CognitiveAbility.LANGUAGE]
+        if language > 0.2:
+            language_regions = groups["communication"]
+            
+            if len(language_regions):
+                language_activity = float(activity[language_regions].mean())
+                behavioral_outputs["communication"] = language_activity * language
+        
+        # Mettre à jour les métriques si les tailles des régions ont changé
+        if resized:
+            self._update_energy()
+            self._update_cognitive_abilities()
+        
+        return behavioral_outputs
+    
+    def evolve(self, generations: int = 10, learning_experiences: int = 5) -> None:
+        """
+        Fait évoluer le cerveau sur plusieurs générations avec apprentissage.
+        
+        Args:
+            generations: Nombre de générations
+            learning_experiences: Nombre d'expériences d'apprentissage par génération
+        """
+        # Sans région, les entrées et l'évolution structurelle ne changent rien : seules les métriques évoluent
+        if not self.regions:
+            if generations > 0:
+                self._update_metrics()
+            return
+        
+        # Tirer en une fois les entrées sensorielles de toutes les expériences et les évolutions structurelles
+        sensory_draws = np.random.random((generations, learning_experiences, len(_SENSORY_INPUTS)))
+        structural = np.random.random(generations) < 0.2
+        new_regions = structural & (np.random.random(generations) < 0.1)
+        can_grow = self.complexity >= NeuralComplexity.CENTRAL_NERVOUS_SYSTEM
+        
+        for gen in range(generations):
+            # Simuler des expériences d'apprentissage
+            for sensory_array in sensory_draws[gen]:
+                # Traiter les entrées sensorielles aléatoires (dans l'ordre de _SENSORY_INPUTS)
+                self.process_inputs_array(sensory_array)
+            
+            # Évolution structurelle (rare)
+            if structural[gen]:
+                # Possibilité d'ajouter une nouvelle région
+                if can_grow and new_regions[gen]:
+                    # Créer une nouvelle région spécialisée
+                    region_id = f"specialized_region_{len(self.regions) + 1}"
+                    functions = random.sample(
+                        ["sensory_processing", "motor_control", "memory", "emotion", 
+                         "decision_making", "attention", "spatial_awareness"],
+                        k=random.randint(1, 3)
+                    )
+                    
+                    # Connexions avec les régions existantes
+                    linked = np.random.random(len(self.regions)) < 0.3
+                    strengths = np.random.uniform(0.1, 0.9, len(self.regions))
+                    connections = {existing_id: strength
+                                   for existing_id, is_linked, strength in zip(self.regions, linked, strengths.tolist())
+                                   if is_linked}
+                    
+                    # Créer la région
+                    new_region = BrainRegion(
+                        region_id,
+                        f"Région spécialisée {len(self.regions) + 1}",
+                        functions,
+                        0.5,  # Taille initiale réduite
+                        connections,
+                        random.sample(["glutamate", "GABA", "dopamine", "serotonin"], k=2)
+                    )
+                    
+                    # Ajouter la région, puis reconstruire le graphe à partir des connexions à jour
+                    self.graph.store_connections(self.regions)
+                    self.regions[region_id] = new_region
+                    self.graph = BrainGraph(self.regions)
+                
+                # Renforcer les connexions les plus utilisées (directement dans la matrice du graphe)
+                self.graph.reinforce_connections()
+            
+            # Mettre à jour les métriques
+            self._update_metrics()
+        
+        # Reporter les forces des connexions du graphe dans les régions
+        self.graph.store_connections(self.regions)
 
-def create_complex_multicellular_organism() -> Dict[str, Any]:
+# Fonctions utilitaires pour créer des organismes avec différents niveaux d'évolution
+
+# Identifiants des organismes créés par ces fonctions (uniques au sein d'une simulation)
+_ORGANISM_IDS = itertools.count()
+
+
+@lru_cache(maxsize=None)
+def _gene_names(prefix: str, count: int) -> Tuple[str, ...]:
     """
-    Crée un organisme multicellulaire complexe.
+    Noms de gènes prefix_0 ... prefix_{count-1}, formatés une seule fois et partagés.
     
+    Args:
+        prefix: Préfixe des noms de gènes
+        count: Nombre de gènes
+        
     Returns:
-        Dict[str, Any]: Données de l'organisme
+        Tuple[str, ...]: Noms des gènes (à copier dans une liste avant de les placer dans un génome)
     """
-    organism = create_simple_multicellular_organism()
-    
-    # Modifier pour en faire un organisme multicellulaire complexe
-    organism["type"] = "complex_multicellular"
-    organism["multicellularity_type"] = MulticellularityType.COMPLEX
-    organism["cell_types"] = [CellType.STEM, CellType.EPITHELIAL, CellType.CONNECTIVE, CellType.MUSCLE, CellType.NERVE]
-    organism["neural_complexity"] = NeuralComplexity.CENTRAL_NERVOUS_SYSTEM
-    
+    return tuple(_gene_name_range(prefix, 0, count))
+
+# Modèles des organismes créés par ces fonctions, jamais modifiés : chaque niveau complète le précédent
+# avec l'opérateur |, et _new_organism en copie les sections (les tuples deviennent des listes)
+_UNICELLULAR_TEMPLATE = {
+    "type": "unicellular",
+    "multicellularity_type": MulticellularityType.NONE,
+    "neural_complexity": NeuralComplexity.NONE,
+    "genome": {
+        "size": 100,
+        "genes": _gene_names("gene", 10),
+        "regulatory_genes": _gene_names("reg", 2)
+    },
+    "metabolism": {
+        "efficiency": 0.5,
+        "photosynthetic": False,  # Tiré à la création
+        "aerobic": True
+    },
+    "environment": {
+        "temperature": 25.0,
+        "stability": 0.7,
+        "predation_pressure": 0.3,
+        "resource_abundance": 0.6,
+        "spatial_structure": 0.4,
+        "aquatic": True
+    },
+    "population": {
+        "size": 1000,
+        "density": 50.0,
+        "reproduction_rate": 0.8,
+        "competition": 0.4
+    },
+    "behavior": {
+        "locomotion_complexity": 0.1,
+        "social_complexity": 0.0,
+        "feeding_complexity": 0.1,
+        "learning_capacity": 0.0
+    }
+}
+
+_SIMPLE_TEMPLATE = _UNICELLULAR_TEMPLATE | {
+    "type": "simple_multicellular",
+    "multicellularity_type": MulticellularityType.COLONIAL,
+    # Génome plus complexe
+    "genome": {
+        "size": 500,
+        "genes": _gene_names("gene", 50),
+        "regulatory_genes": _gene_names("reg", 10),
+        "adhesion_genes": _gene_names("adh", 5),
+        "signaling_genes": _gene_names("sig", 3)
+    },
+    # Comportement légèrement plus complexe
+    "behavior": {
+        "locomotion_complexity": 0.2,
+        "social_complexity": 0.1,
+        "feeding_complexity": 0.2,
+        "learning_capacity": 0.0
+    },
+    "cell_types": (CellType.STEM,)
+}
+
+_COMPLEX_TEMPLATE = _SIMPLE_TEMPLATE | {
+    "type": "complex_multicellular",
+    "multicellularity_type": MulticellularityType.COMPLEX,
+    "neural_complexity": NeuralComplexity.CENTRAL_NERVOUS_SYSTEM,
     # Génome encore plus complexe
-    organism["genome"]["size"] = 2000
-    organism["genome"]["genes"] = [f"gene_{i}" for i in range(200)]
-    organism["genome"]["regulatory_genes"] = [f"reg_{i}" for i in range(30)]
-    organism["genome"]["adhesion_genes"] = [f"adh_{i}" for i in range(15)]
-    organism["genome"]["signaling_genes"] = [f"sig_{i}" for i in range(20)]
-    organism["genome"]["differentiation_genes"] = [f"diff_{i}" for i in range(10)]
-    organism["genome"]["neural_genes"] = [f"neur_{i}" for i in range(15)]
-    organism["genome"]["development_genes"] = [f"dev_{i}" for i in range(10)]
-    
+    "genome": {
+        "size": 2000,
+        "genes": _gene_names("gene", 200),
+        "regulatory_genes": _gene_names("reg", 30),
+        "adhesion_genes": _gene_names("adh", 15),
+        "signaling_genes": _gene_names("sig", 20),
+        "differentiation_genes": _gene_names("diff", 10),
+        "neural_genes": _gene_names("neur", 15),
+        "development_genes": _gene_names("dev", 10)
+    },
     # Comportement plus complexe
-    organism["behavior"]["locomotion_complexity"] = 0.6
-    organism["behavior"]["social_complexity"] = 0.4
-    organism["behavior"]["feeding_complexity"] = 0.5
-    organism["behavior"]["learning_capacity"] = 0.3
-    
-    # Ajouter un cerveau simple
-    organism["brain"] = {
-        "regions": ["brain", "spinal_cord"],
+    "behavior": {
+        "locomotion_complexity": 0.6,
+        "social_complexity": 0.4,
+        "feeding_complexity": 0.5,
+        "learning_capacity": 0.3
+    },
+    "cell_types": (CellType.STEM, CellType.EPITHELIAL, CellType.CONNECTIVE, CellType.MUSCLE, CellType.NERVE),
+    # Cerveau simple
+    "brain": {
+        "regions": ("brain", "spinal_cord"),
         "size": 1.0,
         "energy_consumption": 0.2,
         "cognitive_abilities": {
@@ -1428,43 +2146,34 @@ def create_complex_multicellular_organism() -> Dict[str, Any]:
             "decision_making": 0.1
         }
     }
-    
-    return organism
+}
 
-def create_advanced_organism() -> Dict[str, Any]:
-    """
-    Crée un organisme avancé avec un cerveau complexe.
-    
-    Returns:
-        Dict[str, Any]: Données de l'organisme
-    """
-    organism = create_complex_multicellular_organism()
-    
-    # Modifier pour en faire un organisme avancé
-    organism["type"] = "advanced_organism"
-    organism["neural_complexity"] = NeuralComplexity.NEOCORTEX
-    organism["cell_types"] = [CellType.STEM, CellType.EPITHELIAL, CellType.CONNECTIVE, 
-                            CellType.MUSCLE, CellType.NERVE, CellType.BLOOD, 
-                            CellType.IMMUNE, CellType.REPRODUCTIVE, CellType.SENSORY]
-    
+_ADVANCED_TEMPLATE = _COMPLEX_TEMPLATE | {
+    "type": "advanced_organism",
+    "neural_complexity": NeuralComplexity.NEOCORTEX,
     # Génome très complexe
-    organism["genome"]["size"] = 10000
-    organism["genome"]["neural_genes"] = [f"neur_{i}" for i in range(50)]
-    organism["genome"]["development_genes"] = [f"dev_{i}" for i in range(30)]
-    organism["genome"]["neurotransmitter_genes"] = [f"nt_{i}" for i in range(10)]
-    
+    "genome": _COMPLEX_TEMPLATE["genome"] | {
+        "size": 10000,
+        "neural_genes": _gene_names("neur", 50),
+        "development_genes": _gene_names("dev", 30),
+        "neurotransmitter_genes": _gene_names("nt", 10)
+    },
     # Comportement avancé
-    organism["behavior"]["locomotion_complexity"] = 0.8
-    organism["behavior"]["social_complexity"] = 0.7
-    organism["behavior"]["feeding_complexity"] = 0.7
-    organism["behavior"]["learning_capacity"] = 0.6
-    organism["behavior"]["tool_use"] = 0.4
-    organism["behavior"]["communication"] = 0.5
-    
+    "behavior": {
+        "locomotion_complexity": 0.8,
+        "social_complexity": 0.7,
+        "feeding_complexity": 0.7,
+        "learning_capacity": 0.6,
+        "tool_use": 0.4,
+        "communication": 0.5
+    },
+    "cell_types": (CellType.STEM, CellType.EPITHELIAL, CellType.CONNECTIVE,
+                   CellType.MUSCLE, CellType.NERVE, CellType.BLOOD,
+                   CellType.IMMUNE, CellType.REPRODUCTIVE, CellType.SENSORY),
     # Cerveau complexe
-    organism["brain"] = {
-        "regions": ["frontal_lobe", "parietal_lobe", "temporal_lobe", "occipital_lobe", 
-                   "limbic_system", "cerebellum", "brainstem", "spinal_cord"],
+    "brain": {
+        "regions": ("frontal_lobe", "parietal_lobe", "temporal_lobe", "occipital_lobe",
+                    "limbic_system", "cerebellum", "brainstem", "spinal_cord"),
         "size": 2.0,
         "energy_consumption": 0.8,
         "cognitive_abilities": {
@@ -1479,127 +2188,1008 @@ def create_advanced_organism() -> Dict[str, Any]:
             "consciousness": 0.3
         }
     }
+}
+
+def _template_copy(value: Any) -> Any:
+    """
+    Copie une valeur d'un modèle d'organisme : dictionnaires copiés récursivement, tuples et listes
+    copiés en listes, valeurs scalaires partagées.
+    
+    Args:
+        value: Valeur du modèle
+        
+    Returns:
+        Any: Copie modifiable de la valeur
+    """
+    if isinstance(value, dict):
+        return {key: _template_copy(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        return list(value)
+    return value
+
+def _new_organism(template: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Crée un organisme à partir d'un modèle, avec un nouvel identifiant et un métabolisme tiré au hasard.
     
+    Args:
+        template: Modèle de l'organisme
+        
+    Returns:
+        Dict[str, Any]: Données de l'organisme
+    """
+    organism = {"id": f"org_{next(_ORGANISM_IDS)}"}
+    for key, value in template.items():
+        organism[key] = _template_copy(value)
+    organism["metabolism"]["photosynthetic"] = random.choice([True, False])
     return organism
 
-# Fonction pour simuler l'évolution d'un organisme
-def simulate_evolution(organism_data: Dict[str, Any], generations: int = 1000) -> Dict[str, Any]:
+def create_unicellular_organism() -> Dict[str, Any]:
     """
-    Simule l'évolution d'un organisme sur plusieurs générations.
+    Crée un organisme unicellulaire de base.
+    
+    Returns:
+        Dict[str, Any]: Données de l'organisme
+    """
+    return _new_organism(_UNICELLULAR_TEMPLATE)
+
+def create_simple_multicellular_organism() -> Dict[str, Any]:
+    """
+    Crée un organisme multicellulaire simple.
+    
+    Returns:
+        Dict[str, Any]: Données de l'organisme
+    """
+    return _new_organism(_SIMPLE_TEMPLATE)
+
+def create_complex_multicellular_organism() -> Dict[str, Any]:
+    """
+    Crée un organisme multicellulaire complexe.
+    
+    Returns:
+        Dict[str, Any]: Données de l'organisme
+    """
+    return _new_organism(_COMPLEX_TEMPLATE)
+
+def create_advanced_organism() -> Dict[str, Any]:
+    """
+    Crée un organisme avancé avec un cerveau complexe.
+    
+    Returns:
+        Dict[str, Any]: Données de l'organisme
+    """
+    return _new_organism(_ADVANCED_TEMPLATE)
+
+# Enregistrements compacts des organismes pour les simulations de population
+
+# Champs numériques des organismes : (champ de l'enregistrement, section des données, clé, format)
+_ORGANISM_RECORD_FIELDS = (
+    ("efficiency", "metabolism", "efficiency", "f8"),
+    ("photosynthetic", "metabolism", "photosynthetic", "?"),
+    ("aerobic", "metabolism", "aerobic", "?"),
+    ("temperature", "environment", "temperature", "f8"),
+    ("stability", "environment", "stability", "f8"),
+    ("predation_pressure", "environment", "predation_pressure", "f8"),
+    ("resource_abundance", "environment", "resource_abundance", "f8"),
+    ("spatial_structure", "environment", "spatial_structure", "f8"),
+    ("aquatic", "environment", "aquatic", "?"),
+    ("population_size", "population", "size", "i4"),
+    ("density", "population", "density", "f8"),
+    ("reproduction_rate", "population", "reproduction_rate", "f8"),
+    ("competition", "population", "competition", "f8"),
+    ("locomotion", "behavior", "locomotion_complexity", "f8"),
+    ("social", "behavior", "social_complexity", "f8"),
+    ("feeding", "behavior", "feeding_complexity", "f8"),
+    ("learning", "behavior", "learning_capacity", "f8"),
+    ("multicellularity", None, "multicellularity_type", "u1"),
+    ("neural", None, "neural_complexity", "u1"),
+)
+
+# Un organisme par enregistrement ; les gènes et autres listes restent dans les données d'origine
+ORGANISM_DTYPE = np.dtype([(name, fmt) for name, _, _, fmt in _ORGANISM_RECORD_FIELDS])
+
+def organisms_to_records(organisms: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Regroupe les champs numériques d'une population dans un tableau structuré contigu.
     
     Args:
-        organism_data: Données initiales de l'organisme
-        generations: Nombre de générations à simuler
+        organisms: Liste des données des organismes
         
     Returns:
-        Dict[str, Any]: Données de l'organisme après évolution
+        np.ndarray: Enregistrements de type ORGANISM_DTYPE (0 pour les champs absents)
     """
-    # Copier les données initiales
-    evolved_data = organism_data.copy()
+    records = np.zeros(len(organisms), dtype=ORGANISM_DTYPE)
     
-    # Créer les mécanismes d'évolution
-    multicellularity_mechanism = MulticellularityMechanism()
-    neural_evolution = NeuralEvolution()
+    for name, section, key, _ in _ORGANISM_RECORD_FIELDS:
+        column = records[name]
+        for i, organism_data in enumerate(organisms):
+            source = organism_data if section is None else organism_data.get(section, {})
+            column[i] = source.get(key, 0)
     
-    # Historique d'évolution
-    evolution_history = []
+    return records
+
+def records_to_organisms(records: np.ndarray, organisms: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reporte des enregistrements (éventuellement modifiés en bloc) dans les données des organismes.
     
-    # Simuler l'évolution sur plusieurs générations
-    for gen in range(generations):
-        # Étape 1: Évolution de la multicellularité
-        if evolved_data.get("multicellularity_type", MulticellularityType.NONE) == MulticellularityType.NONE:
-            # Calculer le potentiel de multicellularité
-            potential = multicellularity_mechanism.calculate_multicellularity_potential(evolved_data)
+    Seuls les champs présents dans les données d'origine sont reportés : les champs absents (lus comme 0
+    par organisms_to_records) ne sont pas ajoutés.
+    
+    Args:
+        records: Enregistrements de type ORGANISM_DTYPE
+        organisms: Liste des données des organismes ayant servi à construire les enregistrements
+        
+    Returns:
+        List[Dict[str, Any]]: Copies des données des organismes avec les champs numériques mis à jour
+    """
+    updated = [dict(organism_data) for organism_data in organisms]
+    
+    # Copier les sections présentes pour ne pas altérer les données d'origine
+    for section in {section for _, section, _, _ in _ORGANISM_RECORD_FIELDS if section is not None}:
+        for organism_data in updated:
+            if section in organism_data:
+                organism_data[section] = dict(organism_data[section])
+    
+    for name, section, key, _ in _ORGANISM_RECORD_FIELDS:
+        values = records[name].tolist()
+        if key == "multicellularity_type":
+            values = [_MC_TYPES[v] for v in values]
+        elif key == "neural_complexity":
+            values = [NeuralComplexity(v) for v in values]
+        
+        for organism_data, value in zip(updated, values):
+            target = organism_data if section is None else organism_data.get(section)
+            if target is not None and key in target:
+                target[key] = value
+    
+    return updated
+
+# Traits comportementaux suivis par simulate_evolution (colonnes de OrganismPool.behavior) : les quatre
+# premiers évoluent graduellement, les suivants apparaissent avec la complexité neurale
+_BEHAVIOR_TRAITS = ("locomotion_complexity", "social_complexity", "feeding_complexity", "learning_capacity",
+                    "tool_use", "communication", "abstract_thinking")
+_GRADUAL_TRAITS = 4
+
+# Poids des traits graduels dans le potentiel neural (ordre de _NEURAL_BEHAVIOR_WEIGHTS)
+_GRADUAL_TRAIT_W = np.array([weight for _, weight in _NEURAL_BEHAVIOR_WEIGHTS])
+
+# Traits qui apparaissent avec la complexité neurale (tool_use, communication, abstract_thinking) :
+# niveau requis et valeur initiale
+_TRAIT_THRESHOLDS = np.array([_NC_COMPLEX_BRAIN, _NC_NEOCORTEX, _NC_PREFRONTAL], dtype=np.int8)
+_TRAIT_INITIAL = np.array([0.1, 0.2, 0.3])
+
+# Familles de gènes qui mutent pendant simulate_evolution (colonnes de OrganismPool.gene_counts)
+_SIM_GENE_TYPES = ("genes", "regulatory_genes", "adhesion_genes", "signaling_genes",
+                   "differentiation_genes", "neural_genes", "development_genes")
+_SIM_GENE_PREFIXES = tuple(gene_type[:-1] for gene_type in _SIM_GENE_TYPES)
+_SIM_ADHESION, _SIM_SIGNALING, _SIM_REGULATORY = 2, 3, 1
+_SIM_NEURAL, _SIM_DEVELOPMENT = 5, 6
+
+# Étapes d'une génération de simulate_evolution : transitions de multicellularité et neurale, puis
+# évolution génomique et comportementale
+_STEP_MULTICELLULARITY, _STEP_NEURAL, _STEP_GRADUAL = 0, 1, 2
+
+# Colonnes des tirages d'une génération de simulate_evolution : transitions, puis évolution des traits
+# graduels et des traits émergents (les mutations du génome sont tirées à part, voir _draw_simulation)
+_ROLL_MULTICELLULARITY, _ROLL_NEURAL = 0, 1
+_ROLL_GRADUAL = 2
+_ROLL_EMERGING = _ROLL_GRADUAL + _GRADUAL_TRAITS
+_SIM_ROLLS = _ROLL_EMERGING + len(_TRAIT_THRESHOLDS)
+
+# Incréments des traits et de la croissance du génome, uniformes entre 0.01 et 0.05 : un tirage
+# inférieur au seuil p, divisé par p, est encore uniforme sur [0, 1) et fournit l'incrément
+# sans tirage supplémentaire
+_DELTA_MIN, _DELTA_SPAN = 0.01, 0.04
+
+# Taux de mutation de base du génome : ajout d'un gène par famille, croissance du génome (dix fois plus rare)
+_SIM_MUTATION_RATE = 0.01
+_SIM_GROWTH_RATE = _SIM_MUTATION_RATE * 0.1
+
+# Mot d'état d'un organisme de l'OrganismPool (uint64) : niveaux d'évolution et indicateurs de présence
+# bits 0-3 : MulticellularityType, bits 4-7 : NeuralComplexity, bit 8 : niveau neural renseigné,
+# bit 9 : comportement, bit 10 : génome, bits 16-22 : traits de _BEHAVIOR_TRAITS, bits 24-30 : familles
+# de _SIM_GENE_TYPES (les autres bits sont réservés)
+_STATE_LEVEL_MASK = np.uint64(0xF)
+_STATE_MULTICELLULARITY_SHIFT = np.uint64(0)
+_STATE_NEURAL_SHIFT = np.uint64(4)
+_STATE_NEURAL_PRESENT = np.uint64(1 << 8)
+_STATE_BEHAVIOR_PRESENT = np.uint64(1 << 9)
+_STATE_GENOME_PRESENT = np.uint64(1 << 10)
+_STATE_TRAIT_BITS = np.uint64(1) << np.arange(16, 16 + len(_BEHAVIOR_TRAITS), dtype=np.uint64)
+_STATE_GENE_BITS = np.uint64(1) << np.arange(24, 24 + len(_SIM_GENE_TYPES), dtype=np.uint64)
+
+def _state_levels(state: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extrait les niveaux d'évolution de mots d'état (un mot ou un tableau de mots, sans boucle).
+    
+    Args:
+        state: Mots d'état (voir OrganismPool.state)
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Valeurs du MulticellularityType et du NeuralComplexity
+    """
+    return ((state >> _STATE_MULTICELLULARITY_SHIFT) & _STATE_LEVEL_MASK,
+            (state >> _STATE_NEURAL_SHIFT) & _STATE_LEVEL_MASK)
+
+class _SimulationDraws(NamedTuple):
+    """Nombres aléatoires d'une simulation, tirés d'un bloc avant la boucle de générations."""
+    rolls: np.ndarray  # Tirages uniformes (générations, _SIM_ROLLS)
+    gene_mutations: np.ndarray  # Ajout d'un gène (générations, famille de _SIM_GENE_TYPES)
+    genome_growth: np.ndarray  # Facteur de croissance du génome par génération (1.0 sans croissance)
+
+def _draw_simulation(rng: np.random.Generator, generations: int,
+                     out: Optional[_SimulationDraws] = None) -> _SimulationDraws:
+    """
+    Tire tous les nombres aléatoires d'une simulation.
+    
+    Les mutations du génome, indépendantes et de taux fixe, sont tirées directement sous forme
+    d'événements : une matrice booléenne pour les ajouts de gènes et un facteur de croissance par génération.
+    
+    Args:
+        rng: Générateur aléatoire
+        generations: Nombre de générations
+        out: Tableaux à remplir (par exemple ceux d'un appel précédent), alloués si absents
+        
+    Returns:
+        _SimulationDraws: Tirages de la simulation
+    """
+    if out is None:
+        out = _SimulationDraws(np.empty((generations, _SIM_ROLLS), dtype=np.float32),
+                               np.empty((generations, len(_SIM_GENE_TYPES)), dtype=bool),
+                               np.empty(generations))
+    
+    rng.random(dtype=np.float32, out=out.rolls)
+    np.less(rng.random(out.gene_mutations.shape), _SIM_MUTATION_RATE, out=out.gene_mutations)
+    growth_rolls = rng.random(generations)
+    out.genome_growth[:] = np.where(growth_rolls < _SIM_GROWTH_RATE,
+                                    1.0 + _DELTA_MIN + _DELTA_SPAN * (growth_rolls / _SIM_GROWTH_RATE), 1.0)
+    return out
+
+class OrganismPool:
+    """
+    Organismes stockés par colonnes pour simulate_evolution.
+    
+    Chaque ligne des tableaux correspond à un organisme ; les noms des gènes restent dans les listes
+    du génome, qui ne sont complétées qu'au report des nombres de gènes.
+    """
+    
+    def __init__(self, size: int):
+        """
+        Initialise un ensemble vide d'organismes.
+        
+        Args:
+            size: Nombre d'organismes
+        """
+        self.size = size
+        
+        # Niveaux d'évolution et présence du comportement, du génome, des traits et des familles de gènes,
+        # regroupés dans un mot d'état par organisme (voir _STATE_*)
+        self.state = np.zeros(size, dtype=np.uint64)
+        
+        # Comportement : valeurs des traits de _BEHAVIOR_TRAITS
+        self.behavior = np.zeros((size, len(_BEHAVIOR_TRAITS)))
+        
+        # Génome : taille et nombres de gènes des familles de _SIM_GENE_TYPES
+        self.genome_size = np.zeros(size, dtype=np.int64)
+        self.gene_counts = np.zeros((size, len(_SIM_GENE_TYPES)), dtype=np.int32)
+        
+        # Parties fixes des potentiels : caractéristiques de _POTENTIAL_WEIGHTS et facteur environnemental neural
+        self.potential_features = np.zeros((size, len(_POTENTIAL_WEIGHTS)))
+        self.neural_env_factor = np.zeros(size)
+    
+    @classmethod
+    def from_organisms(cls, organisms: List[Dict[str, Any]]) -> 'OrganismPool':
+        """
+        Construit l'ensemble à partir de données d'organismes.
+        
+        Args:
+            organisms: Liste des données des organismes
             
-            # Probabilité d'évolution vers la multicellularité
-            if random.random() < potential * 0.01:  # Transition rare
-                # Faire évoluer vers la multicellularité
-                evolved_data = multicellularity_mechanism.evolve_multicellularity(evolved_data, 100)
+        Returns:
+            OrganismPool: Organismes correspondants
+        """
+        pool = cls(len(organisms))
+        for i, organism_data in enumerate(organisms):
+            pool.load(i, organism_data)
+        return pool
+    
+    def load(self, i: int, organism_data: Dict[str, Any]) -> None:
+        """
+        Charge les données d'un organisme dans la ligne i.
+        
+        Args:
+            i: Indice de l'organisme
+            organism_data: Données de l'organisme
+        """
+        state = np.uint64(organism_data.get("multicellularity_type", _MC_NONE)) << _STATE_MULTICELLULARITY_SHIFT
+        state |= np.uint64(organism_data.get("neural_complexity", _NC_NONE)) << _STATE_NEURAL_SHIFT
+        if "neural_complexity" in organism_data:
+            state |= _STATE_NEURAL_PRESENT
+        
+        behavior = organism_data.get("behavior")
+        if behavior is not None:
+            state |= _STATE_BEHAVIOR_PRESENT
+        for j, trait in enumerate(_BEHAVIOR_TRAITS):
+            value = behavior.get(trait) if behavior is not None else None
+            if value is not None:
+                state |= _STATE_TRAIT_BITS[j]
+            self.behavior[i, j] = value if value is not None else 0.0
+        
+        genome = organism_data.get("genome")
+        if genome is not None:
+            state |= _STATE_GENOME_PRESENT
+        self.genome_size[i] = genome.get("size", 0) if genome is not None else 0
+        for j, gene_type in enumerate(_SIM_GENE_TYPES):
+            genes = genome.get(gene_type) if genome is not None else None
+            if genes is not None:
+                state |= _STATE_GENE_BITS[j]
+            self.gene_counts[i, j] = len(genes) if genes is not None else 0
+        
+        self.state[i] = state
+        
+        _extract_potential_features(organism_data, self.potential_features[i])
+        
+        env_factor = 0.0
+        env = organism_data.get("environment")
+        if env is not None:
+            for key, weight in _NEURAL_ENV_WEIGHTS:
+                value = env.get(key)
+                if value is not None:
+                    env_factor += weight * value
+        self.neural_env_factor[i] = env_factor
+    
+    def store(self, i: int, organism_data: Dict[str, Any]) -> None:
+        """
+        Reporte la ligne i (comportement, taille du génome et nouveaux gènes) dans les données de l'organisme.
+        
+        Les dictionnaires du comportement et du génome et les listes de gènes modifiés sont remplacés
+        par des copies (copie sur écriture) : les données d'origine, dont organism_data n'est qu'une copie
+        superficielle, ne sont jamais modifiées.
+        
+        Args:
+            i: Indice de l'organisme
+            organism_data: Données de l'organisme chargées dans la ligne i
+        """
+        state = self.state[i]
+        if state & _STATE_BEHAVIOR_PRESENT:
+            behavior = organism_data["behavior"]
+            changed = {}
+            for j, trait in enumerate(_BEHAVIOR_TRAITS):
+                if state & _STATE_TRAIT_BITS[j]:
+                    value = float(self.behavior[i, j])
+                    if behavior.get(trait) != value:
+                        changed[trait] = value
+            if changed:
+                organism_data["behavior"] = behavior | changed
+        
+        if state & _STATE_GENOME_PRESENT:
+            genome = organism_data["genome"]
+            size = int(self.genome_size[i])
+            copied = False
+            if genome.get("size", 0) != size:
+                genome = organism_data["genome"] = dict(genome)
+                copied = True
+                genome["size"] = size
+            
+            # Nommer les gènes ajoutés d'après leur rang dans la famille
+            for j, gene_type in enumerate(_SIM_GENE_TYPES):
+                if state & _STATE_GENE_BITS[j] and self.gene_counts[i, j] > len(genome[gene_type]):
+                    if not copied:
+                        genome = organism_data["genome"] = dict(genome)
+                        copied = True
+                    _append_gene_names(genome, gene_type, _SIM_GENE_PREFIXES[j], int(self.gene_counts[i, j]))
+
+@njit(cache=True, fastmath=True)
+def _simulate_kernel(i, states, behavior, genome_size, gene_counts, potential_features, potential_weights,
+                     neural_env_factor, rolls, gene_mutations, genome_growth, gen, step):
+    """
+    Boucle de générations de simulate_evolution sur la ligne i d'un OrganismPool.
+    
+    Tous les tirages aléatoires sont lus dans des tableaux préparés par _draw_simulation, à une colonne fixe
+    par décision : le résultat ne dépend que de ces tableaux, avec ou sans numba. La boucle s'interrompt
+    dès qu'une transition de multicellularité ou neurale est tirée : ces transitions passent par les
+    mécanismes d'évolution, puis la simulation reprend à l'étape suivante de la même génération.
+    
+    Args:
+        i: Indice de l'organisme
+        states: Mots d'état (voir _STATE_*), mis à jour en place à l'apparition d'un trait
+        behavior: Valeurs des comportements (mises à jour en place)
+        genome_size, gene_counts: Taille du génome et nombres de gènes (mis à jour en place)
+        potential_features: Caractéristiques du potentiel de multicellularité
+        potential_weights: Poids du potentiel de multicellularité (_POTENTIAL_WEIGHTS)
+        neural_env_factor: Facteur environnemental du potentiel neural
+        rolls: Tirages uniformes (générations, _SIM_ROLLS)
+        gene_mutations: Ajouts de gènes (générations, famille)
+        genome_growth: Facteur de croissance du génome par génération
+        gen: Génération de reprise
+        step: Étape de reprise dans la génération (_STEP_*)
+        
+    Returns:
+        Tuple[int, int]: (génération, étape) de la transition tirée, ou (generations, 0) en fin de simulation
+    """
+    state = states[i]
+    multi = np.int64((state >> _STATE_MULTICELLULARITY_SHIFT) & _STATE_LEVEL_MASK)
+    neural = np.int64((state >> _STATE_NEURAL_SHIFT) & _STATE_LEVEL_MASK)
+    neural_present = (state & _STATE_NEURAL_PRESENT) != 0
+    behavior_present = (state & _STATE_BEHAVIOR_PRESENT) != 0
+    genome_present = (state & _STATE_GENOME_PRESENT) != 0
+    features = potential_features[i]
+    
+    # Les niveaux ne changent qu'aux transitions, qui interrompent la boucle : les conditions qui en
+    # dépendent sont évaluées une fois par appel
+    is_multi = multi != _MC_NONE
+    neural_ready = (multi == _MC_COLONIAL or multi == _MC_COMPLEX) and neural != _NC_PREFRONTAL
+    level_adjustment = 1.0 - (neural / _NC_PREFRONTAL * 0.7)
+    
+    # Probabilité d'augmentation des comportements, dépendant de la complexité neurale
+    neural_factor = neural / _NC_PREFRONTAL if neural_present else 0.1
+    gradual_threshold = 0.05 * neural_factor
+    gradual_scale = _DELTA_SPAN / gradual_threshold if gradual_threshold > 0.0 else 0.0
+    
+    # Traits émergents déjà permis par le niveau neural (masque de seuils)
+    active = _TRAIT_THRESHOLDS <= neural
+    if not neural_present:
+        active[:] = False
+    
+    generations = rolls.shape[0]
+    
+    while gen < generations:
+        # Étape 1: Évolution de la multicellularité
+        if step == _STEP_MULTICELLULARITY:
+            if not is_multi:
+                features[0] = gene_counts[i, _SIM_ADHESION] / 10.0
+                features[1] = gene_counts[i, _SIM_SIGNALING] / 10.0
+                features[2] = gene_counts[i, _SIM_REGULATORY] / 10.0
+                features[3] = min(1.0, genome_size[i] / 1000.0)
+                potential = 0.0
+                for k in range(features.shape[0]):
+                    potential += features[k] * potential_weights[k]
+                potential = min(1.0, potential)
                 
-                # Enregistrer l'événement évolutif
-                evolution_history.append({
-                    "generation": gen,
-                    "event": "multicellularity_evolution",
-                    "type": evolved_data.get("multicellularity_type", MulticellularityType.NONE).name
-                })
+                # Transition rare
+                if rolls[gen, _ROLL_MULTICELLULARITY] < potential * 0.01:
+                    states[i] = state
+                    return gen, _STEP_MULTICELLULARITY
+            step = _STEP_NEURAL
         
         # Étape 2: Évolution neurale (si multicellulaire)
-        if evolved_data.get("multicellularity_type", MulticellularityType.NONE) != MulticellularityType.NONE:
-            # Calculer le potentiel d'évolution neurale
-            potential = neural_evolution.calculate_neural_complexity_potential(evolved_data)
-            
-            # Probabilité d'évolution vers une complexité neurale supérieure
-            if random.random() < potential * 0.005:  # Transition très rare
-                # Faire évoluer vers une complexité neurale supérieure
-                old_complexity = evolved_data.get("neural_complexity", NeuralComplexity.NONE)
-                evolved_data = neural_evolution.evolve_neural_complexity(evolved_data, 100)
-                new_complexity = evolved_data.get("neural_complexity", NeuralComplexity.NONE)
+        if step == _STEP_NEURAL:
+            if is_multi:
+                potential = 0.0
+                if neural_ready:
+                    genome_factors = (
+                        0.4 * min(1.0, gene_counts[i, _SIM_NEURAL] / 20.0) +
+                        0.3 * min(1.0, gene_counts[i, _SIM_SIGNALING] / 15.0) +
+                        0.3 * min(1.0, gene_counts[i, _SIM_DEVELOPMENT] / 15.0)
+                    )
+                    behavior_factors = 0.0
+                    for k in range(_GRADUAL_TRAIT_W.shape[0]):
+                        if state & _STATE_TRAIT_BITS[k]:
+                            behavior_factors += _GRADUAL_TRAIT_W[k] * behavior[i, k]
+                    potential = 0.3 * genome_factors + 0.3 * neural_env_factor[i] + 0.4 * behavior_factors
+                    potential = min(1.0, potential * level_adjustment)
                 
-                if old_complexity != new_complexity:
-                    # Enregistrer l'événement évolutif
-                    evolution_history.append({
-                        "generation": gen,
-                        "event": "neural_evolution",
-                        "from": old_complexity.name,
-                        "to": new_complexity.name
-                    })
+                # Transition très rare
+                if rolls[gen, _ROLL_NEURAL] < potential * 0.005:
+                    states[i] = state
+                    return gen, _STEP_NEURAL
+            step = _STEP_GRADUAL
         
-        # Étape 3: Évolution génomique
-        if "genome" in evolved_data:
-            genome = evolved_data["genome"]
-            
-            # Mutation aléatoire des gènes
-            mutation_rate = 0.01  # Taux de mutation de base
-            
-            # Augmenter la taille du génome (rarement)
-            if random.random() < mutation_rate * 0.1:
-                genome["size"] = int(genome["size"] * (1.0 + random.uniform(0.01, 0.05)))
-            
-            # Ajouter de nouveaux gènes (rarement)
-            for gene_type in ["genes", "regulatory_genes", "adhesion_genes", "signaling_genes", 
-                             "differentiation_genes", "neural_genes", "development_genes"]:
-                if gene_type in genome:
-                    if random.random() < mutation_rate:
-                        genome[gene_type].append(f"{gene_type[:-1]}_{len(genome[gene_type]) + 1}")
+        # Étape 3: Évolution génomique (mutations tirées à l'avance)
+        if genome_present:
+            # Augmenter la taille du génome (facteur 1.0 pour les générations sans croissance)
+            genome_size[i] = int(genome_size[i] * genome_growth[gen])
+            
+            # Ajouter de nouveaux gènes
+            for j in range(gene_counts.shape[1]):
+                if state & _STATE_GENE_BITS[j] and gene_mutations[gen, j]:
+                    gene_counts[i, j] += 1
         
         # Étape 4: Évolution comportementale
-        if "behavior" in evolved_data:
-            behavior = evolved_data["behavior"]
-            
-            # Évolution graduelle des comportements
-            for trait in ["locomotion_complexity", "social_complexity", "feeding_complexity", "learning_capacity"]:
-                if trait in behavior:
-                    # Probabilité d'augmentation dépendant de la complexité neurale
-                    neural_factor = 0.1
-                    if "neural_complexity" in evolved_data:
-                        neural_factor = evolved_data["neural_complexity"].value / NeuralComplexity.PREFRONTAL_CORTEX.value
-                    
-                    if random.random() < 0.05 * neural_factor:
-                        behavior[trait] = min(1.0, behavior[trait] + random.uniform(0.01, 0.05))
+        if behavior_present:
+            # Évolution graduelle des comportements : l'incrément est calculé dans tous les cas
+            # et retenu par sélection, sans branchement sur le tirage
+            for k in range(_GRADUAL_TRAIT_W.shape[0]):
+                if state & _STATE_TRAIT_BITS[k]:
+                    roll = rolls[gen, _ROLL_GRADUAL + k]
+                    value = min(1.0, behavior[i, k] + _DELTA_MIN + gradual_scale * roll)
+                    behavior[i, k] = value if roll < gradual_threshold else behavior[i, k]
             
             # Ajouter de nouveaux comportements avec l'évolution neurale
-            if "neural_complexity" in evolved_data:
-                if evolved_data["neural_complexity"].value >= NeuralComplexity.COMPLEX_BRAIN.value:
-                    if "tool_use" not in behavior:
-                        behavior["tool_use"] = 0.1
-                    elif random.random() < 0.05:
-                        behavior["tool_use"] = min(1.0, behavior["tool_use"] + random.uniform(0.01, 0.05))
+            for t in range(_TRAIT_THRESHOLDS.shape[0]):
+                if active[t]:
+                    k = _GRADUAL_TRAITS + t
+                    if state & _STATE_TRAIT_BITS[k]:
+                        roll = rolls[gen, _ROLL_EMERGING + t]
+                        value = min(1.0, behavior[i, k] + _DELTA_MIN + (_DELTA_SPAN / 0.05) * roll)
+                        behavior[i, k] = value if roll < 0.05 else behavior[i, k]
+                    else:
+                        state |= _STATE_TRAIT_BITS[k]
+                        behavior[i, k] = _TRAIT_INITIAL[t]
+        
+        gen += 1
+        step = _STEP_MULTICELLULARITY
+    
+    states[i] = state
+    return generations, 0
+
+# Constantes de _simulate_kernel en valeurs Python, pour _simulate_row (hors d'un noyau compilé,
+# les calculs sur des scalaires NumPy sont bien plus lents que sur des nombres Python)
+_ROW_TRAIT_BITS = tuple(_STATE_TRAIT_BITS.tolist())
+_ROW_GENE_BITS = tuple(_STATE_GENE_BITS.tolist())
+_ROW_GRADUAL_TRAIT_W = tuple(_GRADUAL_TRAIT_W.tolist())
+_ROW_TRAIT_THRESHOLDS = tuple(_TRAIT_THRESHOLDS.tolist())
+_ROW_TRAIT_INITIAL = tuple(_TRAIT_INITIAL.tolist())
+_ROW_POTENTIAL_WEIGHTS = tuple(_POTENTIAL_WEIGHTS.tolist())
+
+def _simulate_row(pool: OrganismPool, i: int, draws: _SimulationDraws, gen: int, step: int) -> Tuple[int, int]:
+    """
+    Équivalent de _simulate_kernel sur des nombres Python, utilisé lorsque numba n'est pas installé.
+    
+    La ligne i et les tirages restants sont convertis en listes avant la boucle, puis la ligne est
+    reportée dans l'ensemble.
+    
+    Args:
+        pool: Organismes
+        i: Indice de l'organisme
+        draws: Tirages de la simulation
+        gen: Génération de reprise
+        step: Étape de reprise dans la génération (_STEP_*)
+        
+    Returns:
+        Tuple[int, int]: (génération, étape) de la transition tirée, ou (generations, 0) en fin de simulation
+    """
+    multi, neural = (int(level) for level in _state_levels(pool.state[i]))
+    state = int(pool.state[i])
+    neural_present = bool(state & int(_STATE_NEURAL_PRESENT))
+    behavior_present = bool(state & int(_STATE_BEHAVIOR_PRESENT))
+    genome_present = bool(state & int(_STATE_GENOME_PRESENT))
+    behavior = pool.behavior[i].tolist()
+    genome_size = int(pool.genome_size[i])
+    gene_counts = pool.gene_counts[i].tolist()
+    features = pool.potential_features[i].tolist()
+    env_factor = float(pool.neural_env_factor[i])
+    
+    # Tirages des générations restantes (la génération g est à l'indice g - first)
+    first = gen
+    rolls = draws.rolls[first:].tolist()
+    gene_mutations = draws.gene_mutations[first:].tolist()
+    genome_growth = draws.genome_growth[first:].tolist()
+    generations = draws.rolls.shape[0]
+    
+    # Conditions fixes jusqu'à la prochaine transition (voir _simulate_kernel)
+    is_multi = multi != _MC_NONE
+    neural_ready = (multi == _MC_COLONIAL or multi == _MC_COMPLEX) and neural != _NC_PREFRONTAL
+    level_adjustment = 1.0 - (neural / _NC_PREFRONTAL * 0.7)
+    neural_factor = neural / _NC_PREFRONTAL if neural_present else 0.1
+    gradual_threshold = 0.05 * neural_factor
+    gradual_scale = _DELTA_SPAN / gradual_threshold if gradual_threshold > 0.0 else 0.0
+    active = [neural_present and threshold <= neural for threshold in _ROW_TRAIT_THRESHOLDS]
+    
+    while gen < generations:
+        draw = rolls[gen - first]
+        
+        # Étape 1: Évolution de la multicellularité
+        if step == _STEP_MULTICELLULARITY:
+            if not is_multi:
+                features[0] = gene_counts[_SIM_ADHESION] / 10.0
+                features[1] = gene_counts[_SIM_SIGNALING] / 10.0
+                features[2] = gene_counts[_SIM_REGULATORY] / 10.0
+                features[3] = min(1.0, genome_size / 1000.0)
+                potential = 0.0
+                for feature, weight in zip(features, _ROW_POTENTIAL_WEIGHTS):
+                    potential += feature * weight
+                potential = min(1.0, potential)
                 
-                if evolved_data["neural_complexity"].value >= NeuralComplexity.NEOCORTEX.value:
-                    if "communication" not in behavior:
-                        behavior["communication"] = 0.2
-                    elif random.random() < 0.05:
-                        behavior["communication"] = min(1.0, behavior["communication"] + random.uniform(0.01, 0.05))
+                # Transition rare
+                if draw[_ROLL_MULTICELLULARITY] < potential * 0.01:
+                    break
+            step = _STEP_NEURAL
+        
+        # Étape 2: Évolution neurale (si multicellulaire)
+        if step == _STEP_NEURAL:
+            if is_multi:
+                potential = 0.0
+                if neural_ready:
+                    genome_factors = (
+                        0.4 * min(1.0, gene_counts[_SIM_NEURAL] / 20.0) +
+                        0.3 * min(1.0, gene_counts[_SIM_SIGNALING] / 15.0) +
+                        0.3 * min(1.0, gene_counts[_SIM_DEVELOPMENT] / 15.0)
+                    )
+                    behavior_factors = 0.0
+                    for k, weight in enumerate(_ROW_GRADUAL_TRAIT_W):
+                        if state & _ROW_TRAIT_BITS[k]:
+                            behavior_factors += weight * behavior[k]
+                    potential = 0.3 * genome_factors + 0.3 * env_factor + 0.4 * behavior_factors
+                    potential = min(1.0, potential * level_adjustment)
                 
-                if evolved_data["neural_complexity"].value >= NeuralComplexity.PREFRONTAL_CORTEX.value:
-                    if "abstract_thinking" not in behavior:
-                        behavior["abstract_thinking"] = 0.3
-                    elif random.random() < 0.05:
-                        behavior["abstract_thinking"] = min(1.0, behavior["abstract_thinking"] + random.uniform(0.01, 0.05))
+                # Transition très rare
+                if draw[_ROLL_NEURAL] < potential * 0.005:
+                    break
+            step = _STEP_GRADUAL
+        
+        # Étape 3: Évolution génomique (mutations tirées à l'avance)
+        if genome_present:
+            genome_size = int(genome_size * genome_growth[gen - first])
+            for j, mutated in enumerate(gene_mutations[gen - first]):
+                if mutated and state & _ROW_GENE_BITS[j]:
+                    gene_counts[j] += 1
+        
+        # Étape 4: Évolution comportementale
+        if behavior_present:
+            for k in range(len(_ROW_GRADUAL_TRAIT_W)):
+                if state & _ROW_TRAIT_BITS[k]:
+                    roll = draw[_ROLL_GRADUAL + k]
+                    if roll < gradual_threshold:
+                        behavior[k] = min(1.0, behavior[k] + _DELTA_MIN + gradual_scale * roll)
+            
+            for t in range(len(_ROW_TRAIT_THRESHOLDS)):
+                if active[t]:
+                    k = _GRADUAL_TRAITS + t
+                    if state & _ROW_TRAIT_BITS[k]:
+                        roll = draw[_ROLL_EMERGING + t]
+                        if roll < 0.05:
+                            behavior[k] = min(1.0, behavior[k] + _DELTA_MIN + (_DELTA_SPAN / 0.05) * roll)
+                    else:
+                        state |= _ROW_TRAIT_BITS[k]
+                        behavior[k] = _ROW_TRAIT_INITIAL[t]
+        
+        gen += 1
+        step = _STEP_MULTICELLULARITY
+    
+    pool.state[i] = state
+    pool.behavior[i] = behavior
+    pool.genome_size[i] = genome_size
+    pool.gene_counts[i] = gene_counts
+    pool.potential_features[i] = features
+    
+    if gen < generations:
+        return gen, step
+    return generations, 0
+
+def _simulate_pool_row(pool: OrganismPool, i: int, draws: _SimulationDraws, gen: int, step: int) -> Tuple[int, int]:
+    """
+    Exécute _simulate_kernel sur la ligne i jusqu'à la prochaine transition ou la fin de la simulation.
+    
+    Args:
+        pool: Organismes
+        i: Indice de l'organisme
+        draws: Tirages de la simulation
+        gen: Génération de reprise
+        step: Étape de reprise dans la génération (_STEP_*)
+        
+    Returns:
+        Tuple[int, int]: (génération, étape) de la transition tirée, ou (generations, 0) en fin de simulation
+    """
+    if not NUMBA_ENABLED:
+        return _simulate_row(pool, i, draws, gen, step)
+    
+    gen, step = _simulate_kernel(
+        i, pool.state, pool.behavior, pool.genome_size, pool.gene_counts, pool.potential_features,
+        _POTENTIAL_WEIGHTS, pool.neural_env_factor, draws.rolls, draws.gene_mutations, draws.genome_growth,
+        gen, step
+    )
+    return int(gen), int(step)
+
+# Nombre d'organismes simulés ensemble par simulate_evolution_population (borne la mémoire des tirages)
+_POPULATION_BLOCK = 256
+
+@njit(parallel=True, cache=True)
+def _simulate_population_kernel(rows, states, behavior, genome_size, gene_counts, potential_features,
+                                potential_weights, neural_env_factor, rolls, gene_mutations, genome_growth,
+                                gens, steps):
+    """
+    Exécute _simulate_kernel sur plusieurs lignes d'un OrganismPool, en parallèle.
+    
+    Les organismes sont indépendants : chaque itération de prange avance une ligne jusqu'à sa prochaine
+    transition ou la fin de la simulation, avec ses propres tirages, et n'écrit que dans cette ligne.
+    
+    Args:
+        rows: Indices des organismes dans l'ensemble
+        states ... neural_env_factor: Tableaux de l'OrganismPool (voir _simulate_kernel)
+        potential_weights: Poids du potentiel de multicellularité (_POTENTIAL_WEIGHTS)
+        rolls, gene_mutations, genome_growth: Tirages de chaque organisme (premier axe : rows)
+        gens: Génération de reprise par organisme, mise à jour en place
+        steps: Étape de reprise par organisme, mise à jour en place
+    """
+    generations = rolls.shape[1]
+    for n in prange(rows.shape[0]):
+        if gens[n] < generations:
+            gen, step = _simulate_kernel(
+                rows[n], states, behavior, genome_size, gene_counts, potential_features, potential_weights,
+                neural_env_factor, rolls[n], gene_mutations[n], genome_growth[n], gens[n], steps[n]
+            )
+            gens[n] = gen
+            steps[n] = step
+
+# Codes des événements enregistrés par simulate_evolution
+_EVENT_MULTICELLULARITY, _EVENT_NEURAL = 1, 2
+
+class EvolutionLog:
+    """
+    Journal des événements évolutifs d'une simulation, stocké par colonnes.
+    
+    Chaque événement occupe une ligne : génération, code de l'événement (_EVENT_*) et valeurs des
+    niveaux avant et après la transition (-1 si sans objet). Les dictionnaires de l'historique
+    ne sont construits qu'à la fin de la simulation, par to_records.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        """
+        Initialise un journal vide.
+        
+        Args:
+            capacity: Nombre d'événements prévus (le journal s'agrandit au besoin)
+        """
+        self.size = 0
+        self.generation = np.empty(capacity, dtype=np.int32)
+        self.event = np.empty(capacity, dtype=np.int8)
+        self.from_code = np.empty(capacity, dtype=np.int8)
+        self.to_code = np.empty(capacity, dtype=np.int8)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def append(self, generation: int, event: int, from_code: int = -1, to_code: int = -1) -> None:
+        """
+        Enregistre un événement.
+        
+        Args:
+            generation: Génération de l'événement
+            event: Code de l'événement (_EVENT_*)
+            from_code: Valeur du niveau avant la transition (-1 si sans objet)
+            to_code: Valeur du niveau après la transition
+        """
+        if self.size == self.generation.shape[0]:
+            capacity = 2 * self.size
+            for name in ("generation", "event", "from_code", "to_code"):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:self.size] = column
+                setattr(self, name, grown)
+        
+        n = self.size
+        self.generation[n] = generation
+        self.event[n] = event
+        self.from_code[n] = from_code
+        self.to_code[n] = to_code
+        self.size = n + 1
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Convertit le journal en entrées de l'historique d'évolution d'un organisme.
+        
+        Returns:
+            List[Dict[str, Any]]: Un dictionnaire par événement, dans l'ordre d'enregistrement
+        """
+        records = []
+        for gen, event, from_code, to_code in zip(self.generation[:self.size].tolist(), self.event[:self.size].tolist(),
+                                                  self.from_code[:self.size].tolist(), self.to_code[:self.size].tolist()):
+            if event == _EVENT_MULTICELLULARITY:
+                records.append({
+                    "generation": gen,
+                    "event": "multicellularity_evolution",
+                    "type": _MC_TYPES[to_code].name
+                })
+            else:
+                records.append({
+                    "generation": gen,
+                    "event": "neural_evolution",
+                    "from": NeuralComplexity(from_code).name,
+                    "to": NeuralComplexity(to_code).name
+                })
+        return records
+
+def _simulate_transition(pool: OrganismPool, i: int, evolved_data: Dict[str, Any], gen: int, step: int,
+                         evolution_log: EvolutionLog, multicellularity_mechanism: 'MulticellularityMechanism',
+                         neural_evolution: 'NeuralEvolution') -> Dict[str, Any]:
+    """
+    Applique une transition tirée par _simulate_kernel avec le mécanisme d'évolution correspondant.
+    
+    Args:
+        pool: Organismes
+        i: Indice de l'organisme
+        evolved_data: Données de l'organisme chargées dans la ligne i
+        gen: Génération de la transition
+        step: Étape de la transition (_STEP_MULTICELLULARITY ou _STEP_NEURAL)
+        evolution_log: Journal des événements de l'organisme
+        multicellularity_mechanism: Mécanisme de multicellularité
+        neural_evolution: Mécanisme d'évolution neurale
+        
+    Returns:
+        Dict[str, Any]: Données de l'organisme après la transition (rechargées dans la ligne i)
+    """
+    # Niveau neural courant, lu dans l'ensemble avant la transition
+    old_complexity = int(_state_levels(pool.state[i])[1])
+    pool.store(i, evolved_data)
+    
+    if step == _STEP_MULTICELLULARITY:
+        # Faire évoluer vers la multicellularité
+        evolved_data = multicellularity_mechanism.evolve_multicellularity(evolved_data, 100)
+        
+        # Enregistrer l'événement évolutif
+        evolution_log.append(gen, _EVENT_MULTICELLULARITY,
+                             to_code=evolved_data.get("multicellularity_type", _MC_NONE))
+        pool.load(i, evolved_data)
+    else:
+        # Faire évoluer vers une complexité neurale supérieure
+        evolved_data = neural_evolution.evolve_neural_complexity(evolved_data, 100)
+        pool.load(i, evolved_data)
+        
+        new_complexity = int(_state_levels(pool.state[i])[1])
+        if old_complexity != new_complexity:
+            # Enregistrer l'événement évolutif
+            evolution_log.append(gen, _EVENT_NEURAL, old_complexity, new_complexity)
+    
+    return evolved_data
+
+def _simulate_organism(organism_data: Dict[str, Any], draws: _SimulationDraws, pool: OrganismPool,
+                       multicellularity_mechanism: 'MulticellularityMechanism',
+                       neural_evolution: 'NeuralEvolution') -> Dict[str, Any]:
+    """
+    Simule l'évolution d'un organisme avec des tirages déjà effectués (voir simulate_evolution).
+    
+    Args:
+        organism_data: Données initiales de l'organisme
+        draws: Tirages de la simulation (leur nombre de lignes fixe le nombre de générations)
+        pool: Ensemble d'un organisme, réutilisable d'un appel à l'autre (la ligne 0 est rechargée)
+        multicellularity_mechanism: Mécanisme de multicellularité
+        neural_evolution: Mécanisme d'évolution neurale
+        
+    Returns:
+        Dict[str, Any]: Données de l'organisme après évolution
+    """
+    # Copier les données initiales ; le comportement, le génome et l'historique ne sont copiés
+    # qu'au moment de leur modification (voir OrganismPool.store)
+    evolved_data = dict(organism_data)
+    generations = draws.rolls.shape[0]
+    
+    # Historique d'évolution (par colonnes pendant la simulation)
+    evolution_log = EvolutionLog()
+    
+    # État de l'organisme par colonnes ; les générations sans transition sont simulées par un noyau
+    # compilé, les dictionnaires n'étant relus ou mis à jour qu'autour des transitions évolutives
+    pool.load(0, evolved_data)
+    gen, step = _simulate_pool_row(pool, 0, draws, 0, _STEP_MULTICELLULARITY)
+    
+    while gen < generations:
+        evolved_data = _simulate_transition(pool, 0, evolved_data, gen, step, evolution_log,
+                                            multicellularity_mechanism, neural_evolution)
+        
+        # Reprendre à l'étape suivante de la même génération
+        gen, step = _simulate_pool_row(pool, 0, draws, gen, step + 1)
+    
+    # Reporter l'état final dans les données de l'organisme
+    pool.store(0, evolved_data)
     
     # Ajouter l'historique d'évolution
-    if "evolution_history" not in evolved_data:
-        evolved_data["evolution_history"] = []
-    evolved_data["evolution_history"].extend(evolution_history)
+    evolved_data["evolution_history"] = evolved_data.get("evolution_history", []) + evolution_log.to_records()
+    
+    return evolved_data
+
+# Fonction pour simuler l'évolution d'un organisme
+def simulate_evolution(organism_data: Dict[str, Any], generations: int = 1000,
+                       rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
+    """
+    Simule l'évolution d'un organisme sur plusieurs générations.
+    
+    Args:
+        organism_data: Données initiales de l'organisme
+        generations: Nombre de générations à simuler
+        rng: Générateur des tirages de la simulation (par défaut, initialisé depuis le module random)
+        
+    Returns:
+        Dict[str, Any]: Données de l'organisme après évolution
+    """
+    # Tirer d'un bloc tous les nombres aléatoires de la simulation, une colonne par décision
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    draws = _draw_simulation(rng, generations)
+    
+    return _simulate_organism(organism_data, draws, OrganismPool(1),
+                              MulticellularityMechanism(), NeuralEvolution())
+
+@lru_cache(maxsize=8)
+def make_simulate(generations: int) -> Callable[..., Dict[str, Any]]:
+    """
+    Crée une fonction de simulation spécialisée pour un nombre de générations fixe.
+    
+    La fonction retournée se comporte comme simulate_evolution(organism_data, generations, rng), mais
+    réutilise d'un appel à l'autre ses tableaux de tirages, son ensemble d'un organisme et ses
+    mécanismes d'évolution. Elle est partagée entre les appelants d'un même nombre de générations :
+    elle ne doit pas être appelée depuis plusieurs threads à la fois.
+    
+    Args:
+        generations: Nombre de générations à simuler
+        
+    Returns:
+        Callable[..., Dict[str, Any]]: Fonction simulate(organism_data, rng=None)
+    """
+    draws = _draw_simulation(np.random.default_rng(0), generations)
+    pool = OrganismPool(1)
+    multicellularity_mechanism = MulticellularityMechanism()
+    neural_evolution = NeuralEvolution()
+    
+    def simulate(organism_data: Dict[str, Any], rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        _draw_simulation(rng, generations, draws)
+        return _simulate_organism(organism_data, draws, pool, multicellularity_mechanism, neural_evolution)
+    
+    return simulate
+
+def simulate_evolution_population(organisms: List[Dict[str, Any]], generations: int = 1000,
+                                  rng: Optional[np.random.Generator] = None) -> List[Dict[str, Any]]:
+    """
+    Simule l'évolution indépendante de plusieurs organismes, comme simulate_evolution.
+    
+    Les générations sans transition de tous les organismes sont simulées en parallèle par
+    _simulate_population_kernel ; les transitions sont ensuite appliquées organisme par organisme.
+    
+    Args:
+        organisms: Données initiales des organismes
+        generations: Nombre de générations à simuler
+        rng: Générateur dont sont dérivés les tirages de chaque organisme (par défaut, initialisé
+            depuis le module random)
+        
+    Returns:
+        List[Dict[str, Any]]: Données des organismes après évolution, dans le même ordre
+    """
+    # Copier les données initiales (copies superficielles, voir OrganismPool.store)
+    evolved = [dict(organism_data) for organism_data in organisms]
+    
+    # Créer les mécanismes d'évolution
+    multicellularity_mechanism = MulticellularityMechanism()
+    neural_evolution = NeuralEvolution()
+    
+    # Historique d'évolution de chaque organisme
+    evolution_logs = [EvolutionLog() for _ in evolved]
+    
+    pool = OrganismPool.from_organisms(evolved)
+    
+    # Un générateur par organisme, pour que ses tirages ne dépendent pas du découpage en blocs
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    seeds = rng.integers(0, 2**63, size=len(evolved))
+    
+    for start in range(0, len(evolved), _POPULATION_BLOCK):
+        rows = np.arange(start, min(start + _POPULATION_BLOCK, len(evolved)))
+        draws = _SimulationDraws(*map(np.stack, zip(*(
+            _draw_simulation(np.random.default_rng(seed), generations) for seed in seeds[rows]
+        ))))
+        gens = np.zeros(len(rows), dtype=np.int64)
+        steps = np.full(len(rows), _STEP_MULTICELLULARITY, dtype=np.int64)
+        
+        while True:
+            if NUMBA_ENABLED:
+                _simulate_population_kernel(
+                    rows, pool.state, pool.behavior, pool.genome_size, pool.gene_counts, pool.potential_features,
+                    _POTENTIAL_WEIGHTS, pool.neural_env_factor, draws.rolls, draws.gene_mutations,
+                    draws.genome_growth, gens, steps
+                )
+            else:
+                for n in np.flatnonzero(gens < generations).tolist():
+                    row_draws = _SimulationDraws(draws.rolls[n], draws.gene_mutations[n], draws.genome_growth[n])
+                    gens[n], steps[n] = _simulate_row(pool, int(rows[n]), row_draws, int(gens[n]), int(steps[n]))
+            
+            # Organismes arrêtés sur une transition
+            pending = np.flatnonzero(gens < generations)
+            if pending.size == 0:
+                break
+            
+            for n in pending.tolist():
+                i = int(rows[n])
+                evolved[i] = _simulate_transition(pool, i, evolved[i], int(gens[n]), int(steps[n]),
+                                                  evolution_logs[i], multicellularity_mechanism, neural_evolution)
+                
+                # Reprendre à l'étape suivante de la même génération
+                steps[n] += 1
+    
+    for i, evolved_data in enumerate(evolved):
+        # Reporter l'état final dans les données de l'organisme
+        pool.store(i, evolved_data)
+        
+        # Ajouter l'historique d'évolution
+        evolved_data["evolution_history"] = (evolved_data.get("evolution_history", [])
+                                             + evolution_logs[i].to_records())
     
-    return evolved_data
\ No newline at end of file
+    return evolved
@@ -6,9 +6,33 @@ basés sur les principes scientifiques de l'évolution
 
 import random
 import math
+import itertools
+import numpy as np
 from enum import Enum
-from typing import List, Dict, Tuple, Optional, Set, Any, Callable
-import uuid
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Tuple, Optional, Set, Any, Callable, NamedTuple
+
+# Compilation JIT optionnelle des noyaux numériques
+try:
+    from numba import njit, prange
+    NUMBA_ENABLED = True
+except ImportError:
+    NUMBA_ENABLED = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Remplace numba.njit par un décorateur neutre lorsque numba n'est pas installé."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Précision de la matrice des traits des espèces : les traits sont des valeurs de 0.0 à 1.0, dont seuls
+# les écarts à 0.5 et des sommes pondérées sont calculés (les noyaux calculent en double précision)
+_TRAIT_DTYPE = np.float32
+
+# Optimisations flottantes des noyaux, sauf l'hypothèse d'absence de NaN : les traits absents sont des NaN
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
 
 class InteractionType(Enum):
     """Types d'interactions écologiques entre espèces."""
@@ -20,9 +44,333 @@ class InteractionType(Enum):
     AMENSALISM = 5       # Une espèce est affectée négativement sans bénéfice pour l'autre
     NEUTRALISM = 6       # Pas d'interaction significative
 
+# Effet de base de chaque type d'interaction (ligne : InteractionType.value) pour l'espèce A et l'espèce B
+_BASE_EFFECT_TABLE = np.array([
+    [0.8, -0.8],   # PREDATION
+    [-0.5, -0.5],  # COMPETITION : négatif pour les deux espèces
+    [0.6, 0.6],    # MUTUALISM : positif pour les deux espèces
+    [0.5, 0.0],    # COMMENSALISM
+    [0.7, -0.6],   # PARASITISM
+    [0.0, -0.4],   # AMENSALISM
+    [0.0, 0.0],    # NEUTRALISM
+])
+
+# Probabilités de base de chaque type d'interaction, indexées par InteractionType.value
+# (voir CoevolutionSystem._determine_interaction_type)
+_BASE_INTERACTION_PROBABILITIES = np.array([
+    0.0,  # PREDATION
+    0.2,  # COMPETITION : probabilité de base
+    0.1,  # MUTUALISM
+    0.1,  # COMMENSALISM
+    0.1,  # PARASITISM
+    0.1,  # AMENSALISM
+    0.4,  # NEUTRALISM : probabilité de base élevée
+])
+
+# Traits déterminant le potentiel et le type d'interaction, codés par un bit dans les indicateurs d'une espèce
+_FLAG_CARNIVORE, _FLAG_HERBIVORE, _FLAG_POLLINATOR, _FLAG_FLOWER, _FLAG_PARASITE, _FLAG_COMMENSAL = (
+    1 << k for k in range(6)
+)
+_FLAG_PREDATOR, _FLAG_PREY, _FLAG_HOST, _FLAG_SYMBIONT = (1 << k for k in range(6, 10))
+_INTERACTION_FLAGS = (
+    ("carnivore", _FLAG_CARNIVORE),
+    ("herbivore", _FLAG_HERBIVORE),
+    ("pollinator", _FLAG_POLLINATOR),
+    ("flower", _FLAG_FLOWER),
+    ("parasite", _FLAG_PARASITE),
+    ("commensal", _FLAG_COMMENSAL),
+    ("predator", _FLAG_PREDATOR),
+    ("prey", _FLAG_PREY),
+    ("host", _FLAG_HOST),
+    ("symbiont", _FLAG_SYMBIONT)
+)
+
+# Traits complémentaires favorisant une interaction (exemple simplifié)
+_COMPLEMENTARY_PAIRS = (
+    (_FLAG_PREDATOR, _FLAG_PREY),
+    (_FLAG_POLLINATOR, _FLAG_FLOWER),
+    (_FLAG_HOST, _FLAG_SYMBIONT)
+)
+
+# Paires de traits potentiellement couplés (trait de la première espèce, trait de la deuxième, force)
+_POTENTIAL_COUPLINGS = (
+    # Prédation
+    ("attack_power", "defense_power", 0.7),
+    ("speed", "agility", 0.6),
+    ("sensory_acuity", "camouflage", 0.5),
+    
+    # Compétition
+    ("foraging_efficiency", "foraging_efficiency", 0.6),
+    ("growth_rate", "growth_rate", 0.5),
+    
+    # Mutualisme
+    ("nectar_production", "pollination_efficiency", 0.8),
+    ("root_system", "nitrogen_fixation", 0.7),
+    
+    # Parasitisme
+    ("immune_system", "infection_ability", 0.8),
+    ("toxin_production", "toxin_resistance", 0.7)
+)
+
+# Traits pouvant être couplés : seuls ceux-ci déterminent les couplages entre deux espèces
+_COUPLING_TRAITS = frozenset(trait for trait_a, trait_b, _ in _POTENTIAL_COUPLINGS for trait in (trait_a, trait_b))
+
+class _SpeciesProfile(NamedTuple):
+    """Données d'une espèce utilisées par detect_new_relationships, extraites une seule fois par espèce."""
+    habitat: frozenset  # Habitats (vide si inconnus)
+    taxonomy: Optional[Dict[str, Any]]  # Niveaux taxonomiques (None si inconnus)
+    diet: Optional[frozenset]  # Régime alimentaire (None si inconnu)
+    coupling_traits: frozenset  # Traits pouvant être couplés présents chez l'espèce (voir _COUPLING_TRAITS)
+    flags: int  # Indicateurs des traits déterminant les interactions (voir _INTERACTION_FLAGS)
+
+def _interaction_flags(traits: Dict[str, Any]) -> int:
+    """
+    Code les traits d'une espèce déterminant le potentiel et le type d'interaction (voir _INTERACTION_FLAGS).
+    
+    Args:
+        traits: Traits de l'espèce
+        
+    Returns:
+        int: Indicateurs des traits présents
+    """
+    flags = 0
+    for trait, flag in _INTERACTION_FLAGS:
+        if trait in traits:
+            flags |= flag
+    return flags
+
+def _species_profile(species_data: Dict[str, Any]) -> _SpeciesProfile:
+    """
+    Extrait les données d'une espèce utilisées pour détecter ses interactions.
+    
+    Args:
+        species_data: Données de l'espèce
+        
+    Returns:
+        _SpeciesProfile: Habitats, taxonomie, régime alimentaire, traits et indicateurs de l'espèce
+    """
+    traits = species_data.get("traits", {})
+    return _SpeciesProfile(
+        habitat=frozenset(species_data["habitat"]) if "habitat" in species_data else frozenset(),
+        taxonomy=species_data["taxonomy"] if "taxonomy" in species_data else None,
+        diet=frozenset(species_data["diet"]) if "diet" in species_data else None,
+        coupling_traits=_COUPLING_TRAITS.intersection(traits),
+        flags=_interaction_flags(traits)
+    )
+
+@lru_cache(maxsize=1024)
+def _couplings_for(traits_a: frozenset,
+                   traits_b: frozenset) -> Tuple[Tuple[str, Tuple[Tuple[str, float], ...]], ...]:
+    """
+    Couplages de traits entre deux espèces, mis en cache par combinaison de traits pouvant être couplés.
+    
+    Args:
+        traits_a: Traits pouvant être couplés de la première espèce (voir _COUPLING_TRAITS)
+        traits_b: Traits pouvant être couplés de la deuxième espèce
+        
+    Returns:
+        Tuple[Tuple[str, Tuple[Tuple[str, float], ...]], ...]: Couplages figés, (trait de la première
+        espèce, ((trait de la deuxième espèce, force), ...)) (voir CoevolutionSystem._create_trait_couplings)
+    """
+    trait_couplings = {}
+    
+    # Créer les couplages
+    for trait_a, trait_b, strength in _POTENTIAL_COUPLINGS:
+        if trait_a in traits_a and trait_b in traits_b:
+            if trait_a not in trait_couplings:
+                trait_couplings[trait_a] = {}
+            trait_couplings[trait_a][trait_b] = strength
+        
+        # Couplage inverse
+        if trait_b in traits_a and trait_a in traits_b:
+            if trait_b not in trait_couplings:
+                trait_couplings[trait_b] = {}
+            trait_couplings[trait_b][trait_a] = strength
+    
+    return tuple((trait, tuple(couplings.items())) for trait, couplings in trait_couplings.items())
+
+def _incidence_matrix(item_sets: List[Set[Any]]) -> np.ndarray:
+    """
+    Construit la matrice d'incidence d'une liste d'ensembles.
+    
+    Args:
+        item_sets: Ensembles d'éléments
+        
+    Returns:
+        np.ndarray: Matrice (ensemble, élément) valant 1.0 si l'élément appartient à l'ensemble
+    """
+    columns = {}
+    rows, cols = [], []
+    for i, items in enumerate(item_sets):
+        for item in items:
+            rows.append(i)
+            cols.append(columns.setdefault(item, len(columns)))
+    
+    matrix = np.zeros((len(item_sets), len(columns)))
+    matrix[rows, cols] = 1.0
+    return matrix
+
+# Nombre d'années minimal entre deux copies des traits dans l'historique d'une relation
+HISTORY_SNAPSHOT_INTERVAL = 100
+
+def _pair_key(species_a_id: str, species_b_id: str) -> Tuple[str, str]:
+    """
+    Clé d'une paire d'espèces dans le réseau d'interactions, indépendante de l'ordre des espèces.
+    
+    Args:
+        species_a_id: ID de la première espèce
+        species_b_id: ID de la deuxième espèce
+        
+    Returns:
+        Tuple[str, str]: IDs des deux espèces triés
+    """
+    return (species_a_id, species_b_id) if species_a_id <= species_b_id else (species_b_id, species_a_id)
+
+def _trait_values(traits: Dict[str, float], trait_names: Tuple[str, ...]) -> np.ndarray:
+    """
+    Extrait les valeurs de traits dans l'ordre donné.
+    
+    Args:
+        traits: Traits phénotypiques d'une espèce
+        trait_names: Noms des traits à extraire
+        
+    Returns:
+        np.ndarray: Valeurs des traits (NaN si l'espèce n'a pas le trait)
+    """
+    return np.fromiter((traits.get(trait_name, np.nan) for trait_name in trait_names),
+                       dtype=np.float64, count=len(trait_names))
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _fitness_kernel(base_effect, strength, values, coupling_totals):
+    """
+    Effet d'une relation sur la fitness d'une espèce (voir CoevolutionaryRelationship.calculate_fitness_effect).
+    
+    Args:
+        base_effect: Effet de base du type d'interaction pour l'espèce
+        strength: Force de l'interaction
+        values: Valeurs des traits couplés de l'espèce A (NaN si absent)
+        coupling_totals: Somme des forces des couplages de chaque trait
+        
+    Returns:
+        float: Effet sur la fitness (-1.0 à 1.0)
+    """
+    trait_effect = 0.0
+    trait_count = 0
+    for k in range(values.shape[0]):
+        if not np.isnan(values[k]):
+            # L'effet est maximal quand le trait est à sa valeur optimale (0.5)
+            trait_match = 1.0 - abs(values[k] - 0.5) * 2.0
+            trait_effect += trait_match * coupling_totals[k]
+            trait_count += 1
+    
+    # Calculer l'effet moyen des traits
+    if trait_count > 0:
+        trait_effect /= trait_count
+    
+    return base_effect * strength * (0.5 + 0.5 * trait_effect)
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _pressure_kernel(other_values, own_index, other_index, coupling_strengths, trait_count):
+    """
+    Pressions coévolutives exercées sur les traits d'une espèce par les couplages d'une relation.
+    
+    Args:
+        other_values: Valeurs des traits couplés de l'autre espèce (NaN si absent)
+        own_index: Indice du trait de l'espèce pour chaque couplage
+        other_index: Indice du trait de l'autre espèce (dans other_values) pour chaque couplage
+        coupling_strengths: Force de chaque couplage
+        trait_count: Nombre de traits couplés de l'espèce
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Pression sur chaque trait (avant la force de l'interaction)
+        et nombre de couplages dont le trait de l'autre espèce est connu
+    """
+    pressures = np.zeros(trait_count)
+    counts = np.zeros(trait_count)
+    for k in range(coupling_strengths.shape[0]):
+        other_value = other_values[other_index[k]]
+        if not np.isnan(other_value):
+            # Pression positive si le trait de l'autre espèce dépasse 0.5, négative sinon
+            direction = (other_value - 0.5) * 2.0
+            pressures[own_index[k]] += direction * coupling_strengths[k]
+            counts[own_index[k]] += 1.0
+    return pressures, counts
+
+@njit(parallel=True, cache=True, fastmath=_FASTMATH)
+def _batch_fitness(entry_ptr, entry_ranks, entry_sides, entry_present, base_effects, strengths,
+                   trait_ptr, trait_columns, coupling_totals, trait_matrix, out):
+    """
+    Effet combiné des relations sur la fitness de chaque espèce (voir CoevolutionSystem.calculate_fitness_effects).
+    
+    Les espèces sont indépendantes : chaque itération de prange traite une ligne de la matrice des traits
+    et écrit son résultat dans out.
+    
+    Args:
+        entry_ptr: Début des relations de chaque espèce dans entry_ranks (une case de plus que d'espèces)
+        entry_ranks: Rang de chaque relation des espèces
+        entry_sides: Côté de l'espèce dans chaque relation (0 pour l'espèce A, 1 pour l'espèce B)
+        entry_present: Présence de l'autre espèce de chaque relation dans la matrice
+        base_effects: Effets de base de chaque relation pour l'espèce A et l'espèce B
+        strengths: Force de chaque relation
+        trait_ptr: Début des traits couplés de l'espèce A de chaque relation dans trait_columns
+        trait_columns: Colonnes des traits couplés de l'espèce A dans la matrice des traits
+        coupling_totals: Somme des forces des couplages de chaque trait couplé (rangée comme trait_columns)
+        trait_matrix: Matrice des traits (espèce, trait), NaN si absent
+        out: Effet combiné sur la fitness de chaque espèce, rempli en place
+    """
+    for i in prange(entry_ptr.shape[0] - 1):
+        total_effect = 0.0
+        relationship_count = 0
+        for e in range(entry_ptr[i], entry_ptr[i + 1]):
+            if entry_present[e]:
+                rank = entry_ranks[e]
+                start, end = trait_ptr[rank], trait_ptr[rank + 1]
+                total_effect += _fitness_kernel(base_effects[rank, entry_sides[e]], strengths[rank],
+                                                trait_matrix[i][trait_columns[start:end]],
+                                                coupling_totals[start:end])
+                relationship_count += 1
+        
+        # Calculer l'effet moyen
+        out[i] = total_effect / relationship_count if relationship_count > 0 else 0.0
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _distance_kernel(values_a, values_b, coupling_a, coupling_b, coupling_strengths):
+    """
+    Distance évolutive moyenne, pondérée par les couplages, entre les traits couplés de deux espèces.
+    
+    Args:
+        values_a: Valeurs des traits couplés de l'espèce A (NaN si absent)
+        values_b: Valeurs des traits couplés de l'espèce B (NaN si absent)
+        coupling_a: Indice du trait de l'espèce A pour chaque couplage
+        coupling_b: Indice du trait de l'espèce B pour chaque couplage
+        coupling_strengths: Force de chaque couplage
+        
+    Returns:
+        float: Distance évolutive
+    """
+    evolutionary_distance = 0.0
+    coupling_count = 0
+    for k in range(coupling_strengths.shape[0]):
+        trait_distance = abs(values_a[coupling_a[k]] - values_b[coupling_b[k]])
+        if not np.isnan(trait_distance):
+            evolutionary_distance += trait_distance * coupling_strengths[k]
+            coupling_count += 1
+    
+    if coupling_count > 0:
+        evolutionary_distance /= coupling_count
+    return evolutionary_distance
+
 class CoevolutionaryRelationship:
     """Représente une relation coévolutive entre deux espèces."""
     
+    __slots__ = ("id", "species_a_id", "species_b_id", "interaction_type", "strength", "trait_couplings",
+                 "description", "establishment_time", "evolutionary_history", "snapshot_interval",
+                 "_last_snapshot_year", "_base_effects", "_coupled_traits", "_partner_traits", "_coupling_a",
+                 "_coupling_b", "_coupling_strengths", "_coupling_totals", "_sides")
+    
+    # Identifiants des relations, attribués dans l'ordre de création
+    _next_id = itertools.count(1)
+    
     def __init__(self, 
                  species_a_id: str,
                  species_b_id: str,
@@ -41,7 +389,7 @@ class CoevolutionaryRelationship:
             trait_couplings: Couplages entre traits des deux espèces
             description: Description textuelle de la relation
         """
-        self.id = str(uuid.uuid4())
+        self.id = next(CoevolutionaryRelationship._next_id)
         self.species_a_id = species_a_id
         self.species_b_id = species_b_id
         self.interaction_type = interaction_type
@@ -50,6 +398,59 @@ class CoevolutionaryRelationship:
         self.description = description or f"Relation coévolutive {interaction_type.name}"
         self.establishment_time = 0
         self.evolutionary_history = []
+        self.snapshot_interval = HISTORY_SNAPSHOT_INTERVAL  # Années entre deux copies des traits
+        self._last_snapshot_year = None
+        
+        # Effets de base du type d'interaction, indexés par côté (0 : espèce A, 1 : espèce B)
+        self._base_effects = tuple(_BASE_EFFECT_TABLE[interaction_type.value].tolist())
+        
+        # Couplages à plat : traits couplés des espèces A et B et, pour chaque couplage, indices de ses
+        # deux traits dans ces tuples et force du couplage
+        partner_index = {}
+        coupling_a, coupling_b, coupling_strengths = [], [], []
+        for i, couplings in enumerate(trait_couplings.values()):
+            for trait_b, coupling_strength in couplings.items():
+                coupling_a.append(i)
+                coupling_b.append(partner_index.setdefault(trait_b, len(partner_index)))
+                coupling_strengths.append(coupling_strength)
+        self._coupled_traits = tuple(trait_couplings)
+        self._partner_traits = tuple(partner_index)
+        self._coupling_a = np.array(coupling_a, dtype=np.intp)
+        self._coupling_b = np.array(coupling_b, dtype=np.intp)
+        self._coupling_strengths = np.array(coupling_strengths, dtype=np.float64)
+        
+        # Somme des forces des couplages de chaque trait de l'espèce A (voir calculate_fitness_effect)
+        self._coupling_totals = np.bincount(self._coupling_a, weights=self._coupling_strengths,
+                                            minlength=len(self._coupled_traits))
+        
+        # Couplages vus depuis chaque côté : (traits de l'espèce, indices de ses traits, indices des traits
+        # de l'autre espèce, traits de l'autre espèce) ; pour l'espèce B, les couplages sont inversés
+        self._sides = (
+            (self._coupled_traits, self._coupling_a, self._coupling_b, self._partner_traits),
+            (self._partner_traits, self._coupling_b, self._coupling_a, self._coupled_traits)
+        )
+        
+    def __getstate__(self) -> Dict[str, Any]:
+        """État sérialisable : les couplages partagés en lecture seule (voir _frozen_couplings) sont copiés."""
+        state = {slot: getattr(self, slot) for slot in self.__slots__ if hasattr(self, slot)}
+        state["trait_couplings"] = {trait: dict(couplings) for trait, couplings in self.trait_couplings.items()}
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+    
+    def get_side(self, species_id: str) -> int:
+        """
+        Obtient le côté d'une espèce dans cette relation.
+        
+        Args:
+            species_id: ID de l'espèce
+            
+        Returns:
+            int: 0 pour l'espèce A, 1 pour l'espèce B
+        """
+        return 0 if species_id == self.species_a_id else 1
         
     def calculate_fitness_effect(self, species_id: str, traits: Dict[str, float]) -> float:
         """
@@ -62,43 +463,36 @@ class CoevolutionaryRelationship:
         Returns:
             float: Effet sur la fitness (-1.0 à 1.0)
         """
-        # Déterminer si c'est l'espèce A ou B
-        is_species_a = species_id == self.species_a_id
-        
-        # Effet de base selon le type d'interaction
-        base_effect = self._get_base_effect(is_species_a)
-        
-        # Ajuster l'effet en fonction des traits
-        trait_effect = 0.0
-        trait_count = 0
-        
-        for trait_name, trait_value in traits.items():
-            # Vérifier si ce trait est impliqué dans un couplage
-            if trait_name in self.trait_couplings:
-                trait_count += 1
-                
-                # L'effet dépend de la valeur du trait et du couplage
-                coupling_effect = 0.0
-                
-                for coupled_trait, coupling_strength in self.trait_couplings[trait_name].items():
-                    # Pour simplifier, on suppose que la valeur optimale est 0.5
-                    # Dans un système réel, cela dépendrait des traits de l'autre espèce
-                    optimal_value = 0.5
-                    
-                    # L'effet est maximal quand le trait est à sa valeur optimale
-                    trait_match = 1.0 - abs(trait_value - optimal_value) * 2.0
-                    coupling_effect += trait_match * coupling_strength
-                
-                trait_effect += coupling_effect
-        
-        # Calculer l'effet moyen des traits
-        if trait_count > 0:
-            trait_effect /= trait_count
+        return self.calculate_fitness_effect_side(self.get_side(species_id), traits)
+    
+    def calculate_fitness_effect_side(self, side: int, traits: Dict[str, float]) -> float:
+        """
+        Calcule l'effet de cette relation sur la fitness de l'espèce d'un côté donné.
         
-        # Effet final combinant l'effet de base et l'effet des traits
-        final_effect = base_effect * self.strength * (0.5 + 0.5 * trait_effect)
+        Args:
+            side: Côté de l'espèce (0 pour l'espèce A, 1 pour l'espèce B, voir get_side)
+            traits: Traits phénotypiques de l'espèce
+            
+        Returns:
+            float: Effet sur la fitness (-1.0 à 1.0)
+        """
+        # Valeurs des traits impliqués dans un couplage
+        return self._fitness_effect_from_values(side, _trait_values(traits, self._coupled_traits))
+    
+    def _fitness_effect_from_values(self, side: int, values: np.ndarray) -> float:
+        """
+        Calcule l'effet de cette relation sur la fitness d'une espèce (voir calculate_fitness_effect).
         
-        return final_effect
+        Args:
+            side: Côté de l'espèce (0 pour l'espèce A, 1 pour l'espèce B)
+            values: Valeurs des traits de _coupled_traits pour l'espèce (NaN si absent)
+            
+        Returns:
+            float: Effet sur la fitness (-1.0 à 1.0)
+        """
+        # Pour simplifier, on suppose que la valeur optimale des traits est 0.5 ; dans un système réel,
+        # cela dépendrait des traits de l'autre espèce
+        return float(_fitness_kernel(self._base_effects[side], self.strength, values, self._coupling_totals))
     
     def _get_base_effect(self, is_species_a: bool) -> float:
         """
@@ -110,23 +504,10 @@ class CoevolutionaryRelationship:
         Returns:
             float: Effet de base (-1.0 à 1.0)
         """
-        if self.interaction_type == InteractionType.PREDATION:
-            return 0.8 if is_species_a else -0.8
-        elif self.interaction_type == InteractionType.COMPETITION:
-            return -0.5  # Négatif pour les deux espèces
-        elif self.interaction_type == InteractionType.MUTUALISM:
-            return 0.6  # Positif pour les deux espèces
-        elif self.interaction_type == InteractionType.COMMENSALISM:
-            return 0.5 if is_species_a else 0.0
-        elif self.interaction_type == InteractionType.PARASITISM:
-            return 0.7 if is_species_a else -0.6
-        elif self.interaction_type == InteractionType.AMENSALISM:
-            return 0.0 if is_species_a else -0.4
-        else:  # NEUTRALISM
-            return 0.0
+        return self._base_effects[0 if is_species_a else 1]
     
     def update_evolutionary_history(self, year: int, species_a_traits: Dict[str, float], 
-                                  species_b_traits: Dict[str, float]):
+                                  species_b_traits: Dict[str, float], snapshot_traits: bool = False):
         """
         Met à jour l'historique évolutif de cette relation.
         
@@ -134,30 +515,56 @@ class CoevolutionaryRelationship:
             year: Année de simulation
             species_a_traits: Traits de l'espèce A
             species_b_traits: Traits de l'espèce B
+            snapshot_traits: Copier les traits des deux espèces dans l'historique même si la dernière
+                copie date de moins de snapshot_interval années
         """
         # Calculer la "distance" évolutive entre les traits couplés
-        evolutionary_distance = 0.0
-        coupling_count = 0
+        evolutionary_distance = self._evolutionary_distance_from_values(
+            _trait_values(species_a_traits, self._coupled_traits),
+            _trait_values(species_b_traits, self._partner_traits)
+        )
+        self._record_history(year, evolutionary_distance, species_a_traits, species_b_traits, snapshot_traits)
+    
+    def _evolutionary_distance_from_values(self, values_a: np.ndarray, values_b: np.ndarray) -> float:
+        """
+        Calcule la distance évolutive moyenne, pondérée par les couplages, entre les traits couplés.
         
-        for trait_a, couplings in self.trait_couplings.items():
-            if trait_a in species_a_traits:
-                for trait_b, strength in couplings.items():
-                    if trait_b in species_b_traits:
-                        # Distance entre les traits couplés
-                        trait_distance = abs(species_a_traits[trait_a] - species_b_traits[trait_b])
-                        evolutionary_distance += trait_distance * strength
-                        coupling_count += 1
+        Args:
+            values_a: Valeurs des traits de _coupled_traits pour l'espèce A (NaN si absent)
+            values_b: Valeurs des traits de _partner_traits pour l'espèce B (NaN si absent)
+            
+        Returns:
+            float: Distance évolutive
+        """
+        return float(_distance_kernel(values_a, values_b, self._coupling_a, self._coupling_b,
+                                      self._coupling_strengths))
+    
+    def _record_history(self, year: int, evolutionary_distance: float, species_a_traits: Dict[str, float],
+                        species_b_traits: Dict[str, float], snapshot_traits: bool = False):
+        """
+        Ajoute un état évolutif à l'historique de cette relation.
         
-        if coupling_count > 0:
-            evolutionary_distance /= coupling_count
+        Chaque état contient l'année et la distance évolutive ; les traits des deux espèces n'y sont copiés
+        qu'au premier état, puis au plus une fois toutes les snapshot_interval années (ou sur demande).
         
+        Args:
+            year: Année de simulation
+            evolutionary_distance: Distance évolutive entre les traits couplés
+            species_a_traits: Traits de l'espèce A
+            species_b_traits: Traits de l'espèce B
+            snapshot_traits: Copier les traits quelle que soit la date de la dernière copie
+        """
         # Enregistrer l'état évolutif
-        self.evolutionary_history.append({
+        state = {
             "year": year,
-            "evolutionary_distance": evolutionary_distance,
-            "species_a_traits": species_a_traits.copy(),
-            "species_b_traits": species_b_traits.copy()
-        })
+            "evolutionary_distance": evolutionary_distance
+        }
+        if (snapshot_traits or self._last_snapshot_year is None
+                or year - self._last_snapshot_year >= self.snapshot_interval):
+            state["species_a_traits"] = species_a_traits.copy()
+            state["species_b_traits"] = species_b_traits.copy()
+            self._last_snapshot_year = year
+        self.evolutionary_history.append(state)
     
     def get_coevolutionary_pressure(self, species_id: str, other_species_traits: Dict[str, float]) -> Dict[str, float]:
         """
@@ -170,60 +577,49 @@ class CoevolutionaryRelationship:
         Returns:
             Dict[str, float]: Pression sur chaque trait (-1.0 à 1.0)
         """
-        # Déterminer si c'est l'espèce A ou B
-        is_species_a = species_id == self.species_a_id
+        return self.get_coevolutionary_pressure_side(self.get_side(species_id), other_species_traits)
+    
+    def get_coevolutionary_pressure_side(self, side: int, other_species_traits: Dict[str, float]) -> Dict[str, float]:
+        """
+        Calcule la pression coévolutive exercée sur l'espèce d'un côté donné.
         
-        # Traits de cette espèce impliqués dans des couplages
-        if is_species_a:
-            species_traits = self.trait_couplings.keys()
-        else:
-            # Pour l'espèce B, il faut inverser les couplages
-            species_traits = set()
-            for couplings in self.trait_couplings.values():
-                species_traits.update(couplings.keys())
-        
-        # Calculer la pression sur chaque trait
-        pressures = {}
-        
-        for trait in species_traits:
-            # Trouver les couplages impliquant ce trait
-            if is_species_a:
-                # Pour l'espèce A, le trait est la clé principale
-                if trait in self.trait_couplings:
-                    pressure = 0.0
-                    
-                    for other_trait, strength in self.trait_couplings[trait].items():
-                        if other_trait in other_species_traits:
-                            # La pression dépend de la valeur du trait de l'autre espèce
-                            other_value = other_species_traits[other_trait]
-                            
-                            # Calculer la direction de la pression
-                            # Si other_value > 0.5, pression positive, sinon négative
-                            direction = (other_value - 0.5) * 2.0
-                            
-                            pressure += direction * strength
-                    
-                    pressures[trait] = pressure * self.strength
-            else:
-                # Pour l'espèce B, le trait est dans les sous-dictionnaires
-                pressure = 0.0
-                count = 0
-                
-                for a_trait, couplings in self.trait_couplings.items():
-                    if trait in couplings and a_trait in other_species_traits:
-                        strength = couplings[trait]
-                        a_value = other_species_traits[a_trait]
-                        
-                        # Calculer la direction de la pression
-                        direction = (a_value - 0.5) * 2.0
-                        
-                        pressure += direction * strength
-                        count += 1
-                
-                if count > 0:
-                    pressures[trait] = pressure * self.strength / count
+        Args:
+            side: Côté de l'espèce (0 pour l'espèce A, 1 pour l'espèce B, voir get_side)
+            other_species_traits: Traits de l'autre espèce
+            
+        Returns:
+            Dict[str, float]: Pression sur chaque trait (-1.0 à 1.0)
+        """
+        # Traits de l'autre espèce impliqués dans des couplages
+        return self._pressure_from_values(side, _trait_values(other_species_traits, self._sides[side][3]))
+    
+    def _pressure_from_values(self, side: int, other_values: np.ndarray) -> Dict[str, float]:
+        """
+        Calcule la pression coévolutive exercée sur une espèce (voir get_coevolutionary_pressure).
+        
+        Args:
+            side: Côté de l'espèce (0 pour l'espèce A, 1 pour l'espèce B)
+            other_values: Valeurs des traits couplés de l'autre espèce, de _partner_traits pour l'espèce A
+                et de _coupled_traits pour l'espèce B (NaN si absent)
+            
+        Returns:
+            Dict[str, float]: Pression sur chaque trait (-1.0 à 1.0)
+        """
+        # Couplages vus depuis l'espèce
+        species_traits, own_index, other_index, _ = self._sides[side]
         
-        return pressures
+        pressures, counts = _pressure_kernel(other_values, own_index, other_index, self._coupling_strengths,
+                                             len(species_traits))
+        pressures *= self.strength
+        
+        if side == 0:
+            # Pour l'espèce A, chaque trait couplé reçoit une pression
+            return dict(zip(species_traits, pressures.tolist()))
+        
+        # Pour l'espèce B, la pression est moyennée sur les couplages dont le trait de l'autre espèce est connu
+        return {trait: pressure / count
+                for trait, pressure, count in zip(species_traits, pressures.tolist(), counts.tolist())
+                if count > 0}
 
 class CoevolutionSystem:
     """Système gérant les relations coévolutives entre espèces."""
@@ -232,7 +628,18 @@ class CoevolutionSystem:
         """Initialise le système de coévolution."""
         self.relationships = {}  # {relationship_id: CoevolutionaryRelationship}
         self.species_relationships = {}  # {species_id: [relationship_id]}
-        self.interaction_network = {}  # {(species_a_id, species_b_id): relationship_id}
+        self.interaction_network = {}  # {_pair_key(species_a_id, species_b_id): relationship_id}
+        
+        # Traits des espèces par colonnes (_TRAIT_DTYPE) : une ligne par espèce, une colonne par trait couplé
+        # dans une relation (NaN si l'espèce n'a pas le trait), voir rebuild_matrix
+        self._species_idx = {}  # {species_id: ligne}
+        self._trait_idx = {}  # {trait: colonne}
+        self._trait_names = ()  # Traits couplés, dans l'ordre des colonnes
+        self._trait_matrix = np.empty((0, 0), dtype=_TRAIT_DTYPE)
+        self._relationship_trait_ids = {}  # {relationship_id: (colonnes des traits A, colonnes des traits B)}
+        self._couplings = None  # Couplages de toutes les relations (voir _coupling_table)
+        self._species_sides = {}  # {species_id: [(relationship_id, côté de l'espèce, ID de l'autre espèce)]}
+        self._fitness_params = None  # Paramètres de fitness de toutes les relations (voir _fitness_table)
         
     def add_relationship(self, relationship: CoevolutionaryRelationship):
         """
@@ -252,9 +659,114 @@ class CoevolutionSystem:
             self.species_relationships[relationship.species_b_id] = []
         self.species_relationships[relationship.species_b_id].append(relationship.id)
         
+        # Côté de chaque espèce dans la relation (une relation d'une espèce avec elle-même la voit du côté A)
+        self._species_sides.setdefault(relationship.species_a_id, []).append(
+            (relationship.id, 0, relationship.species_b_id))
+        self._species_sides.setdefault(relationship.species_b_id, []).append(
+            (relationship.id, relationship.get_side(relationship.species_b_id), relationship.species_a_id))
+        
         # Mettre à jour le réseau d'interactions
-        self.interaction_network[(relationship.species_a_id, relationship.species_b_id)] = relationship.id
-        self.interaction_network[(relationship.species_b_id, relationship.species_a_id)] = relationship.id
+        self.interaction_network[_pair_key(relationship.species_a_id, relationship.species_b_id)] = relationship.id
+        
+        # Colonnes des traits couplés dans la matrice des traits
+        self._relationship_trait_ids[relationship.id] = (
+            self._register_traits(relationship._coupled_traits),
+            self._register_traits(relationship._partner_traits)
+        )
+        self._couplings = None
+        self._fitness_params = None
+    
+    def _coupling_table(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Met bout à bout les couplages de toutes les relations (table reconstruite après un ajout).
+        
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Pour chaque couplage, rang de sa relation
+            dans self.relationships, colonnes des traits A et B dans la matrice des traits et force
+        """
+        if self._couplings is None:
+            ranks = [np.empty(0, dtype=np.intp)]
+            columns_a = [np.empty(0, dtype=np.intp)]
+            columns_b = [np.empty(0, dtype=np.intp)]
+            strengths = [np.empty(0)]
+            for rank, (rel_id, relationship) in enumerate(self.relationships.items()):
+                trait_ids_a, trait_ids_b = self._relationship_trait_ids[rel_id]
+                ranks.append(np.full(len(relationship._coupling_strengths), rank, dtype=np.intp))
+                columns_a.append(trait_ids_a[relationship._coupling_a])
+                columns_b.append(trait_ids_b[relationship._coupling_b])
+                strengths.append(relationship._coupling_strengths)
+            self._couplings = tuple(map(np.concatenate, (ranks, columns_a, columns_b, strengths)))
+        return self._couplings
+    
+    def _fitness_table(self) -> Tuple[Dict[int, int], np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Met bout à bout les paramètres de fitness de toutes les relations (table reconstruite après un ajout).
+        
+        Returns:
+            Tuple[Dict[int, int], np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Rang de chaque relation
+            dans self.relationships, effets de base pour l'espèce A et l'espèce B, début des traits couplés
+            de l'espèce A de chaque relation, colonnes de ces traits et somme des forces de leurs couplages
+        """
+        if self._fitness_params is None:
+            ranks = {rel_id: rank for rank, rel_id in enumerate(self.relationships)}
+            base_effects = np.array([relationship._base_effects for relationship in self.relationships.values()],
+                                    dtype=np.float64).reshape(len(ranks), 2)
+            trait_ptr = np.zeros(len(ranks) + 1, dtype=np.intp)
+            trait_ptr[1:] = np.cumsum([len(relationship._coupled_traits)
+                                       for relationship in self.relationships.values()])
+            trait_columns = np.concatenate([np.empty(0, dtype=np.intp)]
+                                           + [self._relationship_trait_ids[rel_id][0] for rel_id in ranks])
+            coupling_totals = np.concatenate([np.empty(0)] + [relationship._coupling_totals
+                                                              for relationship in self.relationships.values()])
+            self._fitness_params = (ranks, base_effects, trait_ptr, trait_columns, coupling_totals)
+        return self._fitness_params
+    
+    def _register_traits(self, trait_names: Tuple[str, ...]) -> np.ndarray:
+        """
+        Attribue une colonne de la matrice des traits à chaque trait (les colonnes existantes sont conservées).
+        
+        Args:
+            trait_names: Noms des traits
+            
+        Returns:
+            np.ndarray: Colonnes des traits
+        """
+        trait_ids = np.array([self._trait_idx.setdefault(trait_name, len(self._trait_idx))
+                              for trait_name in trait_names], dtype=np.intp)
+        
+        # Nouveaux traits : colonnes vides dans la matrice courante
+        missing = len(self._trait_idx) - self._trait_matrix.shape[1]
+        if missing > 0:
+            self._trait_names = tuple(self._trait_idx)
+            self._trait_matrix = np.hstack([
+                self._trait_matrix, np.full((self._trait_matrix.shape[0], missing), np.nan, dtype=_TRAIT_DTYPE)
+            ])
+        return trait_ids
+    
+    def _trait_row(self, traits: Dict[str, float]) -> np.ndarray:
+        """
+        Construit une ligne de la matrice des traits.
+        
+        Args:
+            traits: Traits phénotypiques d'une espèce
+            
+        Returns:
+            np.ndarray: Valeurs des traits couplés (NaN si l'espèce n'a pas le trait)
+        """
+        # Seuls les traits couplés sont lus, quel que soit le nombre de traits de l'espèce
+        return _trait_values(traits, self._trait_names)
+    
+    def rebuild_matrix(self, all_species_traits: Dict[str, Dict[str, float]]):
+        """
+        Reconstruit la matrice des traits des espèces (update_relationships, calculate_all_fitness_effects).
+        
+        Args:
+            all_species_traits: Traits de toutes les espèces {species_id: {trait: value}}
+        """
+        self._species_idx = {species_id: i for i, species_id in enumerate(all_species_traits)}
+        self._trait_matrix = np.empty((len(all_species_traits), len(self._trait_names)), dtype=_TRAIT_DTYPE)
+        for i, traits in enumerate(all_species_traits.values()):
+            self._trait_matrix[i] = self._trait_row(traits)
     
     def get_species_relationships(self, species_id: str) -> List[CoevolutionaryRelationship]:
         """
@@ -282,9 +794,9 @@ class CoevolutionSystem:
         Returns:
             Optional[CoevolutionaryRelationship]: Relation coévolutive ou None
         """
-        rel_id = self.interaction_network.get((species_a_id, species_b_id))
+        rel_id = self.interaction_network.get(_pair_key(species_a_id, species_b_id))
         
-        if rel_id:
+        if rel_id is not None:
             return self.relationships[rel_id]
             
         return None
@@ -302,21 +814,20 @@ class CoevolutionSystem:
         Returns:
             float: Effet combiné sur la fitness
         """
-        if species_id not in self.species_relationships:
+        if species_id not in self._species_sides:
             return 0.0
             
         total_effect = 0.0
         relationship_count = 0
         
-        for rel_id in self.species_relationships[species_id]:
-            relationship = self.relationships[rel_id]
-            
-            # Déterminer l'autre espèce
-            other_id = relationship.species_b_id if species_id == relationship.species_a_id else relationship.species_a_id
-            
+        # Traits de l'espèce, rangés comme une ligne de la matrice des traits
+        row = self._trait_row(traits)
+        
+        for rel_id, side, other_id in self._species_sides[species_id]:
             # Vérifier si les traits de l'autre espèce sont disponibles
             if other_id in other_species:
-                effect = relationship.calculate_fitness_effect(species_id, traits)
+                effect = self.relationships[rel_id]._fitness_effect_from_values(
+                    side, row[self._relationship_trait_ids[rel_id][0]])
                 total_effect += effect
                 relationship_count += 1
         
@@ -326,6 +837,42 @@ class CoevolutionSystem:
         else:
             return 0.0
     
+    def calculate_all_fitness_effects(self, all_species_traits: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+        """
+        Calcule l'effet combiné des relations sur la fitness de toutes les espèces en une passe.
+        
+        Équivaut à calculate_fitness_effects(species_id, traits, all_species_traits) pour chaque espèce,
+        les espèces étant traitées en parallèle sur la matrice des traits.
+        
+        Args:
+            all_species_traits: Traits de toutes les espèces {species_id: {trait: value}}
+            
+        Returns:
+            Dict[str, float]: Effet combiné sur la fitness de chaque espèce
+        """
+        # Les traits peuvent avoir changé depuis le dernier appel (même dictionnaire modifié en place)
+        self.rebuild_matrix(all_species_traits)
+        ranks, base_effects, trait_ptr, trait_columns, coupling_totals = self._fitness_table()
+        strengths = np.fromiter((relationship.strength for relationship in self.relationships.values()),
+                                dtype=np.float64, count=len(self.relationships))
+        
+        # Relations de chaque espèce, dans l'ordre des lignes de la matrice
+        entry_ptr = [0]
+        entry_ranks, entry_sides, entry_present = [], [], []
+        for species_id in self._species_idx:
+            for rel_id, side, other_id in self._species_sides.get(species_id, ()):
+                entry_ranks.append(ranks[rel_id])
+                entry_sides.append(side)
+                entry_present.append(other_id in self._species_idx)
+            entry_ptr.append(len(entry_ranks))
+        
+        effects = np.empty(len(self._species_idx))
+        _batch_fitness(np.array(entry_ptr, dtype=np.intp), np.array(entry_ranks, dtype=np.intp),
+                       np.array(entry_sides, dtype=np.intp), np.array(entry_present, dtype=np.bool_),
+                       base_effects, strengths, trait_ptr, trait_columns, coupling_totals,
+                       self._trait_matrix, effects)
+        return dict(zip(self._species_idx, effects.tolist()))
+    
     def get_coevolutionary_pressures(self, species_id: str, 
                                    other_species: Dict[str, Dict[str, float]]) -> Dict[str, float]:
         """
@@ -338,20 +885,17 @@ class CoevolutionSystem:
         Returns:
             Dict[str, float]: Pressions combinées sur chaque trait
         """
-        if species_id not in self.species_relationships:
+        if species_id not in self._species_sides:
             return {}
             
         combined_pressures = {}
         
-        for rel_id in self.species_relationships[species_id]:
-            relationship = self.relationships[rel_id]
-            
-            # Déterminer l'autre espèce
-            other_id = relationship.species_b_id if species_id == relationship.species_a_id else relationship.species_a_id
-            
+        for rel_id, side, other_id in self._species_sides[species_id]:
             # Vérifier si les traits de l'autre espèce sont disponibles
             if other_id in other_species:
-                pressures = relationship.get_coevolutionary_pressure(species_id, other_species[other_id])
+                # Traits couplés de l'autre espèce, lus à chaque appel dans les traits fournis
+                pressures = self.relationships[rel_id].get_coevolutionary_pressure_side(side,
+                                                                                     other_species[other_id])
                 
                 # Combiner les pressions
                 for trait, pressure in pressures.items():
@@ -361,25 +905,50 @@ class CoevolutionSystem:
         
         return combined_pressures
     
-    def update_relationships(self, year: int, all_species_traits: Dict[str, Dict[str, float]]):
+    def update_relationships(self, year: int, all_species_traits: Dict[str, Dict[str, float]],
+                             snapshot_traits: bool = False):
         """
         Met à jour toutes les relations coévolutives.
         
         Args:
             year: Année de simulation
             all_species_traits: Traits de toutes les espèces {species_id: {trait: value}}
+            snapshot_traits: Copier les traits des espèces dans l'historique de chaque relation
+                (voir CoevolutionaryRelationship.update_evolutionary_history)
         """
-        for relationship in self.relationships.values():
-            # Vérifier si les deux espèces existent toujours
-            if (relationship.species_a_id in all_species_traits and 
-                relationship.species_b_id in all_species_traits):
-                
-                # Mettre à jour l'historique évolutif
-                relationship.update_evolutionary_history(
-                    year,
-                    all_species_traits[relationship.species_a_id],
-                    all_species_traits[relationship.species_b_id]
-                )
+        self.rebuild_matrix(all_species_traits)
+        
+        # Vérifier si les deux espèces de chaque relation existent toujours
+        relationships = list(self.relationships.values())
+        rows_a = np.array([self._species_idx.get(relationship.species_a_id, -1) for relationship in relationships],
+                          dtype=np.intp)
+        rows_b = np.array([self._species_idx.get(relationship.species_b_id, -1) for relationship in relationships],
+                          dtype=np.intp)
+        active = (rows_a >= 0) & (rows_b >= 0)
+        if not active.any():
+            return
+        
+        # Distances évolutives de toutes les relations en une passe sur leurs couplages : distance entre
+        # les traits couplés présents chez les deux espèces, moyennée par relation
+        ranks, columns_a, columns_b, coupling_strengths = self._coupling_table()
+        trait_distances = np.abs(self._trait_matrix[rows_a[ranks], columns_a]
+                                 - self._trait_matrix[rows_b[ranks], columns_b])
+        present = active[ranks] & ~np.isnan(trait_distances)
+        totals = np.bincount(ranks, weights=np.where(present, trait_distances * coupling_strengths, 0.0),
+                             minlength=len(relationships))
+        counts = np.bincount(ranks, weights=present, minlength=len(relationships))
+        distances = np.divide(totals, counts, out=np.zeros(len(relationships)), where=counts > 0)
+        
+        # Mettre à jour l'historique évolutif
+        for relationship, evolutionary_distance in zip(itertools.compress(relationships, active),
+                                                       distances[active].tolist()):
+            relationship._record_history(
+                year,
+                evolutionary_distance,
+                all_species_traits[relationship.species_a_id],
+                all_species_traits[relationship.species_b_id],
+                snapshot_traits
+            )
     
     def detect_new_relationships(self, species_data: Dict[str, Any], 
                                interaction_threshold: float = 0.3) -> List[CoevolutionaryRelationship]:
@@ -395,240 +964,254 @@ class CoevolutionSystem:
         """
         new_relationships = []
         
-        # Toutes les paires d'espèces possibles
+        # Données des espèces utilisées par le potentiel, le type d'interaction et les couplages,
+        # extraites en une seule passe
         species_ids = list(species_data.keys())
+        profiles = [_species_profile(data) for data in species_data.values()]
         
-        for i in range(len(species_ids)):
-            for j in range(i + 1, len(species_ids)):
-                species_a_id = species_ids[i]
-                species_b_id = species_ids[j]
-                
-                # Vérifier si une relation existe déjà
-                if (species_a_id, species_b_id) in self.interaction_network:
-                    continue
-                
-                # Calculer le potentiel d'interaction
-                interaction_potential = self._calculate_interaction_potential(
-                    species_data[species_a_id],
-                    species_data[species_b_id]
-                )
-                
-                # Si le potentiel est suffisant, créer une nouvelle relation
-                if interaction_potential >= interaction_threshold:
-                    # Déterminer le type d'interaction le plus probable
-                    interaction_type = self._determine_interaction_type(
-                        species_data[species_a_id],
-                        species_data[species_b_id]
-                    )
-                    
-                    # Créer les couplages de traits
-                    trait_couplings = self._create_trait_couplings(
-                        species_data[species_a_id],
-                        species_data[species_b_id]
-                    )
-                    
-                    # Créer la relation
-                    relationship = CoevolutionaryRelationship(
-                        species_a_id=species_a_id,
-                        species_b_id=species_b_id,
-                        interaction_type=interaction_type,
-                        strength=interaction_potential,
-                        trait_couplings=trait_couplings,
-                        description=f"Relation {interaction_type.name} entre {species_a_id} et {species_b_id}"
-                    )
-                    
-                    new_relationships.append(relationship)
+        # Potentiel d'interaction des paires d'espèces pouvant atteindre le seuil
+        potentials = self._interaction_potentials(profiles, interaction_threshold)
+        
+        # Paires (i < j) dont le potentiel est suffisant, dans l'ordre des espèces
+        candidates = np.triu(potentials >= interaction_threshold, k=1)
+        
+        for i, j in zip(*np.nonzero(candidates)):
+            species_a_id = species_ids[i]
+            species_b_id = species_ids[j]
+            
+            # Vérifier si une relation existe déjà
+            if _pair_key(species_a_id, species_b_id) in self.interaction_network:
+                continue
+            
+            # Déterminer le type d'interaction le plus probable
+            profile_a, profile_b = profiles[i], profiles[j]
+            interaction_type = self._determine_interaction_type(profile_a.flags, profile_b.flags,
+                                                                profile_a.diet, profile_b.diet)
+            
+            # Créer les couplages de traits
+            trait_couplings = self._create_trait_couplings(profile_a.coupling_traits, profile_b.coupling_traits)
+            
+            # Créer la relation
+            relationship = CoevolutionaryRelationship(
+                species_a_id=species_a_id,
+                species_b_id=species_b_id,
+                interaction_type=interaction_type,
+                strength=float(potentials[i, j]),
+                trait_couplings=trait_couplings,
+                description=f"Relation {interaction_type.name} entre {species_a_id} et {species_b_id}"
+            )
+            
+            new_relationships.append(relationship)
         
         return new_relationships
     
-    def _calculate_interaction_potential(self, species_a_data: Dict[str, Any], 
-                                       species_b_data: Dict[str, Any]) -> float:
+    def _interaction_potentials(self, profiles: List[_SpeciesProfile],
+                                interaction_threshold: Optional[float] = None) -> np.ndarray:
         """
-        Calcule le potentiel d'interaction entre deux espèces.
+        Calcule le potentiel d'interaction de toutes les paires d'espèces.
+        
+        Les ensembles des espèces (habitats, traits complémentaires, niveaux taxonomiques) sont convertis
+        en matrices d'incidence : les tailles des intersections de toutes les paires sont alors données
+        par un produit matriciel.
+        
+        Avec un seuil, la proximité phylogénétique (jusqu'à 0.2 du potentiel) n'est calculée que pour
+        les paires (i < j) que l'habitat et la complémentarité écologique laissent en mesure de l'atteindre ;
+        le potentiel des autres paires vaut 0.0.
         
         Args:
-            species_a_data: Données de la première espèce
-            species_b_data: Données de la deuxième espèce
+            profiles: Données des espèces (voir _species_profile)
+            interaction_threshold: Seuil d'interaction (None pour calculer toutes les paires)
             
         Returns:
-            float: Potentiel d'interaction (0.0 à 1.0)
+            np.ndarray: Potentiels d'interaction (0.0 à 1.0) ; pour i < j, la ligne i est la première espèce
         """
-        # Facteurs influençant le potentiel d'interaction
+        n = len(profiles)
         
-        # 1. Chevauchement d'habitat
-        habitat_overlap = 0.5  # Valeur par défaut
-        if "habitat" in species_a_data and "habitat" in species_b_data:
-            # Calculer le chevauchement réel
-            habitat_a = set(species_a_data["habitat"])
-            habitat_b = set(species_b_data["habitat"])
-            
-            if habitat_a and habitat_b:
-                habitat_overlap = len(habitat_a & habitat_b) / len(habitat_a | habitat_b)
-        
-        # 2. Complémentarité écologique
-        ecological_complementarity = 0.0
-        if "traits" in species_a_data and "traits" in species_b_data:
-            # Calculer la complémentarité des traits
-            traits_a = species_a_data["traits"]
-            traits_b = species_b_data["traits"]
-            
-            # Traits complémentaires (exemple simplifié)
-            complementary_pairs = [
-                ("predator", "prey"),
-                ("pollinator", "flower"),
-                ("host", "symbiont")
-            ]
-            
-            for trait_a, trait_b in complementary_pairs:
-                if trait_a in traits_a and trait_b in traits_b:
-                    ecological_complementarity += 0.3
-                elif trait_b in traits_a and trait_a in traits_b:
-                    ecological_complementarity += 0.3
-            
-            ecological_complementarity = min(1.0, ecological_complementarity)
-        
-        # 3. Proximité phylogénétique
-        phylogenetic_proximity = 0.5  # Valeur par défaut
-        if "taxonomy" in species_a_data and "taxonomy" in species_b_data:
-            # Calculer la proximité phylogénétique
-            taxonomy_a = species_a_data["taxonomy"]
-            taxonomy_b = species_b_data["taxonomy"]
-            
-            # Compter les niveaux taxonomiques communs
-            common_levels = 0
-            total_levels = 0
-            
-            for level in taxonomy_a:
-                if level in taxonomy_b and taxonomy_a[level] == taxonomy_b[level]:
-                    common_levels += 1
-                total_levels += 1
-            
-            if total_levels > 0:
-                phylogenetic_proximity = common_levels / total_levels
-        
-        # Combiner les facteurs
-        interaction_potential = (
-            habitat_overlap * 0.4 +
-            ecological_complementarity * 0.4 +
-            (1.0 - phylogenetic_proximity) * 0.2  # Les espèces plus éloignées ont plus de potentiel d'interaction
+        # 1. Chevauchement d'habitat (valeur par défaut si l'une des espèces n'a pas d'habitat)
+        habitats = [profile.habitat for profile in profiles]
+        has_habitat = np.array([bool(habitat) for habitat in habitats], dtype=bool)
+        habitat_matrix = _incidence_matrix(habitats)
+        shared = habitat_matrix @ habitat_matrix.T
+        sizes = habitat_matrix.sum(axis=1)
+        habitat_overlap = np.full((n, n), 0.5)
+        np.divide(shared, sizes[:, None] + sizes[None, :] - shared, out=habitat_overlap,
+                  where=has_habitat[:, None] & has_habitat[None, :])
+        
+        # 2. Complémentarité écologique (indicateurs nuls pour les espèces sans traits)
+        flags = np.array([profile.flags for profile in profiles], dtype=np.int64)
+        ecological_complementarity = np.zeros((n, n))
+        for flag_a, flag_b in _COMPLEMENTARY_PAIRS:
+            has_a = (flags & flag_a) != 0
+            has_b = (flags & flag_b) != 0
+            complementary = (has_a[:, None] & has_b[None, :]) | (has_b[:, None] & has_a[None, :])
+            ecological_complementarity += np.where(complementary, 0.3, 0.0)
+        ecological_complementarity = np.minimum(1.0, ecological_complementarity)
+        
+        # 3. Proximité phylogénétique (voir _phylogenetic_proximities) : les espèces plus éloignées ont plus
+        # de potentiel d'interaction
+        partial_potential = habitat_overlap * 0.4 + ecological_complementarity * 0.4
+        
+        if interaction_threshold is None:
+            return partial_potential + (1.0 - self._phylogenetic_proximities(profiles)) * 0.2
+        
+        # Paires pouvant encore atteindre le seuil avec la proximité phylogénétique la plus favorable
+        viable = np.triu(partial_potential + 0.2 >= interaction_threshold, k=1)
+        interaction_potential = np.zeros((n, n))
+        involved = np.flatnonzero(viable.any(axis=0) | viable.any(axis=1))
+        if len(involved) == 0:
+            return interaction_potential
+        
+        # Proximité phylogénétique des seules espèces impliquées dans ces paires
+        block = np.ix_(involved, involved)
+        interaction_potential[block] = (
+            partial_potential[block] +
+            (1.0 - self._phylogenetic_proximities([profiles[k] for k in involved])) * 0.2
         )
+        interaction_potential[~viable] = 0.0
         
         return interaction_potential
     
-    def _determine_interaction_type(self, species_a_data: Dict[str, Any], 
-                                  species_b_data: Dict[str, Any]) -> InteractionType:
+    def _phylogenetic_proximities(self, profiles: List[_SpeciesProfile]) -> np.ndarray:
+        """
+        Calcule la proximité phylogénétique de toutes les paires d'espèces : part des niveaux taxonomiques
+        de la première espèce partagés avec la deuxième (0.5 si l'une des taxonomies est inconnue).
+        
+        Args:
+            profiles: Données des espèces (voir _species_profile)
+            
+        Returns:
+            np.ndarray: Proximités phylogénétiques (0.0 à 1.0) ; la ligne i est la première espèce
+        """
+        n = len(profiles)
+        taxonomies = [profile.taxonomy for profile in profiles]
+        has_taxonomy = np.array([taxonomy is not None for taxonomy in taxonomies], dtype=bool)
+        total_levels = np.array([len(taxonomy) if taxonomy is not None else 0 for taxonomy in taxonomies],
+                                dtype=np.int64)
+        taxonomy_matrix = _incidence_matrix([set(taxonomy.items()) if taxonomy is not None else set()
+                                             for taxonomy in taxonomies])
+        
+        # Niveaux taxonomiques communs parmi ceux de la première espèce
+        common_levels = taxonomy_matrix @ taxonomy_matrix.T
+        phylogenetic_proximity = np.full((n, n), 0.5)
+        np.divide(common_levels, total_levels[:, None], out=phylogenetic_proximity,
+                  where=has_taxonomy[:, None] & has_taxonomy[None, :] & (total_levels[:, None] > 0))
+        
+        return phylogenetic_proximity
+    
+    def _determine_interaction_type(self, flags_a: int, flags_b: int, diet_a: Optional[frozenset],
+                                    diet_b: Optional[frozenset]) -> InteractionType:
         """
         Détermine le type d'interaction le plus probable entre deux espèces.
         
         Args:
-            species_a_data: Données de la première espèce
-            species_b_data: Données de la deuxième espèce
+            flags_a: Indicateurs des traits de la première espèce (voir _interaction_flags)
+            flags_b: Indicateurs des traits de la deuxième espèce
+            diet_a: Régime alimentaire de la première espèce (None si inconnu)
+            diet_b: Régime alimentaire de la deuxième espèce (None si inconnu)
             
         Returns:
             InteractionType: Type d'interaction le plus probable
         """
-        # Extraire les traits pertinents
-        traits_a = species_a_data.get("traits", {})
-        traits_b = species_b_data.get("traits", {})
-        
         # Calculer les probabilités pour chaque type d'interaction
-        probabilities = {
-            InteractionType.PREDATION: 0.0,
-            InteractionType.COMPETITION: 0.2,  # Probabilité de base
-            InteractionType.MUTUALISM: 0.1,
-            InteractionType.COMMENSALISM: 0.1,
-            InteractionType.PARASITISM: 0.1,
-            InteractionType.AMENSALISM: 0.1,
-            InteractionType.NEUTRALISM: 0.4  # Probabilité de base élevée
-        }
+        probabilities = _BASE_INTERACTION_PROBABILITIES.copy()
+        either = flags_a | flags_b
         
         # Ajuster les probabilités en fonction des traits
         
         # Prédation
-        if ("carnivore" in traits_a and "herbivore" in traits_b) or ("carnivore" in traits_b and "herbivore" in traits_a):
-            probabilities[InteractionType.PREDATION] += 0.4
+        if ((flags_a & _FLAG_CARNIVORE and flags_b & _FLAG_HERBIVORE)
+                or (flags_b & _FLAG_CARNIVORE and flags_a & _FLAG_HERBIVORE)):
+            probabilities[InteractionType.PREDATION.value] += 0.4
         
         # Compétition
-        if "diet" in species_a_data and "diet" in species_b_data:
-            diet_a = set(species_a_data["diet"])
-            diet_b = set(species_b_data["diet"])
-            
-            if diet_a and diet_b:
-                diet_overlap = len(diet_a & diet_b) / len(diet_a | diet_b)
-                probabilities[InteractionType.COMPETITION] += diet_overlap * 0.4
+        if diet_a and diet_b:
+            diet_overlap = len(diet_a & diet_b) / len(diet_a | diet_b)
+            probabilities[InteractionType.COMPETITION.value] += diet_overlap * 0.4
         
         # Mutualisme
-        if ("pollinator" in traits_a and "flower" in traits_b) or ("pollinator" in traits_b and "flower" in traits_a):
-            probabilities[InteractionType.MUTUALISM] += 0.4
+        if ((flags_a & _FLAG_POLLINATOR and flags_b & _FLAG_FLOWER)
+                or (flags_b & _FLAG_POLLINATOR and flags_a & _FLAG_FLOWER)):
+            probabilities[InteractionType.MUTUALISM.value] += 0.4
         
         # Parasitisme
-        if ("parasite" in traits_a) or ("parasite" in traits_b):
-            probabilities[InteractionType.PARASITISM] += 0.4
+        if either & _FLAG_PARASITE:
+            probabilities[InteractionType.PARASITISM.value] += 0.4
         
         # Commensalisme
-        if ("commensal" in traits_a) or ("commensal" in traits_b):
-            probabilities[InteractionType.COMMENSALISM] += 0.3
+        if either & _FLAG_COMMENSAL:
+            probabilities[InteractionType.COMMENSALISM.value] += 0.3
         
-        # Normaliser les probabilités
-        total = sum(probabilities.values())
-        if total > 0:
-            probabilities = {k: v / total for k, v in probabilities.items()}
-        
-        # Choisir le type d'interaction le plus probable
-        return max(probabilities.items(), key=lambda x: x[1])[0]
+        # Choisir le type d'interaction le plus probable (le premier en cas d'égalité) ; inutile de normaliser
+        # les probabilités, le maximum ne dépend pas de leur somme
+        return InteractionType(int(probabilities.argmax()))
     
-    def _create_trait_couplings(self, species_a_data: Dict[str, Any], 
-                              species_b_data: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    def _create_trait_couplings(self, traits_a: Dict[str, Any],
+                                traits_b: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
         """
         Crée les couplages de traits entre deux espèces.
         
         Args:
-            species_a_data: Données de la première espèce
-            species_b_data: Données de la deuxième espèce
+            traits_a: Traits (ou noms des traits) de la première espèce
+            traits_b: Traits (ou noms des traits) de la deuxième espèce
             
         Returns:
             Dict[str, Dict[str, float]]: Couplages de traits
         """
-        trait_couplings = {}
-        
-        # Extraire les traits pertinents
-        traits_a = species_a_data.get("traits", {})
-        traits_b = species_b_data.get("traits", {})
-        
-        # Définir des paires de traits potentiellement couplés
-        potential_couplings = [
-            # Prédation
-            ("attack_power", "defense_power", 0.7),
-            ("speed", "agility", 0.6),
-            ("sensory_acuity", "camouflage", 0.5),
-            
-            # Compétition
-            ("foraging_efficiency", "foraging_efficiency", 0.6),
-            ("growth_rate", "growth_rate", 0.5),
-            
-            # Mutualisme
-            ("nectar_production", "pollination_efficiency", 0.8),
-            ("root_system", "nitrogen_fixation", 0.7),
-            
-            # Parasitisme
-            ("immune_system", "infection_ability", 0.8),
-            ("toxin_production", "toxin_resistance", 0.7)
-        ]
-        
-        # Créer les couplages
-        for trait_a, trait_b, strength in potential_couplings:
-            if trait_a in traits_a and trait_b in traits_b:
-                if trait_a not in trait_couplings:
-                    trait_couplings[trait_a] = {}
-                trait_couplings[trait_a][trait_b] = strength
-            
-            # Couplage inverse
-            if trait_b in traits_a and trait_a in traits_b:
-                if trait_b not in trait_couplings:
-                    trait_couplings[trait_b] = {}
-                trait_couplings[trait_b][trait_a] = strength
+        # Les couplages ne dépendent que des traits pouvant être couplés présents chez chaque espèce
+        frozen_couplings = _couplings_for(_COUPLING_TRAITS.intersection(traits_a),
+                                          _COUPLING_TRAITS.intersection(traits_b))
+        return {trait: dict(couplings) for trait, couplings in frozen_couplings}
+
+def _frozen_couplings(trait_couplings: Dict[str, Dict[str, float]]) -> MappingProxyType:
+    """
+    Fige des couplages de traits pour les partager entre relations (voir les fonctions create_*_relationship).
+    
+    Les relations les recopient en dictionnaires lorsqu'elles sont sérialisées (voir
+    CoevolutionaryRelationship.__getstate__).
+    
+    Args:
+        trait_couplings: Couplages entre traits des deux espèces
         
-        return trait_couplings
+    Returns:
+        MappingProxyType: Couplages en lecture seule, y compris ceux de chaque trait
+    """
+    return MappingProxyType({trait: MappingProxyType(couplings) for trait, couplings in trait_couplings.items()})
+
+# Couplages de traits typiques d'une relation prédateur-proie
+_PREDATOR_PREY_COUPLINGS = _frozen_couplings({
+    # Traits du prédateur
+    "speed": {"speed": 0.8},  # Vitesse du prédateur vs vitesse de la proie
+    "attack_power": {"defense_power": 0.7},  # Attaque vs défense
+    "sensory_acuity": {"camouflage": 0.6},  # Perception vs camouflage
+    "metabolism_efficiency": {"energy_content": 0.5}  # Efficacité vs valeur énergétique
+})
+
+# Couplages de traits typiques d'une relation plante-pollinisateur
+_PLANT_POLLINATOR_COUPLINGS = _frozen_couplings({
+    # Traits de la plante
+    "flower_shape": {"mouth_parts": 0.9},  # Forme de la fleur vs pièces buccales
+    "nectar_production": {"energy_efficiency": 0.8},  # Production de nectar vs efficacité énergétique
+    "flower_color": {"color_perception": 0.7},  # Couleur de la fleur vs perception des couleurs
+    "flowering_time": {"activity_pattern": 0.6}  # Période de floraison vs période d'activité
+})
+
+# Couplages de traits typiques d'une relation hôte-parasite
+_HOST_PARASITE_COUPLINGS = _frozen_couplings({
+    # Traits du parasite
+    "infection_ability": {"immune_system": 0.9},  # Capacité d'infection vs système immunitaire
+    "toxin_resistance": {"toxin_production": 0.8},  # Résistance aux toxines vs production de toxines
+    "host_specificity": {"tissue_composition": 0.7},  # Spécificité d'hôte vs composition tissulaire
+    "life_cycle": {"longevity": 0.6}  # Cycle de vie vs longévité
+})
+
+# Couplages de traits typiques d'une relation de compétition
+_COMPETITION_COUPLINGS = _frozen_couplings({
+    # Traits de l'espèce A
+    "foraging_efficiency": {"foraging_efficiency": 0.8},  # Efficacité de recherche de nourriture
+    "growth_rate": {"growth_rate": 0.7},  # Taux de croissance
+    "resource_utilization": {"resource_utilization": 0.9},  # Utilisation des ressources
+    "territorial_behavior": {"territorial_behavior": 0.6}  # Comportement territorial
+})
 
 # Fonctions utilitaires pour créer des relations coévolutives prédéfinies
 def create_predator_prey_relationship(predator_id: str, prey_id: str, strength: float = 0.7) -> CoevolutionaryRelationship:
@@ -643,21 +1226,12 @@ def create_predator_prey_relationship(predator_id: str, prey_id: str, strength:
     Returns:
         CoevolutionaryRelationship: Relation prédateur-proie
     """
-    # Couplages de traits typiques d'une relation prédateur-proie
-    trait_couplings = {
-        # Traits du prédateur
-        "speed": {"speed": 0.8},  # Vitesse du prédateur vs vitesse de la proie
-        "attack_power": {"defense_power": 0.7},  # Attaque vs défense
-        "sensory_acuity": {"camouflage": 0.6},  # Perception vs camouflage
-        "metabolism_efficiency": {"energy_content": 0.5}  # Efficacité vs valeur énergétique
-    }
-    
     return CoevolutionaryRelationship(
         species_a_id=predator_id,
         species_b_id=prey_id,
         interaction_type=InteractionType.PREDATION,
         strength=strength,
-        trait_couplings=trait_couplings,
+        trait_couplings=_PREDATOR_PREY_COUPLINGS,
         description=f"Relation prédateur-proie entre {predator_id} (prédateur) et {prey_id} (proie)"
     )
 
@@ -673,21 +1247,12 @@ def create_plant_pollinator_relationship(plant_id: str, pollinator_id: str, stre
     Returns:
         CoevolutionaryRelationship: Relation plante-pollinisateur
     """
-    # Couplages de traits typiques d'une relation plante-pollinisateur
-    trait_couplings = {
-        # Traits de la plante
-        "flower_shape": {"mouth_parts": 0.9},  # Forme de la fleur vs pièces buccales
-        "nectar_production": {"energy_efficiency": 0.8},  # Production de nectar vs efficacité énergétique
-        "flower_color": {"color_perception": 0.7},  # Couleur de la fleur vs perception des couleurs
-        "flowering_time": {"activity_pattern": 0.6}  # Période de floraison vs période d'activité
-    }
-    
     return CoevolutionaryRelationship(
         species_a_id=plant_id,
         species_b_id=pollinator_id,
         interaction_type=InteractionType.MUTUALISM,
         strength=strength,
-        trait_couplings=trait_couplings,
+        trait_couplings=_PLANT_POLLINATOR_COUPLINGS,
         description=f"Relation mutualiste entre {plant_id} (plante) et {pollinator_id} (pollinisateur)"
     )
 
@@ -703,21 +1268,12 @@ def create_host_parasite_relationship(host_id: str, parasite_id: str, strength:
     Returns:
         CoevolutionaryRelationship: Relation hôte-parasite
     """
-    # Couplages de traits typiques d'une relation hôte-parasite
-    trait_couplings = {
-        # Traits du parasite
-        "infection_ability": {"immune_system": 0.9},  # Capacité d'infection vs système immunitaire
-        "toxin_resistance": {"toxin_production": 0.8},  # Résistance aux toxines vs production de toxines
-        "host_specificity": {"tissue_composition": 0.7},  # Spécificité d'hôte vs composition tissulaire
-        "life_cycle": {"longevity": 0.6}  # Cycle de vie vs longévité
-    }
-    
     return CoevolutionaryRelationship(
         species_a_id=parasite_id,
         species_b_id=host_id,
         interaction_type=InteractionType.PARASITISM,
         strength=strength,
-        trait_couplings=trait_couplings,
+        trait_couplings=_HOST_PARASITE_COUPLINGS,
         description=f"Relation parasitaire entre {parasite_id} (parasite) et {host_id} (hôte)"
     )
 
@@ -733,21 +1289,12 @@ def create_competitive_relationship(species_a_id: str, species_b_id: str, streng
     Returns:
         CoevolutionaryRelationship: Relation de compétition
     """
-    # Couplages de traits typiques d'une relation de compétition
-    trait_couplings = {
-        # Traits de l'espèce A
-        "foraging_efficiency": {"foraging_efficiency": 0.8},  # Efficacité de recherche de nourriture
-        "growth_rate": {"growth_rate": 0.7},  # Taux de croissance
-        "resource_utilization": {"resource_utilization": 0.9},  # Utilisation des ressources
-        "territorial_behavior": {"territorial_behavior": 0.6}  # Comportement territorial
-    }
-    
     return CoevolutionaryRelationship(
         species_a_id=species_a_id,
         species_b_id=species_b_id,
         interaction_type=InteractionType.COMPETITION,
         strength=strength,
-        trait_couplings=trait_couplings,
+        trait_couplings=_COMPETITION_COUPLINGS,
         description=f"Relation de compétition entre {species_a_id} et {species_b_id}"
     )
 
@@ -3,11 +3,30 @@ Module d'événements évolutifs pour BioEvolve
 Implémente des mécanismes évolutifs réalistes basés sur les principes scientifiques de l'évolution
 """
 
+import sys
 import random
 import math
+import keyword
+import operator
+import itertools
+import weakref
+import numpy as np
 from enum import Enum
-from typing import List, Dict, Tuple, Optional, Set, Any
-import uuid
+from typing import List, Dict, Tuple, Optional, Set, Any, Callable, NamedTuple
+
+# Compilation JIT optionnelle des noyaux numériques
+try:
+    from numba import njit, prange
+    NUMBA_ENABLED = True
+except ImportError:
+    NUMBA_ENABLED = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Remplace numba.njit par un décorateur neutre lorsque numba n'est pas installé."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 class EvolutionaryMechanism(Enum):
     """Mécanismes évolutifs fondamentaux selon la théorie synthétique de l'évolution."""
@@ -28,9 +47,27 @@ class SpeciationMode(Enum):
     PERIPATRIC = 3      # Spéciation par effet fondateur
     HYBRID = 4          # Spéciation par hybridation
 
+def _intern(value: Any) -> Any:
+    """
+    Interne une chaîne (les autres valeurs, par exemple None ou un entier, sont renvoyées telles quelles).
+    
+    Args:
+        value: Identifiant ou nom
+        
+    Returns:
+        Any: La chaîne internée, ou la valeur d'origine
+    """
+    return sys.intern(value) if type(value) is str else value
+
 class EvolutionaryEvent:
     """Représente un événement évolutif significatif dans la simulation."""
     
+    __slots__ = ("id", "event_type", "year", "day", "species_id", "mechanism", "description", "affected_organisms",
+                 "parent_species", "new_species", "speciation_mode", "environmental_factors", "genetic_changes")
+    
+    # Identifiants des événements, attribués dans l'ordre de création
+    _next_id = itertools.count(1)
+    
     def __init__(self, 
                  event_type: str,
                  year: int, 
@@ -61,11 +98,12 @@ class EvolutionaryEvent:
             environmental_factors: Facteurs environnementaux impliqués
             genetic_changes: Changements génétiques significatifs
         """
-        self.id = str(uuid.uuid4())
-        self.event_type = event_type
+        self.id = next(EvolutionaryEvent._next_id)
+        # Le type et l'espèce sont internés : ils servent de clés aux index du registre
+        self.event_type = _intern(event_type)
         self.year = year
         self.day = day
-        self.species_id = species_id
+        self.species_id = _intern(species_id)
         self.mechanism = mechanism
         self.description = description
         self.affected_organisms = affected_organisms or []
@@ -74,11 +112,19 @@ class EvolutionaryEvent:
         self.speciation_mode = speciation_mode
         self.environmental_factors = environmental_factors or {}
         self.genetic_changes = genetic_changes or {}
-        self.timestamp = f"Année {year}, Jour {day}"
+    
+    @property
+    def timestamp(self) -> str:
+        """Date de l'événement, formatée à la lecture."""
+        return f"Année {self.year}, Jour {self.day}"
 
 class EvolutionaryRegistry:
     """Registre des événements évolutifs et des espèces dans la simulation."""
     
+    __slots__ = ("events", "species_registry", "evolutionary_milestones", "extinct_species", "speciation_events",
+                 "adaptation_events", "extinction_events", "_speciation_by_new", "_events_by_type",
+                 "_events_by_mechanism", "_events_by_species")
+    
     def __init__(self):
         """Initialise le registre évolutif."""
         self.events = []
@@ -88,14 +134,25 @@ class EvolutionaryRegistry:
         self.speciation_events = []
         self.adaptation_events = []
         self.extinction_events = []
+        self._speciation_by_new = {}  # {species_id: premier événement de spéciation ayant créé l'espèce}
+        
+        # Index des événements, dans l'ordre d'ajout
+        self._events_by_type = {}  # {event_type: [EvolutionaryEvent]}
+        self._events_by_mechanism = {}  # {mechanism: [EvolutionaryEvent]}
+        self._events_by_species = {}  # {species_id: [EvolutionaryEvent]}
         
     def add_event(self, event: EvolutionaryEvent):
         """Ajoute un événement au registre."""
         self.events.append(event)
+        self._events_by_type.setdefault(event.event_type, []).append(event)
+        self._events_by_mechanism.setdefault(event.mechanism, []).append(event)
+        self._events_by_species.setdefault(event.species_id, []).append(event)
         
         # Catégoriser l'événement
         if event.event_type == "speciation":
             self.speciation_events.append(event)
+            if event.new_species is not None:
+                self._speciation_by_new.setdefault(event.new_species, event)
         elif event.event_type == "adaptation":
             self.adaptation_events.append(event)
         elif event.event_type == "extinction":
@@ -108,7 +165,7 @@ class EvolutionaryRegistry:
     
     def register_species(self, species_id: str, data: Dict):
         """Enregistre une nouvelle espèce dans le registre."""
-        self.species_registry[species_id] = data
+        self.species_registry[_intern(species_id)] = data
     
     def get_species_data(self, species_id: str) -> Optional[Dict]:
         """Récupère les données d'une espèce."""
@@ -116,15 +173,15 @@ class EvolutionaryRegistry:
     
     def get_events_by_type(self, event_type: str) -> List[EvolutionaryEvent]:
         """Récupère tous les événements d'un type spécifique."""
-        return [event for event in self.events if event.event_type == event_type]
+        return list(self._events_by_type.get(event_type, ()))
     
     def get_events_by_mechanism(self, mechanism: EvolutionaryMechanism) -> List[EvolutionaryEvent]:
         """Récupère tous les événements impliquant un mécanisme spécifique."""
-        return [event for event in self.events if event.mechanism == mechanism]
+        return list(self._events_by_mechanism.get(mechanism, ()))
     
     def get_events_by_species(self, species_id: str) -> List[EvolutionaryEvent]:
         """Récupère tous les événements concernant une espèce spécifique."""
-        return [event for event in self.events if event.species_id == species_id]
+        return list(self._events_by_species.get(species_id, ()))
     
     def get_species_lineage(self, species_id: str) -> List[str]:
         """Retrace la lignée d'une espèce jusqu'à son ancêtre le plus ancien."""
@@ -132,9 +189,8 @@ class EvolutionaryRegistry:
         current_id = species_id
         
         while True:
-            # Chercher l'événement de spéciation qui a créé cette espèce
-            parent_event = next((e for e in self.speciation_events 
-                               if e.new_species == current_id), None)
+            # Événement de spéciation qui a créé cette espèce
+            parent_event = self._speciation_by_new.get(current_id)
             
             if not parent_event or not parent_event.parent_species:
                 break
@@ -151,7 +207,7 @@ class EvolutionaryRegistry:
             return True
             
         # Les extinctions d'espèces établies sont des jalons
-        if event.event_type == "extinction" and len(self.get_events_by_species(event.species_id)) > 5:
+        if event.event_type == "extinction" and len(self._events_by_species.get(event.species_id, ())) > 5:
             return True
             
         # Les adaptations majeures sont des jalons
@@ -163,6 +219,9 @@ class EvolutionaryRegistry:
 class EvolutionaryPressure:
     """Représente une pression évolutive agissant sur les organismes."""
     
+    __slots__ = ("name", "_intensity", "target_traits", "_direction", "environmental_source", "_description",
+                 "_systems")
+    
     def __init__(self, 
                  name: str,
                  intensity: float,
@@ -182,11 +241,52 @@ class EvolutionaryPressure:
             description: Description textuelle de la pression
         """
         self.name = name
-        self.intensity = max(0.0, min(1.0, intensity))
-        self.target_traits = target_traits
-        self.direction = max(-1.0, min(1.0, direction))
+        self._intensity = max(0.0, min(1.0, intensity))
+        self.target_traits = [_intern(trait) for trait in target_traits]  # Noms internés, comme les attributs
+        self._direction = max(-1.0, min(1.0, direction))
         self.environmental_source = environmental_source
-        self.description = description or f"Pression évolutive {name}"
+        self._description = description  # Description fournie (voir description)
+        self._systems = weakref.WeakSet()  # Systèmes auxquels la pression a été ajoutée (voir intensity)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """État sérialisable, sans les systèmes porteurs (rétablis par EvolutionaryPressureSystem.__setstate__)."""
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot != "_systems"}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._systems = weakref.WeakSet()
+    
+    @property
+    def intensity(self) -> float:
+        """Intensité de la pression ; la modifier invalide les formes compilées des systèmes qui la portent."""
+        return self._intensity
+    
+    @intensity.setter
+    def intensity(self, value: float) -> None:
+        self._intensity = value
+        for system in self._systems:
+            system._invalidate_compiled()
+    
+    @property
+    def direction(self) -> float:
+        """Direction de la sélection ; la modifier invalide les formes compilées des systèmes qui la portent."""
+        return self._direction
+    
+    @direction.setter
+    def direction(self, value: float) -> None:
+        self._direction = value
+        for system in self._systems:
+            system._invalidate_compiled()
+    
+    @property
+    def description(self) -> str:
+        """Description textuelle de la pression, formatée à la lecture si aucune n'a été fournie."""
+        return self._description or f"Pression évolutive {self.name}"
+    
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
         
     def calculate_effect(self, trait_value: float, trait_optimum: float = 0.5) -> float:
         """
@@ -207,6 +307,22 @@ class EvolutionaryPressure:
         
         return effect
 
+class _CompiledPressures(NamedTuple):
+    """Forme compilée (structure de tableaux) des pressions d'un EvolutionaryPressureSystem."""
+    index: Dict[int, int]  # {id(pression): indice de la pression dans les tableaux}
+    intensities: np.ndarray  # Intensité de chaque pression
+    directions: np.ndarray  # Direction de chaque pression
+    trait_ptr: np.ndarray  # Traits ciblés par la pression p : trait_ids[trait_ptr[p]:trait_ptr[p + 1]]
+    trait_ids: np.ndarray  # Indices des traits ciblés dans trait_names, dans l'ordre de target_traits
+    trait_names: Tuple[str, ...]  # Traits ciblés par au moins une pression
+
+class _SelectionPlan(NamedTuple):
+    """Couples (pression, trait ciblé présent) des pressions actives pour une classe de phénotype."""
+    traits: Tuple[str, ...]  # Traits ciblés présents, dans l'ordre des colonnes
+    columns: np.ndarray  # Colonne (dans traits) du trait de chaque couple
+    weights: np.ndarray  # Intensité multipliée par la direction de la pression de chaque couple
+    coefficient: Callable[[Any], float]  # Coefficient de sélection d'un phénotype (voir _selection_function)
+
 class EvolutionaryPressureSystem:
     """Système gérant l'ensemble des pressions évolutives dans l'environnement."""
     
@@ -215,6 +331,9 @@ class EvolutionaryPressureSystem:
         self.pressures = {}  # {pressure_name: EvolutionaryPressure}
         self.regional_pressures = {}  # {region_id: {pressure_name: EvolutionaryPressure}}
         self.temporal_pressures = {}  # {(year, season): {pressure_name: EvolutionaryPressure}}
+        self._active_cache = {}  # {(région, moment): pressions actives}, vidé à chaque ajout
+        self._compiled = None  # Forme compilée des pressions (voir _compile), reconstruite après un changement
+        self._plan_cache = {}  # {(pressions actives, classe de phénotype): _SelectionPlan} (voir _selection_plan)
         
     def add_pressure(self, pressure: EvolutionaryPressure, region_id: str = None, 
                     temporal_key: Tuple[int, int] = None):
@@ -228,6 +347,9 @@ class EvolutionaryPressureSystem:
         """
         # Ajouter aux pressions globales
         self.pressures[pressure.name] = pressure
+        pressure._systems.add(self)
+        self._active_cache.clear()
+        self._invalidate_compiled()
         
         # Ajouter aux pressions régionales si spécifié
         if region_id:
@@ -241,6 +363,27 @@ class EvolutionaryPressureSystem:
                 self.temporal_pressures[temporal_key] = {}
             self.temporal_pressures[temporal_key][pressure.name] = pressure
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """État sérialisable, sans les caches : ils reposent sur l'identité (id) des pressions."""
+        state = self.__dict__.copy()
+        state["_active_cache"] = {}
+        state["_compiled"] = None
+        state["_plan_cache"] = {}
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        
+        # Les pressions restaurées invalident de nouveau ce système lorsqu'elles changent
+        for group in (self.pressures, *self.regional_pressures.values(), *self.temporal_pressures.values()):
+            for pressure in group.values():
+                pressure._systems.add(self)
+    
+    def _invalidate_compiled(self):
+        """Oublie la forme compilée des pressions et les plans de sélection qui en sont tirés."""
+        self._compiled = None
+        self._plan_cache.clear()
+    
     def get_active_pressures(self, region_id: str = None, year: int = None, 
                            season: int = None) -> Dict[str, EvolutionaryPressure]:
         """
@@ -254,20 +397,52 @@ class EvolutionaryPressureSystem:
         Returns:
             Dict[str, EvolutionaryPressure]: Dictionnaire des pressions actives
         """
+        return dict(self._active_pressures(region_id, year, season)[0])
+    
+    def _active_pressures(self, region_id: str = None, year: int = None,
+                          season: int = None) -> Tuple[Dict[str, EvolutionaryPressure], Tuple[int, ...]]:
+        """
+        Récupère les pressions actives (voir get_active_pressures), mises en cache jusqu'au prochain ajout
+        de pression ; le dictionnaire renvoyé est partagé et ne doit pas être modifié.
+        
+        Une région (ou un moment) sans pression propre a les mêmes pressions actives qu'aucune région : le
+        cache n'a donc qu'une entrée par combinaison de région et de moment ayant des pressions propres.
+        
+        Args:
+            region_id: ID de la région (None = toutes les régions)
+            year: Année de simulation (None = toutes les années)
+            season: Saison (None = toutes les saisons)
+            
+        Returns:
+            Tuple[Dict[str, EvolutionaryPressure], Tuple[int, ...]]: Dictionnaire des pressions actives et
+            identités (id) de ces pressions, dans l'ordre du dictionnaire
+        """
+        # Ne garder de la région et du moment que ceux qui ont des pressions propres
+        if not region_id or region_id not in self.regional_pressures:
+            region_id = None
+        temporal_key = (year, season) if year is not None and season is not None else None
+        if temporal_key not in self.temporal_pressures:
+            temporal_key = None
+        
+        cache_key = (region_id, temporal_key)
+        cached = self._active_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Commencer avec les pressions globales
         active_pressures = self.pressures.copy()
         
         # Ajouter les pressions régionales si une région est spécifiée
-        if region_id and region_id in self.regional_pressures:
+        if region_id is not None:
             active_pressures.update(self.regional_pressures[region_id])
             
         # Ajouter les pressions temporelles si un moment est spécifié
-        if year is not None and season is not None:
-            temporal_key = (year, season)
-            if temporal_key in self.temporal_pressures:
-                active_pressures.update(self.temporal_pressures[temporal_key])
-                
-        return active_pressures
+        if temporal_key is not None:
+            active_pressures.update(self.temporal_pressures[temporal_key])
+        
+        cached = (active_pressures, tuple(map(id, active_pressures.values())))
+        self._active_cache[cache_key] = cached
+        return cached
     
     def calculate_selection_coefficient(self, organism, region_id: str = None, 
                                       year: int = None, season: int = None) -> float:
@@ -283,34 +458,197 @@ class EvolutionaryPressureSystem:
         Returns:
             float: Coefficient de sélection global (-1.0 à 1.0)
         """
-        active_pressures = self.get_active_pressures(region_id, year, season)
+        return self._selection_plan(region_id, year, season, organism.phenotype).coefficient(organism.phenotype)
+    
+    def calculate_selection_coefficients_batch(self, organisms, region_id: str = None,
+                                               year: int = None, season: int = None) -> np.ndarray:
+        """
+        Calcule le coefficient de sélection global de plusieurs organismes en une passe vectorisée.
+        
+        Équivaut à calculate_selection_coefficient pour chaque organisme ; les organismes ont des phénotypes
+        de même classe (voir _numeric_traits).
         
-        if not active_pressures:
-            return 0.0  # Pas de pression, pas d'effet
+        Args:
+            organisms: Organismes à évaluer
+            region_id: ID de la région où se trouvent les organismes
+            year: Année de simulation actuelle
+            season: Saison actuelle
             
-        total_effect = 0.0
-        pressure_count = 0
-        
-        for pressure in active_pressures.values():
-            # Vérifier si l'organisme possède les traits ciblés par cette pression
-            for trait in pressure.target_traits:
-                if hasattr(organism.phenotype, trait):
-                    trait_value = getattr(organism.phenotype, trait)
-                    # Normaliser la valeur du trait si nécessaire
-                    if isinstance(trait_value, (int, float)) and trait_value > 1.0:
-                        # Supposer que les traits sont normalisés entre 0 et 1
-                        # Si ce n'est pas le cas, il faudrait connaître les bornes pour chaque trait
-                        trait_value = trait_value / 10.0  # Valeur arbitraire, à ajuster
-                        
-                    effect = pressure.calculate_effect(trait_value)
-                    total_effect += effect
-                    pressure_count += 1
-        
-        # Calculer l'effet moyen
-        if pressure_count > 0:
-            return total_effect / pressure_count
+        Returns:
+            np.ndarray: Coefficient de sélection global de chaque organisme (-1.0 à 1.0)
+        """
+        coefficients = np.zeros(len(organisms))
+        if not organisms:
+            return coefficients
+        plan = self._selection_plan(region_id, year, season, organisms[0].phenotype)
+        if not len(plan.columns):
+            return coefficients
+        
+        # Valeurs des traits ciblés, une ligne par organisme
+        values = _trait_values(organisms, plan.traits)
+        
+        if NUMBA_ENABLED:
+            _selection_kernel(values, plan.columns, plan.weights, coefficients)
+            return coefficients
+        return _selection_effects(values, plan.columns, plan.weights)
+    
+    def _compile(self) -> _CompiledPressures:
+        """
+        Compile les pressions du système en tableaux parallèles, reconstruits au besoin après un ajout.
+        
+        Les intensités et directions sont copiées à la compilation ; une pression dont l'intensité ou la
+        direction change invalide la forme compilée (voir EvolutionaryPressure.intensity). Les traits ciblés
+        ne doivent pas être modifiés après l'ajout de la pression au système.
+        
+        Returns:
+            _CompiledPressures: Forme compilée des pressions
+        """
+        if self._compiled is None:
+            # Pressions distinctes (une pression régionale ou temporelle remplacée reste active ailleurs)
+            pressures = {}
+            for group in (self.pressures, *self.regional_pressures.values(), *self.temporal_pressures.values()):
+                for pressure in group.values():
+                    pressures.setdefault(id(pressure), pressure)
+            
+            trait_index = {}  # {trait: indice dans trait_names}
+            trait_ids = [trait_index.setdefault(trait, len(trait_index))
+                         for pressure in pressures.values() for trait in pressure.target_traits]
+            trait_ptr = np.zeros(len(pressures) + 1, dtype=np.int64)
+            np.cumsum([len(pressure.target_traits) for pressure in pressures.values()], out=trait_ptr[1:])
+            
+            self._compiled = _CompiledPressures(
+                index={key: i for i, key in enumerate(pressures)},
+                intensities=np.array([pressure.intensity for pressure in pressures.values()], dtype=np.float64),
+                directions=np.array([pressure.direction for pressure in pressures.values()], dtype=np.float64),
+                trait_ptr=trait_ptr,
+                trait_ids=np.array(trait_ids, dtype=np.int64),
+                trait_names=tuple(trait_index)
+            )
+        return self._compiled
+    
+    def _selection_plan(self, region_id: str, year: int, season: int, phenotype) -> _SelectionPlan:
+        """
+        Récupère les couples (pression active, trait ciblé présent) évalués par le calcul des coefficients de
+        sélection, établis depuis la forme compilée une fois par ensemble de pressions actives et par classe
+        de phénotype : les moments qui ont les mêmes pressions actives partagent le même plan.
+        
+        Args:
+            region_id: ID de la région
+            year: Année de simulation
+            season: Saison
+            phenotype: Phénotype d'un organisme
+            
+        Returns:
+            _SelectionPlan: Couples à évaluer, dans l'ordre des pressions actives puis de leurs traits ciblés
+        """
+        active_ids = self._active_pressures(region_id, year, season)[1]
+        plan_key = (active_ids, type(phenotype))
+        plan = self._plan_cache.get(plan_key)
+        if plan is not None:
+            return plan
+        
+        compiled = self._compile()
+        pressure_ids = np.array([compiled.index[key] for key in active_ids], dtype=np.int64)
+        
+        # Déplier les traits ciblés (CSR) des pressions actives en couples (pression, trait)
+        starts = compiled.trait_ptr[pressure_ids]
+        counts = compiled.trait_ptr[pressure_ids + 1] - starts
+        pair_pressures = np.repeat(pressure_ids, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_traits = compiled.trait_ids[np.repeat(starts, counts) + offsets]
+        
+        # Ne garder que les traits numériques que possède le phénotype (voir _numeric_traits)
+        numeric_traits = set(_numeric_traits(phenotype))
+        present = np.fromiter((trait in numeric_traits for trait in compiled.trait_names),
+                              dtype=bool, count=len(compiled.trait_names))
+        keep = present[pair_traits]
+        pair_pressures, pair_traits = pair_pressures[keep], pair_traits[keep]
+        
+        used_traits, columns = np.unique(pair_traits, return_inverse=True)
+        traits = tuple(compiled.trait_names[i] for i in used_traits)
+        columns = columns.reshape(-1)
+        weights = compiled.intensities[pair_pressures] * compiled.directions[pair_pressures]
+        plan = _SelectionPlan(
+            traits=traits,
+            columns=columns,
+            weights=weights,
+            coefficient=_selection_function(traits, columns, weights)
+        )
+        self._plan_cache[plan_key] = plan
+        return plan
+
+def _selection_function(traits: Tuple[str, ...], columns: np.ndarray, weights: np.ndarray) -> Callable[[Any], float]:
+    """
+    Génère une fonction calculant le coefficient de sélection d'un phénotype pour un ensemble fixe de couples
+    (pression, trait) : les traits lus et les poids des couples y sont inscrits comme constantes.
+    
+    Args:
+        traits: Traits ciblés présents, dans l'ordre des colonnes
+        columns: Colonne du trait de chaque couple
+        weights: Intensité multipliée par la direction de la pression de chaque couple
+        
+    Returns:
+        Callable[[Any], float]: Fonction (phénotype) -> coefficient de sélection (-1.0 à 1.0)
+    """
+    if not len(columns):
+        return lambda phenotype: 0.0  # Pas de pression (ou aucun trait ciblé présent), pas d'effet
+    
+    lines = ["def _coefficient(phenotype):"]
+    for k, trait in enumerate(traits):
+        # Lire chaque trait une fois, puis normaliser sa valeur : les traits sont supposés entre 0 et 1
+        # (diviser par 10 les valeurs supérieures est arbitraire, à ajuster selon les bornes de chaque trait)
+        if trait.isidentifier() and not keyword.iskeyword(trait):
+            lines.append(f"    v{k} = phenotype.{trait}")
         else:
-            return 0.0
+            lines.append(f"    v{k} = getattr(phenotype, {trait!r})")
+        lines.append(f"    if v{k} > 1.0: v{k} = v{k} / 10.0")
+    lines.append("    total_effect = 0.0")
+    for column, weight in zip(columns.tolist(), weights.tolist()):
+        lines.append(f"    total_effect += (1.0 - abs(v{column} - 0.5)) * {weight!r}")
+    lines.append(f"    return total_effect / {len(columns)}")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_coefficient"]
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _selection_kernel(values, columns, weights, out):
+    """
+    Coefficient de sélection de chaque organisme (voir EvolutionaryPressureSystem.calculate_selection_coefficient).
+    
+    Les organismes sont indépendants : chaque itération de prange traite une ligne de values, normalise
+    ses traits et accumule l'effet de chaque couple (pression, trait) avant d'écrire la moyenne dans out.
+    
+    Args:
+        values: Valeurs brutes des traits (organisme, trait)
+        columns: Colonne du trait de chaque couple
+        weights: Intensité multipliée par la direction de la pression de chaque couple
+        out: Coefficient de sélection de chaque organisme, rempli en place
+    """
+    for i in prange(values.shape[0]):
+        total_effect = 0.0
+        for k in range(columns.shape[0]):
+            trait_value = values[i, columns[k]]
+            if trait_value > 1.0:
+                trait_value = trait_value / 10.0
+            total_effect += (1.0 - abs(trait_value - 0.5)) * weights[k]
+        out[i] = total_effect / columns.shape[0]
+
+def _selection_effects(values: np.ndarray, columns: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Équivalent NumPy de _selection_kernel, utilisé lorsque numba n'est pas installé.
+    
+    Args:
+        values: Valeurs brutes des traits (organisme, trait)
+        columns: Colonne du trait de chaque couple
+        weights: Intensité multipliée par la direction de la pression de chaque couple
+        
+    Returns:
+        np.ndarray: Coefficient de sélection de chaque organisme
+    """
+    values = np.where(values > 1.0, values / 10.0, values)
+    effects = (1.0 - np.abs(values[:, columns] - 0.5)) * weights
+    return effects.sum(axis=1) / len(columns)
 
 # Exemples de pressions évolutives prédéfinies
 def create_climate_change_pressure(intensity: float = 0.7, direction: float = -0.8) -> EvolutionaryPressure:
@@ -369,6 +707,79 @@ def create_sexual_selection_pressure(intensity: float = 0.7, direction: float =
     )
 
 # Fonctions utilitaires pour l'analyse évolutive
+def _gene_arrays(chromosome, gene_index: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Extrait les gènes d'un chromosome sous forme de tableaux triés par identifiant.
+    
+    Les identifiants des gènes sont remplacés par des entiers attribués dans gene_index, partagé par les
+    chromosomes comparés : deux gènes ont le même entier si et seulement s'ils ont le même identifiant.
+    
+    Args:
+        chromosome: Chromosome dont les gènes sont extraits
+        gene_index: Entiers déjà attribués aux identifiants des gènes ({gene_id: entier}), complété au besoin
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Entiers triés des identifiants des gènes et valeurs correspondantes
+    """
+    genes = chromosome.genes
+    gene_ids = np.fromiter((gene_index.setdefault(gene_id, len(gene_index)) for gene_id in genes),
+                           dtype=np.int64, count=len(genes))
+    values = np.fromiter((gene.value for gene in genes.values()), dtype=np.float64, count=len(genes))
+    order = np.argsort(gene_ids)
+    return gene_ids[order], values[order]
+
+@njit(cache=True, boundscheck=False)
+def _genetic_distance_kernel(ids1, values1, ids2, values2, threshold):
+    """
+    Compare les gènes de deux chromosomes par un parcours simultané de leurs identifiants triés.
+    
+    Args:
+        ids1: Entiers triés des identifiants des gènes du premier chromosome (voir _gene_arrays)
+        values1: Valeurs des gènes du premier chromosome
+        ids2: Entiers triés des identifiants des gènes du deuxième chromosome
+        values2: Valeurs des gènes du deuxième chromosome
+        threshold: Écart de valeur à partir duquel un gène présent dans les deux chromosomes diffère
+        
+    Returns:
+        Tuple[int, int]: Nombre de gènes présents dans l'un ou l'autre des chromosomes et nombre de gènes
+        différents
+    """
+    i = 0
+    j = 0
+    total_genes = 0
+    different_genes = 0
+    while i < ids1.shape[0] and j < ids2.shape[0]:
+        if ids1[i] == ids2[j]:
+            # Gène présent dans les deux chromosomes : comparer les valeurs
+            if abs(values1[i] - values2[j]) > threshold:
+                different_genes += 1
+            i += 1
+            j += 1
+        elif ids1[i] < ids2[j]:
+            # Gène présent dans le premier chromosome seulement
+            different_genes += 1
+            i += 1
+        else:
+            # Gène présent dans le deuxième chromosome seulement
+            different_genes += 1
+            j += 1
+        total_genes += 1
+    
+    # Gènes restants, présents dans un seul chromosome
+    remaining = (ids1.shape[0] - i) + (ids2.shape[0] - j)
+    return total_genes + remaining, different_genes + remaining
+
+def _compare_gene_arrays(ids1: np.ndarray, values1: np.ndarray, ids2: np.ndarray, values2: np.ndarray,
+                         threshold: float) -> Tuple[int, int]:
+    """Compare les gènes de deux chromosomes par opérations ensemblistes (version NumPy du noyau)."""
+    # Gènes présents dans les deux chromosomes
+    common, index1, index2 = np.intersect1d(ids1, ids2, assume_unique=True, return_indices=True)
+    
+    # Gènes présents dans un seul chromosome, puis gènes communs dont l'écart de valeur est significatif
+    single = len(ids1) + len(ids2) - 2 * len(common)
+    different_values = int(np.count_nonzero(np.abs(values1[index1] - values2[index2]) > threshold))
+    return single + len(common), single + different_values
+
 def calculate_genetic_distance(genome1, genome2) -> float:
     """
     Calcule la distance génétique entre deux génomes.
@@ -388,25 +799,18 @@ def calculate_genetic_distance(genome1, genome2) -> float:
     
     # Pour chaque chromosome présent dans les deux génomes
     for i in range(min(len(genome1.chromosomes), len(genome2.chromosomes))):
-        chrom1 = genome1.chromosomes[i]
-        chrom2 = genome2.chromosomes[i]
+        gene_index = {}  # Identifiants des gènes des deux chromosomes
+        ids1, values1 = _gene_arrays(genome1.chromosomes[i], gene_index)
+        ids2, values2 = _gene_arrays(genome2.chromosomes[i], gene_index)
         
-        # Ensemble des gènes présents dans l'un ou l'autre des chromosomes
-        all_genes = set(chrom1.genes.keys()) | set(chrom2.genes.keys())
-        total_genes += len(all_genes)
-        
-        for gene_id in all_genes:
-            # Si le gène est présent dans un seul chromosome, c'est une différence
-            if (gene_id in chrom1.genes) != (gene_id in chrom2.genes):
-                different_genes += 1
-            # Si le gène est présent dans les deux, comparer les valeurs
-            elif gene_id in chrom1.genes and gene_id in chrom2.genes:
-                gene1 = chrom1.genes[gene_id]
-                gene2 = chrom2.genes[gene_id]
-                
-                # Si la différence de valeur est significative, c'est une différence
-                if abs(gene1.value - gene2.value) > 0.2:  # Seuil arbitraire
-                    different_genes += 1
+        # Un gène présent dans un seul chromosome, ou dont la valeur diffère significativement, est une différence
+        if NUMBA_ENABLED:
+            chromosome_genes, chromosome_differences = _genetic_distance_kernel(ids1, values1, ids2, values2,
+                                                                                0.2)  # Seuil arbitraire
+        else:
+            chromosome_genes, chromosome_differences = _compare_gene_arrays(ids1, values1, ids2, values2, 0.2)
+        total_genes += chromosome_genes
+        different_genes += chromosome_differences
     
     # Si aucun gène n'a été comparé, retourner la distance maximale
     if total_genes == 0:
@@ -464,6 +868,112 @@ def determine_speciation_mode(parent_species, offspring, world) -> SpeciationMod
     # Par défaut, considérer comme sympatrique
     return SpeciationMode.SYMPATRIC
 
+# Traits numériques de chaque classe de phénotype, déterminés sur la première instance rencontrée
+_NUMERIC_TRAITS = {}  # {classe de phénotype: noms des traits}
+
+def _numeric_traits(phenotype) -> Tuple[str, ...]:
+    """
+    Récupère les noms des traits numériques (attributs publics entiers ou réels) d'un phénotype.
+    
+    Les phénotypes d'une même classe ont les mêmes traits : la liste n'est établie qu'une fois par classe.
+    
+    Args:
+        phenotype: Phénotype d'un organisme
+        
+    Returns:
+        Tuple[str, ...]: Noms des traits numériques
+    """
+    phenotype_class = type(phenotype)
+    traits = _NUMERIC_TRAITS.get(phenotype_class)
+    if traits is None:
+        traits = tuple(trait_name for trait_name in dir(phenotype)
+                       if not trait_name.startswith('_') and isinstance(getattr(phenotype, trait_name), (int, float)))
+        _NUMERIC_TRAITS[phenotype_class] = traits
+    return traits
+
+def _trait_values(organisms, trait_names: Tuple[str, ...]) -> np.ndarray:
+    """
+    Range des traits d'organismes dans une matrice allouée d'avance, remplie ligne par ligne.
+    
+    Args:
+        organisms: Organismes dont lire les phénotypes
+        trait_names: Noms des traits à lire
+        
+    Returns:
+        np.ndarray: Matrice (organisme, trait) des valeurs des traits
+    """
+    values = np.empty((len(organisms), len(trait_names)), dtype=np.float64)
+    if trait_names:
+        # Un seul appel lit tous les traits d'un phénotype (une valeur seule s'il n'y a qu'un trait)
+        read_traits = operator.attrgetter(*trait_names)
+        for i, organism in enumerate(organisms):
+            values[i] = read_traits(organism.phenotype)
+    return values
+
+def _trait_matrix(generation) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """
+    Range les traits numériques d'une génération dans une matrice (une ligne par organisme).
+    
+    Les organismes d'une génération ont des phénotypes de même classe (voir _numeric_traits).
+    
+    Args:
+        generation: Organismes de la génération (au moins un)
+        
+    Returns:
+        Tuple[Tuple[str, ...], np.ndarray]: Noms des traits et matrice (organisme, trait) de leurs valeurs
+    """
+    trait_names = _numeric_traits(generation[0].phenotype)
+    return trait_names, _trait_values(generation, trait_names)
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _trait_stats_kernel(prev_values, curr_values, prev_ids, curr_ids):
+    """
+    Moyennes et changement des traits communs à deux générations (voir analyze_adaptation).
+    
+    Les traits sont indépendants : chaque itération de prange somme une colonne de chaque matrice.
+    
+    Args:
+        prev_values: Matrice (organisme, trait) de la génération précédente
+        curr_values: Matrice (organisme, trait) de la génération actuelle
+        prev_ids: Colonnes des traits communs dans prev_values
+        curr_ids: Colonnes des mêmes traits dans curr_values
+        
+    Returns:
+        Tuple: Moyennes précédentes, moyennes actuelles, changements et indicateurs de changement significatif
+    """
+    prev_means = np.empty(prev_ids.shape[0])
+    curr_means = np.empty(prev_ids.shape[0])
+    for k in prange(prev_ids.shape[0]):
+        total = 0.0
+        for i in range(prev_values.shape[0]):
+            total += prev_values[i, prev_ids[k]]
+        prev_means[k] = total / prev_values.shape[0]
+        total = 0.0
+        for i in range(curr_values.shape[0]):
+            total += curr_values[i, curr_ids[k]]
+        curr_means[k] = total / curr_values.shape[0]
+    change = curr_means - prev_means
+    return prev_means, curr_means, change, np.abs(change) > 0.1 * prev_means
+
+def _trait_stats(prev_values: np.ndarray, curr_values: np.ndarray, prev_ids: np.ndarray,
+                 curr_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Équivalent NumPy de _trait_stats_kernel, utilisé lorsque numba n'est pas installé.
+    
+    Args:
+        prev_values: Matrice (organisme, trait) de la génération précédente
+        curr_values: Matrice (organisme, trait) de la génération actuelle
+        prev_ids: Colonnes des traits communs dans prev_values
+        curr_ids: Colonnes des mêmes traits dans curr_values
+        
+    Returns:
+        Tuple: Moyennes précédentes, moyennes actuelles, changements et indicateurs de changement significatif
+    """
+    prev_means = prev_values.mean(axis=0)[prev_ids]
+    curr_means = curr_values.mean(axis=0)[curr_ids]
+    change = curr_means - prev_means
+    return prev_means, curr_means, change, np.abs(change) > 0.1 * prev_means
+
 def analyze_adaptation(species, previous_generation, current_generation, environment) -> Dict[str, Any]:
     """
     Analyse les adaptations d'une espèce entre deux générations.
@@ -482,39 +992,29 @@ def analyze_adaptation(species, previous_generation, current_generation, environ
         
     adaptations = {}
     
-    # Calculer les valeurs moyennes des traits pour chaque génération
-    prev_traits = {}
-    curr_traits = {}
-    
-    for organism in previous_generation:
-        for trait_name in dir(organism.phenotype):
-            if not trait_name.startswith('_') and isinstance(getattr(organism.phenotype, trait_name), (int, float)):
-                if trait_name not in prev_traits:
-                    prev_traits[trait_name] = []
-                prev_traits[trait_name].append(getattr(organism.phenotype, trait_name))
-    
-    for organism in current_generation:
-        for trait_name in dir(organism.phenotype):
-            if not trait_name.startswith('_') and isinstance(getattr(organism.phenotype, trait_name), (int, float)):
-                if trait_name not in curr_traits:
-                    curr_traits[trait_name] = []
-                curr_traits[trait_name].append(getattr(organism.phenotype, trait_name))
-    
-    # Calculer les moyennes
-    prev_means = {trait: sum(values)/len(values) for trait, values in prev_traits.items() if values}
-    curr_means = {trait: sum(values)/len(values) for trait, values in curr_traits.items() if values}
-    
-    # Détecter les changements significatifs
-    for trait in set(prev_means.keys()) & set(curr_means.keys()):
-        change = curr_means[trait] - prev_means[trait]
-        
-        # Si le changement est significatif (seuil arbitraire)
-        if abs(change) > 0.1 * prev_means[trait]:
-            adaptations[trait] = {
-                "previous_value": prev_means[trait],
-                "current_value": curr_means[trait],
-                "change": change,
-                "percent_change": (change / prev_means[trait]) * 100
-            }
-    
-    return adaptations
\ No newline at end of file
+    # Traits de chaque génération, une ligne par organisme et une colonne par trait
+    prev_names, prev_values = _trait_matrix(previous_generation)
+    curr_names, curr_values = _trait_matrix(current_generation)
+    
+    # Calculer les moyennes des traits présents dans les deux générations
+    curr_columns = {trait: k for k, trait in enumerate(curr_names)}
+    prev_ids = np.array([k for k, trait in enumerate(prev_names) if trait in curr_columns], dtype=np.intp)
+    curr_ids = np.array([curr_columns[prev_names[k]] for k in prev_ids.tolist()], dtype=np.intp)
+    if NUMBA_ENABLED:
+        prev_means, curr_means, change, significant = _trait_stats_kernel(prev_values, curr_values,
+                                                                          prev_ids, curr_ids)
+    else:
+        prev_means, curr_means, change, significant = _trait_stats(prev_values, curr_values, prev_ids, curr_ids)
+    
+    # Détecter les changements significatifs (seuil arbitraire)
+    for k in np.flatnonzero(significant).tolist():
+        previous_value = float(prev_means[k])
+        trait_change = float(change[k])
+        adaptations[prev_names[prev_ids[k]]] = {
+            "previous_value": previous_value,
+            "current_value": float(curr_means[k]),
+            "change": trait_change,
+            "percent_change": (trait_change / previous_value) * 100
+        }
+    
+    return adaptations
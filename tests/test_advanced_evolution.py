@@ -0,0 +1,110 @@
+"""Tests du module d'évolution avancée (noyaux et structures par colonnes)."""
+
+import random
+
+import numpy as np
+
+import advanced_evolution as ae
+
+
+def _organisms():
+    makers = (ae.create_unicellular_organism, ae.create_simple_multicellular_organism,
+              ae.create_complex_multicellular_organism, ae.create_advanced_organism)
+    return [maker() for maker in makers for _ in range(3)]
+
+
+def test_evolve_population_kernel_matches_vectorized_loop():
+    organisms = _organisms() * 5
+    for organism_data in organisms[:10]:
+        organism_data["genome"] = dict(organism_data["genome"], adhesion_genes=["a"] * 8, signaling_genes=["s"] * 8)
+    generations = 200
+    
+    np.random.seed(1)
+    expected = ae.PopulationSoA.from_organisms(organisms)
+    ae.MulticellularityMechanism().evolve_multicellularity_batch(expected, generations)
+    
+    # Mêmes tirages que evolve_multicellularity_batch avec plusieurs threads
+    np.random.seed(1)
+    population = ae.PopulationSoA.from_organisms(organisms)
+    ae._evolve_population_kernel(population.potential_features, ae._POTENTIAL_WEIGHTS, population.type_features,
+                                 ae._MC_TYPE_W, population.gene_counts, population.genome_present,
+                                 population.multicellularity_type, population.transition_generation,
+                                 np.random.random((generations, 5, len(population))))
+    
+    assert (expected.transition_generation >= 0).any()
+    np.testing.assert_array_equal(population.transition_generation, expected.transition_generation)
+    np.testing.assert_array_equal(population.multicellularity_type, expected.multicellularity_type)
+    np.testing.assert_array_equal(population.gene_counts, expected.gene_counts)
+
+
+def test_records_round_trip():
+    organisms = _organisms()
+    del organisms[0]["environment"]["temperature"]
+    del organisms[1]["population"]
+    
+    records = ae.organisms_to_records(organisms)
+    assert ae.records_to_organisms(records, organisms) == organisms
+    
+    records["density"] += 1.0
+    updated = ae.records_to_organisms(records, organisms)
+    assert "temperature" not in updated[0]["environment"]
+    assert "population" not in updated[1]
+    assert updated[2]["population"]["density"] == organisms[2]["population"]["density"] + 1.0
+
+
+def _draws(count, generations, seed):
+    seeds = np.random.default_rng(seed).integers(0, 2**63, size=count)
+    return [ae._draw_simulation(np.random.default_rng(row_seed), generations) for row_seed in seeds]
+
+
+def test_organism_pool_round_trip():
+    organisms = _organisms()
+    organisms[0].pop("behavior", None)
+    pool = ae.OrganismPool.from_organisms(organisms)
+    
+    for i, organism_data in enumerate(organisms):
+        stored = dict(organism_data)
+        pool.store(i, stored)
+        assert stored == organism_data
+
+
+def test_simulate_kernel_matches_row_fallback():
+    organisms = _organisms()
+    pool = ae.OrganismPool.from_organisms(organisms)
+    fallback = ae.OrganismPool.from_organisms(organisms)
+    
+    for i, draws in enumerate(_draws(len(organisms), 300, 2)):
+        stop = ae._simulate_kernel(i, pool.state, pool.behavior, pool.genome_size, pool.gene_counts,
+                                   pool.potential_features, ae._POTENTIAL_WEIGHTS, pool.neural_env_factor,
+                                   draws.rolls, draws.gene_mutations, draws.genome_growth,
+                                   0, ae._STEP_MULTICELLULARITY)
+        assert ae._simulate_row(fallback, i, draws, 0, ae._STEP_MULTICELLULARITY) == tuple(map(int, stop))
+    
+    np.testing.assert_array_equal(pool.state, fallback.state)
+    np.testing.assert_array_equal(pool.genome_size, fallback.genome_size)
+    np.testing.assert_array_equal(pool.gene_counts, fallback.gene_counts)
+    # Sans numba, le noyau calcule en float32 avec les tirages : seuls les arrondis diffèrent
+    np.testing.assert_allclose(pool.behavior, fallback.behavior, rtol=1e-6)
+
+
+def test_simulate_population_kernel_matches_row_fallback():
+    organisms = _organisms()
+    rows = np.arange(len(organisms))
+    draws = ae._SimulationDraws(*map(np.stack, zip(*_draws(len(organisms), 300, 5))))
+    
+    pool = ae.OrganismPool.from_organisms(organisms)
+    gens = np.zeros(len(rows), dtype=np.int64)
+    steps = np.full(len(rows), ae._STEP_MULTICELLULARITY, dtype=np.int64)
+    ae._simulate_population_kernel(rows, pool.state, pool.behavior, pool.genome_size, pool.gene_counts,
+                                   pool.potential_features, ae._POTENTIAL_WEIGHTS, pool.neural_env_factor,
+                                   draws.rolls, draws.gene_mutations, draws.genome_growth, gens, steps)
+    
+    fallback = ae.OrganismPool.from_organisms(organisms)
+    for n in rows.tolist():
+        row_draws = ae._SimulationDraws(draws.rolls[n], draws.gene_mutations[n], draws.genome_growth[n])
+        assert ae._simulate_row(fallback, n, row_draws, 0, ae._STEP_MULTICELLULARITY) == (gens[n], steps[n])
+    
+    np.testing.assert_array_equal(pool.state, fallback.state)
+    np.testing.assert_array_equal(pool.genome_size, fallback.genome_size)
+    np.testing.assert_array_equal(pool.gene_counts, fallback.gene_counts)
+    np.testing.assert_allclose(pool.behavior, fallback.behavior, rtol=1e-6)
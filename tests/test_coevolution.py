@@ -0,0 +1,78 @@
+"""Tests du système de coévolution (matrice des traits et noyaux)."""
+
+import copy
+import pickle
+import random
+
+import pytest
+
+import coevolution as co
+
+
+def _coupled_traits(system, value):
+    traits = {}
+    for relationship in system.relationships.values():
+        traits.setdefault(relationship.species_a_id, {}).update(
+            dict.fromkeys(relationship._coupled_traits, value))
+        traits.setdefault(relationship.species_b_id, {}).update(
+            dict.fromkeys(relationship._partner_traits, value))
+    return traits
+
+
+def test_fitness_effects_follow_traits_modified_in_place():
+    system = co.CoevolutionSystem()
+    system.add_relationship(co.create_predator_prey_relationship("wolf", "deer"))
+    all_species_traits = _coupled_traits(system, 0.5)
+    system.calculate_all_fitness_effects(all_species_traits)
+    
+    for trait in all_species_traits["wolf"]:
+        all_species_traits["wolf"][trait] = 0.9
+    effects = system.calculate_all_fitness_effects(all_species_traits)
+    
+    expected = system.calculate_fitness_effects("wolf", all_species_traits["wolf"], all_species_traits)
+    assert effects["wolf"] == pytest.approx(expected, rel=1e-5)
+
+
+def _system():
+    system = co.create_coevolution_system()
+    system.add_relationship(co.create_predator_prey_relationship("wolf", "deer"))
+    system.add_relationship(co.create_competitive_relationship("wolf", "fox"))
+    return system
+
+
+def test_batch_fitness_matches_per_species():
+    system = _system()
+    rng = random.Random(6)
+    # Traits tirés au hasard ; sans le tigre, la relation du lion n'est pas comptée
+    all_species_traits = {
+        species_id: {trait: rng.random() for trait in sorted(traits) if rng.random() < 0.8}
+        for species_id, traits in _coupled_traits(system, 0.0).items() if species_id != "tiger"
+    }
+    
+    effects = system.calculate_all_fitness_effects(all_species_traits)
+    assert any(effects.values())
+    for species_id, traits in all_species_traits.items():
+        expected = system.calculate_fitness_effects(species_id, traits, all_species_traits)
+        assert effects[species_id] == pytest.approx(expected, rel=1e-5, abs=1e-6)
+
+
+def test_trait_columns_are_per_system():
+    first = co.CoevolutionSystem()
+    first.add_relationship(co.create_predator_prey_relationship("wolf", "deer"))
+    second = co.CoevolutionSystem()
+    second.add_relationship(co.create_plant_pollinator_relationship("flower", "bee"))
+    
+    relationship = next(iter(second.relationships.values()))
+    assert set(second._trait_names) == set(relationship._coupled_traits) | set(relationship._partner_traits)
+
+
+@pytest.mark.parametrize("round_trip", [lambda value: pickle.loads(pickle.dumps(value)), copy.deepcopy])
+def test_system_survives_pickle_and_deepcopy(round_trip):
+    system = _system()
+    all_species_traits = _coupled_traits(system, 0.7)
+    expected = system.calculate_all_fitness_effects(all_species_traits)
+    
+    restored = round_trip(system)
+    assert restored.calculate_all_fitness_effects(all_species_traits) == expected
+    for rel_id, relationship in system.relationships.items():
+        assert restored.relationships[rel_id].trait_couplings == relationship.trait_couplings
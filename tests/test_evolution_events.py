@@ -0,0 +1,178 @@
+"""Tests des événements et pressions évolutifs (noyaux et caches)."""
+
+import copy
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+import evolution_events as ev
+
+
+def _genome(*chromosomes):
+    return type("Genome", (), {"chromosomes": [type("Chromosome", (), {"genes": genes})() for genes in chromosomes]})()
+
+
+def _gene(value):
+    return type("Gene", (), {"value": value})()
+
+
+def test_genes_with_equal_hashes_stay_distinct():
+    class GeneId(str):
+        def __hash__(self):
+            return 0
+    
+    assert ev.calculate_genetic_distance(_genome({GeneId("a"): _gene(0.5)}), _genome({GeneId("b"): _gene(0.5)})) == 1.0
+
+
+def test_genetic_distance_kernel_matches_numpy():
+    rng = random.Random(4)
+    for _ in range(50):
+        gene_index = {}
+        (ids1, values1), (ids2, values2) = [
+            ev._gene_arrays(_genome({f"g{rng.randint(0, 40)}": _gene(rng.random())
+                                     for _ in range(rng.randint(0, 30))}).chromosomes[0], gene_index)
+            for _ in range(2)
+        ]
+        
+        assert (tuple(ev._genetic_distance_kernel(ids1, values1, ids2, values2, 0.2))
+                == ev._compare_gene_arrays(ids1, values1, ids2, values2, 0.2))
+
+
+class _Phenotype:
+    def __init__(self, speed, size, strength):
+        self.speed = speed
+        self.size = size
+        self.strength = strength
+
+
+class _Organism:
+    def __init__(self, *traits):
+        self.phenotype = _Phenotype(*traits)
+
+
+def _predation_system(intensity, direction):
+    system = ev.EvolutionaryPressureSystem()
+    system.add_pressure(ev.create_predation_pressure(intensity, direction))
+    return system
+
+
+def test_batch_coefficients_match_per_organism():
+    rng = random.Random(7)
+    organisms = [_Organism(rng.random() * 3.0, rng.random(), rng.random() * 12.0) for _ in range(20)]
+    system = _predation_system(0.6, 0.4)
+    system.add_pressure(ev.create_climate_change_pressure(0.5, -0.7), "north", (3, 1))
+    
+    for region_id, year, season in ((None, None, None), ("north", 3, 1), ("north", 4, 1)):
+        np.testing.assert_allclose(
+            system.calculate_selection_coefficients_batch(organisms, region_id, year, season),
+            [system.calculate_selection_coefficient(organism, region_id, year, season) for organism in organisms],
+            rtol=1e-12
+        )
+
+
+def test_active_pressure_cache_does_not_grow_with_time():
+    system = ev.EvolutionaryPressureSystem()
+    system.add_pressure(ev.create_predation_pressure())
+    system.add_pressure(ev.create_disease_pressure(), "swamp")
+    
+    for year in range(500):
+        for season in range(4):
+            for region_id in (None, "plain", "swamp"):
+                system.get_active_pressures(region_id, year, season)
+    
+    assert len(system._active_cache) <= 2
+
+
+def test_pressure_change_after_add_is_applied():
+    organisms = [_Organism(0.9, 0.2, 4.0), _Organism(0.1, 0.5, 0.3)]
+    system = _predation_system(0.3, 0.5)
+    system.calculate_selection_coefficient(organisms[0])
+    system.calculate_selection_coefficients_batch(organisms)
+    
+    pressure = system.pressures["predation"]
+    pressure.intensity = 0.9
+    pressure.direction = -0.2
+    
+    expected = _predation_system(0.9, -0.2)
+    assert (system.calculate_selection_coefficient(organisms[0])
+            == pytest.approx(expected.calculate_selection_coefficient(organisms[0])))
+    np.testing.assert_allclose(system.calculate_selection_coefficients_batch(organisms),
+                               expected.calculate_selection_coefficients_batch(organisms))
+
+
+@pytest.mark.parametrize("round_trip", [lambda value: pickle.loads(pickle.dumps(value)), copy.deepcopy])
+def test_pressure_system_survives_pickle_and_deepcopy(round_trip):
+    organism = _Organism(0.9, 0.2, 4.0)
+    system = _predation_system(0.3, 0.5)
+    coefficient = system.calculate_selection_coefficient(organism)
+    
+    restored = round_trip(system)
+    assert restored.calculate_selection_coefficient(organism) == pytest.approx(coefficient)
+    
+    # Les pressions restaurées invalident toujours le système qui les porte
+    restored.pressures["predation"].intensity = 0.9
+    restored.pressures["predation"].direction = -0.2
+    assert (restored.calculate_selection_coefficient(organism)
+            == pytest.approx(_predation_system(0.9, -0.2).calculate_selection_coefficient(organism)))
+    assert system.calculate_selection_coefficient(organism) == pytest.approx(coefficient)
+
+
+def test_selection_kernel_matches_numpy():
+    rng = np.random.default_rng(1)
+    values = rng.random((50, 4)) * rng.choice([1.0, 10.0], size=(50, 4))
+    columns = np.array([0, 1, 1, 3, 2], dtype=np.intp)
+    weights = rng.uniform(-1.0, 1.0, size=len(columns))
+    
+    out = np.zeros(len(values))
+    ev._selection_kernel(values, columns, weights, out)
+    np.testing.assert_allclose(out, ev._selection_effects(values, columns, weights), rtol=1e-12)
+
+
+def test_non_string_ids_are_accepted():
+    registry = ev.EvolutionaryRegistry()
+    for species_id in (None, 7):
+        event = ev.EvolutionaryEvent("mutation", 12, 3, species_id, ev.EvolutionaryMechanism.MUTATION, "Mutation")
+        assert event.species_id == species_id
+        registry.add_event(event)
+        registry.register_species(species_id, {"name": "inconnue"})
+        assert registry.get_events_by_species(species_id) == [event]
+        assert registry.get_species_data(species_id) == {"name": "inconnue"}
+
+
+def test_selection_function_matches_numpy():
+    rng = np.random.default_rng(2)
+    traits = ("speed", "size", "strength")
+    values = rng.random((10, 3)) * 5.0
+    columns = np.array([2, 0, 1, 0], dtype=np.intp)
+    weights = rng.uniform(-1.0, 1.0, size=len(columns))
+    
+    coefficient = ev._selection_function(traits, columns, weights)
+    np.testing.assert_allclose([coefficient(_Phenotype(*row)) for row in values.tolist()],
+                               ev._selection_effects(values, columns, weights), rtol=1e-12)
+
+
+def test_selection_plans_are_shared_across_time():
+    system = _predation_system(0.7, 0.5)
+    system.add_pressure(ev.create_disease_pressure(), "swamp")
+    organism = _Organism(0.4, 0.6, 0.8)
+    
+    for year in range(500):
+        for season in range(4):
+            for region_id in (None, "plain", "swamp"):
+                system.calculate_selection_coefficient(organism, region_id, year, season)
+    
+    assert len(system._plan_cache) == 1
+
+
+def test_trait_stats_kernel_matches_numpy():
+    rng = np.random.default_rng(3)
+    prev_values = rng.random((30, 6)) * 10.0
+    curr_values = rng.random((25, 5)) * 10.0
+    prev_ids = np.array([0, 2, 3, 5], dtype=np.intp)
+    curr_ids = np.array([4, 0, 1, 2], dtype=np.intp)
+    
+    expected = ev._trait_stats(prev_values, curr_values, prev_ids, curr_ids)
+    for result, reference in zip(ev._trait_stats_kernel(prev_values, curr_values, prev_ids, curr_ids), expected):
+        np.testing.assert_allclose(result, reference, rtol=1e-9)